@@ -0,0 +1,23 @@
+# Copyright cf-units contributors
+#
+# This file is part of cf-units and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Benchmark tests for cf-units, run with airspeed velocity (asv).
+
+See ``benchmarks/README.md`` for how to run them.
+
+"""
+
+#: Unit strings of increasing complexity, keyed by a short description.
+UNITS = {
+    "simple": "m",
+    "prefixed": "km",
+    "compound": "kg m-2 s-1",
+    "offset": "degC",
+    "shifted": "K @ 273.15",
+    "logarithmic": "lg(re 1 mW)",
+    "time_reference": "hours since 1970-01-01 00:00:00",
+}
+
+#: Array sizes for the benchmarks of array operations.
+SIZES = [1, 1_000, 1_000_000]
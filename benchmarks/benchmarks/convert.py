@@ -0,0 +1,103 @@
+# Copyright cf-units contributors
+#
+# This file is part of cf-units and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Benchmarks for the conversion of values between units."""
+
+import numpy as np
+
+from cf_units import FLOAT32, FLOAT64, Unit
+
+from . import SIZES
+
+
+def _values(size, dtype, layout):
+    # Values with the given memory layout. Strided values are a view of
+    # every other element, so are not contiguous.
+    data = np.arange(size * 2, dtype=dtype)
+    if layout == "strided":
+        result = data[::2]
+    elif layout == "masked":
+        result = np.ma.masked_array(data[:size], mask=data[:size] % 3 == 0)
+    else:
+        result = data[:size]
+    return result
+
+
+class Convert:
+    params = [
+        SIZES,
+        ["float32", "float64", "int64"],
+        ["contiguous", "strided", "masked"],
+    ]
+    param_names = ["size", "dtype", "layout"]
+
+    def setup(self, size, dtype, layout):
+        self.values = _values(size, dtype, layout)
+        # An offset conversion, so that repeated in-place conversions
+        # don't overflow.
+        self.from_unit = Unit("degC")
+        self.to_unit = Unit("K")
+
+    def time_convert(self, size, dtype, layout):
+        self.from_unit.convert(self.values, self.to_unit)
+
+    def time_convert_inplace(self, size, dtype, layout):
+        self.from_unit.convert(self.values, self.to_unit, inplace=True)
+
+    def peakmem_convert(self, size, dtype, layout):
+        self.from_unit.convert(self.values, self.to_unit)
+
+
+class ConvertUnits:
+    params = [
+        [
+            ("m", "km"),
+            ("degC", "degF"),
+            ("kg m-2 s-1", "g cm-2 h-1"),
+            ("days since 1970-01-01", "hours since 2000-01-01"),
+        ]
+    ]
+    param_names = ["units"]
+
+    def setup(self, units):
+        self.from_unit, self.to_unit = (Unit(unit) for unit in units)
+        self.values = np.arange(1_000, dtype=np.float64)
+
+    def time_convert_array(self, units):
+        self.from_unit.convert(self.values, self.to_unit)
+
+    def time_convert_scalar(self, units):
+        self.from_unit.convert(1.5, self.to_unit)
+
+    def time_convert_unit_string(self, units):
+        self.from_unit.convert(1.5, units[1])
+
+
+class ConvertScalar:
+    params = [["float32", "float64"]]
+    param_names = ["ctype"]
+
+    def setup(self, ctype):
+        self.ctype = {"float32": FLOAT32, "float64": FLOAT64}[ctype]
+        self.from_unit = Unit("degC")
+        self.to_unit = Unit("degF")
+
+    def time_convert(self, ctype):
+        self.from_unit.convert(1.5, self.to_unit, ctype=self.ctype)
+
+
+class ConvertCalendar:
+    params = [SIZES, ["standard", "360_day", "365_day"]]
+    param_names = ["size", "calendar"]
+
+    def setup(self, size, calendar):
+        self.from_unit = Unit("days since 1970-01-01", calendar=calendar)
+        self.to_unit = Unit("hours since 2000-01-01", calendar=calendar)
+        self.values = np.arange(size, dtype=np.float64)
+
+    def time_convert(self, size, calendar):
+        self.from_unit.convert(self.values, self.to_unit)
+
+    def peakmem_convert(self, size, calendar):
+        self.from_unit.convert(self.values, self.to_unit)
@@ -0,0 +1,83 @@
+# Copyright cf-units contributors
+#
+# This file is part of cf-units and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Benchmarks for the conversion between time values and dates."""
+
+import numpy as np
+
+import cf_units
+from cf_units import Unit
+
+CALENDARS = ["standard", "proleptic_gregorian", "julian", "365_day", "360_day"]
+
+SIZES = [1, 1_000, 100_000]
+
+UNIT = "hours since 1970-01-01 00:00:00"
+
+
+def _values(size, layout):
+    # Six-hourly time values.
+    values = np.arange(size, dtype=np.float64) * 6
+    if layout == "masked":
+        values = np.ma.masked_array(values, mask=np.arange(size) % 7 == 0)
+    return values
+
+
+class Num2Date:
+    params = [SIZES, CALENDARS, ["plain", "masked"]]
+    param_names = ["size", "calendar", "layout"]
+
+    def setup(self, size, calendar, layout):
+        self.unit = Unit(UNIT, calendar=calendar)
+        self.values = _values(size, layout)
+
+    def time_num2date(self, size, calendar, layout):
+        self.unit.num2date(self.values)
+
+    def time_num2date_module(self, size, calendar, layout):
+        cf_units.num2date(self.values, UNIT, calendar)
+
+    def peakmem_num2date(self, size, calendar, layout):
+        self.unit.num2date(self.values)
+
+
+class Num2PyDate:
+    params = [SIZES]
+    param_names = ["size"]
+
+    def setup(self, size):
+        self.unit = Unit(UNIT)
+        self.values = _values(size, "plain")
+
+    def time_num2pydate(self, size):
+        self.unit.num2pydate(self.values)
+
+    def time_num2pydate_module(self, size):
+        cf_units.num2pydate(self.values, UNIT, "standard")
+
+
+class Date2Num:
+    params = [SIZES, CALENDARS]
+    param_names = ["size", "calendar"]
+
+    def setup(self, size, calendar):
+        self.unit = Unit(UNIT, calendar=calendar)
+        self.dates = self.unit.num2date(_values(size, "plain"))
+
+    def time_date2num(self, size, calendar):
+        self.unit.date2num(self.dates)
+
+    def time_date2num_module(self, size, calendar):
+        cf_units.date2num(self.dates, UNIT, calendar)
+
+    def peakmem_date2num(self, size, calendar):
+        self.unit.date2num(self.dates)
+
+
+class EncodeDecode:
+    def time_encode_time(self):
+        cf_units.encode_time(2000, 1, 2, 3, 4, 5.0)
+
+    def time_decode_time(self):
+        cf_units.decode_time(1.0e8)
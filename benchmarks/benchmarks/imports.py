@@ -0,0 +1,20 @@
+# Copyright cf-units contributors
+#
+# This file is part of cf-units and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Benchmarks for the time taken to import cf-units."""
+
+
+class Import:
+    # Each timing runs in a new interpreter, so few repeats are needed.
+    number = 1
+    repeat = (3, 10, 20.0)
+
+    def timeraw_import_cf_units(self):
+        return "import cf_units"
+
+    def timeraw_import_tex(self):
+        return "import cf_units.tex"
+
+    def timeraw_first_unit(self):
+        return "from cf_units import Unit\nUnit('kg m-2 s-1')"
@@ -0,0 +1,80 @@
+# Copyright cf-units contributors
+#
+# This file is part of cf-units and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Benchmarks for the parsing and TeX formatting of unit strings."""
+
+from cf_units._udunits2_parser import normalize
+from cf_units.tex import tex
+
+from . import UNITS
+
+# The parser backends and the batch functions are not in older versions of
+# cf-units, for which asv skips the benchmarks which need them. The only
+# parser of older versions is the ANTLR one.
+try:
+    from cf_units._udunits2_parser import BACKENDS
+except ImportError:
+    BACKENDS = None
+
+try:
+    from cf_units._udunits2_parser import normalize_many
+    from cf_units.tex import tex_many
+except ImportError:
+    normalize_many = tex_many = None
+
+#: Unit strings of the grammar, which does not include logarithmic units.
+GRAMMAR_UNITS = {
+    **{name: unit_str for name, unit_str in UNITS.items() if name != "logarithmic"},
+    "packed_time_reference": "s since 19900101T190030 +2",
+    "unicode": "kg·m⁻²·s⁻¹",
+}
+
+
+class Parse:
+    params = [list(GRAMMAR_UNITS), ["descent", "antlr"]]
+    param_names = ["unit", "backend"]
+
+    def setup(self, name, backend):
+        if backend not in (BACKENDS or ["antlr"]):
+            raise NotImplementedError
+        self.unit_str = GRAMMAR_UNITS[name]
+        self.kwargs = {} if BACKENDS is None else {"backend": backend}
+
+    def time_normalize(self, name, backend):
+        normalize(self.unit_str, **self.kwargs)
+
+
+class TeX:
+    params = [list(GRAMMAR_UNITS)]
+    param_names = ["unit"]
+
+    def setup(self, name):
+        self.unit_str = GRAMMAR_UNITS[name]
+
+    def time_tex(self, name):
+        tex(self.unit_str)
+
+
+class Many:
+    params = [[100, 10_000], [1, 10]]
+    param_names = ["count", "repeats"]
+
+    def setup(self, count, repeats):
+        if normalize_many is None:
+            raise NotImplementedError
+        # Scaled unit strings, each of which is repeated "repeats" times.
+        unit_strs = list(GRAMMAR_UNITS.values())
+        self.unit_strs = [
+            f"{i // (repeats * len(unit_strs)) + 1} {unit_strs[i % len(unit_strs)]}"
+            for i in range(count)
+        ]
+
+    def time_normalize_many(self, count, repeats):
+        normalize_many(self.unit_strs)
+
+    def time_tex_many(self, count, repeats):
+        tex_many(self.unit_strs)
+
+    def peakmem_tex_many(self, count, repeats):
+        tex_many(self.unit_strs)
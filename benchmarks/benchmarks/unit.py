@@ -0,0 +1,70 @@
+# Copyright cf-units contributors
+#
+# This file is part of cf-units and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Benchmarks for the construction and manipulation of units."""
+
+import cf_units
+from cf_units import Unit
+
+from . import UNITS
+
+
+class Construction:
+    params = [list(UNITS)]
+    param_names = ["unit"]
+
+    def setup(self, name):
+        self.unit_str = UNITS[name]
+        self.unit = Unit(self.unit_str)
+
+    def time_init(self, name):
+        Unit(self.unit_str)
+
+    def time_init_calendar(self, name):
+        Unit(self.unit_str, calendar="360_day")
+
+    def time_as_unit(self, name):
+        cf_units.as_unit(self.unit_str)
+
+    def time_format(self, name):
+        self.unit.format()
+
+    def time_str(self, name):
+        str(self.unit)
+
+    def time_repr(self, name):
+        repr(self.unit)
+
+    def time_hash(self, name):
+        hash(self.unit)
+
+    def time_equal(self, name):
+        self.unit == self.unit_str  # noqa: B015
+
+
+class Operations:
+    params = [["simple", "prefixed", "compound", "offset"]]
+    param_names = ["unit"]
+
+    def setup(self, name):
+        self.unit = Unit(UNITS[name])
+        self.other = Unit("s")
+
+    def time_multiply(self, name):
+        self.unit * self.other
+
+    def time_divide(self, name):
+        self.unit / self.other
+
+    def time_power(self, name):
+        self.unit**2
+
+    def time_is_convertible(self, name):
+        self.unit.is_convertible(self.other)
+
+    def time_is_time(self, name):
+        self.unit.is_time()
+
+    def time_is_vertical(self, name):
+        self.unit.is_vertical()
@@ -0,0 +1,179 @@
+# Copyright cf-units contributors
+#
+# This file is part of cf-units and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Measure the import time and first-call latency of cf-units.
+
+Each measurement is made in a new interpreter, so it includes the cost of
+importing cf-units, loading the UDUNITS-2 unit database and making the
+first calls, as paid by every short-lived process that uses cf-units.
+
+The import time is broken down by phase using ``python -X importtime``,
+and the first calls of ``Unit``, ``Unit.convert`` and ``tex`` are timed
+individually. The medians of several runs are reported.
+
+For example::
+
+    python benchmarks/cold_start.py --save baseline.json
+    # ... make changes ...
+    python benchmarks/cold_start.py --compare baseline.json
+
+The comparison exits with status 1 if any phase has become slower than
+the baseline by more than the threshold.
+
+"""
+
+import argparse
+import json
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+
+#: The import phases, keyed by module name prefix. The "self" import time
+#: of each module is attributed to the phase of its longest matching prefix.
+#: The "self" time of cf_units includes loading the UDUNITS-2 unit database.
+IMPORT_PHASES = {
+    "numpy": "import numpy",
+    "cftime": "import cftime",
+    "cf_units": "import cf_units",
+    "cf_units._udunits2": "import _udunits2",
+    "cf_units.config": "import config",
+    "cf_units._udunits2_parser": "import parser",
+    "cf_units.tex": "import tex",
+}
+
+#: The phase of imports not matching any of the IMPORT_PHASES.
+OTHER_PHASE = "import other"
+
+# Times the first calls of a new interpreter, in seconds.
+FIRST_CALLS = """
+import json
+import time
+
+start = time.perf_counter()
+import cf_units
+imported = time.perf_counter()
+unit = cf_units.Unit("m")
+created = time.perf_counter()
+unit.convert(1.5, "km")
+converted = time.perf_counter()
+from cf_units.tex import tex
+tex("kg m-2 s-1")
+texed = time.perf_counter()
+cf_units._read_xml()
+loaded = time.perf_counter()
+
+print(json.dumps({
+    "total import": imported - start,
+    "first Unit": created - imported,
+    "first convert": converted - created,
+    "first tex": texed - converted,
+    "read_xml": loaded - texed,
+}))
+"""
+
+
+def _run(args):
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, check=True
+    )
+
+
+def _phase(module):
+    match = max(
+        (prefix for prefix in IMPORT_PHASES if f"{module}.".startswith(f"{prefix}.")),
+        key=len,
+        default=None,
+    )
+    return IMPORT_PHASES[match] if match else OTHER_PHASE
+
+
+def measure_imports():
+    """Return the import time of each phase of ``import cf_units.tex``."""
+    stderr = _run(["-X", "importtime", "-c", "import cf_units.tex"]).stderr
+    result = dict.fromkeys([*IMPORT_PHASES.values(), OTHER_PHASE], 0.0)
+    for line in stderr.splitlines():
+        # For example, "import time:  1069 |  1069 |     cf_units._udunits2".
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        result[_phase(fields[2].strip())] += int(fields[0]) * 1e-6
+    return result
+
+
+def measure_first_calls():
+    """Return the time taken by each of the first calls of cf-units."""
+    return json.loads(_run(["-c", FIRST_CALLS]).stdout)
+
+
+def measure(repeats):
+    """Return the median time of each phase, in seconds, over several runs."""
+    runs = [{**measure_imports(), **measure_first_calls()} for _ in range(repeats)]
+    return {phase: statistics.median(run[phase] for run in runs) for phase in runs[0]}
+
+
+def compare(timings, baseline, threshold, min_delta):
+    """Return the phases that are slower than the baseline.
+
+    A phase regresses if it is slower than the baseline by more than a
+    factor of ``threshold`` and by more than ``min_delta`` seconds. The
+    latter prevents the noise of the shortest phases failing a comparison.
+
+    """
+    return [
+        phase
+        for phase, seconds in timings.items()
+        if phase in baseline
+        and seconds > baseline[phase] * threshold
+        and seconds - baseline[phase] > min_delta
+    ]
+
+
+def report(timings, baseline=None, regressions=()):
+    for phase, seconds in timings.items():
+        line = f"{phase:>20}: {seconds * 1e3:8.2f} ms"
+        if baseline is not None and phase in baseline:
+            line += f"  (baseline {baseline[phase] * 1e3:8.2f} ms)"
+            if phase in regressions:
+                line += "  REGRESSION"
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--repeats", type=int, default=5, help="The number of runs (default 5)."
+    )
+    parser.add_argument("--save", type=Path, help="Save the timings as JSON.")
+    parser.add_argument(
+        "--compare", type=Path, help="Compare with timings saved by --save."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="The slowdown factor of a regression (default 1.2).",
+    )
+    parser.add_argument(
+        "--min-delta",
+        type=float,
+        default=0.005,
+        help="The smallest slowdown of a regression, in seconds (default 0.005).",
+    )
+    args = parser.parse_args(argv)
+
+    timings = measure(args.repeats)
+    baseline = None
+    regressions = []
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text())
+        regressions = compare(timings, baseline, args.threshold, args.min_delta)
+    report(timings, baseline, regressions)
+    if args.save is not None:
+        args.save.write_text(json.dumps(timings, indent=2))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
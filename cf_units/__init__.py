@@ -14,10 +14,15 @@ See also: `UDUNITS-2
 
 from contextlib import contextmanager
 import copy
+import datetime
 import locale
 import math
+import os
+import re
 import threading
+import uuid
 from warnings import warn
+import weakref
 
 import cftime
 import numpy as np
@@ -32,9 +37,9 @@ from cf_units._udunits2 import (
     UT_UTF8,
 )
 
-from . import config
+from . import _stats, _time, config
 from ._version import version as __version__  # noqa: F401
-from .util import _OrderedHashable
+from .util import _LRUCache, _OrderedHashable
 
 __all__ = [
     "CALENDARS",
@@ -50,19 +55,31 @@ __all__ = [
     "CALENDAR_STANDARD",
     "FLOAT32",
     "FLOAT64",
+    "INT64",
     "UT_ASCII",
     "UT_DEFINITION",
     "UT_NAMES",
     "Unit",
+    "UnitSystem",
+    "add_hook",
     "date2num",
     "decode_time",
+    "decode_times",
+    "enable_date_cache",
+    "enable_stats",
     "encode_clock",
+    "encode_clocks",
     "encode_date",
+    "encode_dates",
     "encode_time",
+    "encode_times",
     "is_time",
     "is_vertical",
     "num2date",
     "num2pydate",
+    "parse_many",
+    "remove_hook",
+    "stats",
     "suppress_errors",
 ]
 
@@ -144,6 +161,15 @@ CALENDAR_ALIASES = {
 FLOAT32 = np.float32
 FLOAT64 = np.float64
 
+#
+# integer types
+#
+INT64 = np.int64
+_MIN_INT32 = np.iinfo(np.int32).min
+_MAX_INT32 = np.iinfo(np.int32).max
+_MIN_INT64 = np.iinfo(INT64).min
+_MAX_INT64 = np.iinfo(INT64).max
+
 ########################################################################
 #
 # module level statements
@@ -154,6 +180,25 @@ FLOAT64 = np.float64
 _cv_convert_scalar = {FLOAT32: _ud.convert_float, FLOAT64: _ud.convert_double}
 _cv_convert_array = {FLOAT32: _ud.convert_floats, FLOAT64: _ud.convert_doubles}
 
+# The names of the stats counters of the Unit convert method.
+_cv_convert_stats = {
+    FLOAT32: "convert.udunits.float32",
+    FLOAT64: "convert.udunits.float64",
+}
+
+# The fields of the date/clock times decoded by decode_times.
+_DECODED_TIME = np.dtype(
+    [
+        ("year", np.int32),
+        ("month", np.int32),
+        ("day", np.int32),
+        ("hour", np.int32),
+        ("minute", np.int32),
+        ("second", np.float64),
+        ("resolution", np.float64),
+    ]
+)
+
 # Map of ut_encodings to encoding strings
 _encoding_lookup = {
     UT_ASCII: "ascii",
@@ -163,51 +208,256 @@ _encoding_lookup = {
 }
 
 
+# Serialises the calls into UDUNITS-2 that use its process-wide state: the
+# unit parser, the formatter, and the status set by every call which may
+# fail, which is read back to report the failure. Applying a converter, and
+# comparing units, neither use shared state nor fail, so need no lock.
+_UT_LOCK = threading.RLock()
+
+# Guards the process-wide UDUNITS-2 error message handler, which may be
+# suppressed by several threads at once.
+_ERROR_HANDLER_LOCK = threading.Lock()
+_error_handler_state = {"depth": 0, "handler": None}
+
+
 @contextmanager
 def suppress_errors():
-    """Suppresses all error messages from UDUNITS-2."""
-    _default_handler = _ud.set_error_message_handler(_ud.ignore)
+    """Suppresses all error messages from UDUNITS-2.
+
+    The error message handler is shared by the whole process, so messages
+    are suppressed for as long as any thread is within this context.
+
+    """
+    with _ERROR_HANDLER_LOCK:
+        if _error_handler_state["depth"] == 0:
+            _error_handler_state["handler"] = _ud.set_error_message_handler(_ud.ignore)
+        _error_handler_state["depth"] += 1
     try:
         yield
     finally:
-        _ud.set_error_message_handler(_default_handler)
+        with _ERROR_HANDLER_LOCK:
+            _error_handler_state["depth"] -= 1
+            if _error_handler_state["depth"] == 0:
+                _ud.set_error_message_handler(_error_handler_state["handler"])
+                _error_handler_state["handler"] = None
 
 
-LOCALE_LOCK = threading.Lock()
+LOCALE_LOCK = threading.RLock()
 
 
 @contextmanager
 def c_locale():
+    """Use the "C" numeric locale, as needed by the UDUNITS-2 XML reader.
+
+    The locale is shared by the whole process, so is only changed, under
+    :data:`LOCALE_LOCK`, when the numeric locale is not already "C".
+
+    """
     with LOCALE_LOCK:
-        lc_numeric = locale.getlocale(locale.LC_NUMERIC)
-        locale.setlocale(locale.LC_NUMERIC, "C")
-        try:
-            yield
-        finally:
-            locale.setlocale(locale.LC_NUMERIC, lc_numeric)
+        # Only a thread holding the lock changes the locale within
+        # cf-units, so if it is "C" now it remains so for cf-units' own
+        # callers, and the lock need not be held. Code outside cf-units
+        # which calls setlocale is not serialised by this lock.
+        if locale.setlocale(locale.LC_NUMERIC) != "C":
+            lc_numeric = locale.getlocale(locale.LC_NUMERIC)
+            locale.setlocale(locale.LC_NUMERIC, "C")
+            try:
+                yield
+            finally:
+                locale.setlocale(locale.LC_NUMERIC, lc_numeric)
+            return
+    yield
 
 
-#
-# load the UDUNITS-2 xml-formatted unit-database
-#:
-# Ignore standard noisy UDUNITS-2 start-up.
-with suppress_errors(), c_locale():
-    # Load the unit-database from the default location (modified via
-    # the UDUNITS2_XML_PATH environment variable) and if that fails look
-    # relative to sys.prefix to support environments such as conda.
-    try:
-        _ud_system = _ud.read_xml()
-    except _ud.UdunitsError:
+def _read_xml(xml_path=None):
+    # Load a UDUNITS-2 xml-formatted unit-database.
+    # Ignore standard noisy UDUNITS-2 start-up.
+    with suppress_errors(), c_locale():
         try:
-            _ud_system = _ud.read_xml(config.get_xml_path())
+            if xml_path is None:
+                # Load the unit-database from the default location (modified
+                # via the UDUNITS2_XML_PATH environment variable) and if that
+                # fails look relative to sys.prefix to support environments
+                # such as conda.
+                try:
+                    with _UT_LOCK:
+                        return _ud.read_xml()
+                except _ud.UdunitsError:
+                    with _UT_LOCK:
+                        return _ud.read_xml(config.get_xml_path())
+            with _UT_LOCK:
+                return _ud.read_xml(os.fsencode(xml_path))
         except _ud.UdunitsError as e:
-            error_msg = f': "{e.error_msg():s}"' if e.errnum else ""
+            error_msg = f': "{os.fsdecode(e.error_msg())}"' if e.errnum else ""
             raise OSError(
                 f"[{e.status_msg()}] "
                 f"Failed to open UDUNITS-2 XML unit database{error_msg}"
             )
 
 
+# The live unit systems, keyed by their identity.
+_SYSTEMS = weakref.WeakValueDictionary()
+
+# The maximum number of items of each cache of a unit system.
+_SYSTEM_CACHE_SIZE = 4096
+
+
+class UnitSystem:
+    """A system of units, as defined by a UDUNITS-2 XML unit database.
+
+    Each unit system keeps its own caches of parsed units and of unit
+    converters, so that several unit databases may be used side by side.
+    A :class:`Unit` belongs to a single unit system, and may only be
+    compared with or converted to units of the same system.
+
+    Args:
+
+    * xml_path (string):
+        The path of the XML unit database. The default is the UDUNITS-2
+        unit database, as used by the default unit system.
+
+    For example:
+
+        >>> from cf_units import Unit, UnitSystem
+        >>> system = UnitSystem()
+        >>> km = Unit('km', system=system)
+        >>> km.system is system
+        True
+        >>> km.convert(1.5, 'm')
+        1500.0
+
+    """
+
+    def __init__(self, xml_path=None):
+        self.xml_path = xml_path
+        self._ut_system = _read_xml(xml_path)
+        # The identity of the system, by which unpickling in the process
+        # which created it returns this system.
+        self._key = uuid.uuid4().hex
+        _SYSTEMS[self._key] = self
+        # Parsed UDUNITS-2 units, keyed by unit string.
+        self._parsed = _LRUCache(_SYSTEM_CACHE_SIZE)
+        # Units of this system, keyed by unit string, for as_unit.
+        self._units = _LRUCache(_SYSTEM_CACHE_SIZE)
+        # UDUNITS-2 converters, keyed by the origins of their units.
+        self._converters = _LRUCache(_SYSTEM_CACHE_SIZE)
+        # Whether each base unit symbol is dimensionless, and the
+        # dimensions of each unit string, for Unit.dimensions.
+        self._dimensionless = {}
+        self._dimensions = _LRUCache(_SYSTEM_CACHE_SIZE)
+        # Time reference units, keyed by the unit string and calendar, for
+        # the module-level date functions.
+        self._time_units = _LRUCache(_SYSTEM_CACHE_SIZE)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(xml_path={self.xml_path!r})"
+
+    def __reduce__(self):
+        if self is _default_system:
+            return _unpickle_system, (None,)
+        return _unpickle_system, (self.xml_path, self._key)
+
+    def as_unit(self, unit):
+        """Returns a Unit of this system corresponding to the given unit.
+
+        .. note::
+
+            If the given unit is already a Unit it will be returned unchanged.
+
+        """
+        if isinstance(unit, Unit):
+            result = unit
+        else:
+            result = None
+            use_cache = isinstance(unit, str) or unit is None
+            if use_cache:
+                result = self._units.get(unit)
+                _stats.count("as_unit.miss" if result is None else "as_unit.hit")
+            if result is None:
+                # Typically unit is a string, however we cater for other
+                # types of 'unit' (e.g. iris.unit.Unit).
+                result = Unit(
+                    unit, calendar=getattr(unit, "calendar", None), system=self
+                )
+                if use_cache:
+                    self._units[unit] = result
+        return result
+
+    def _parse(self, unit):
+        # Return the UDUNITS-2 unit of the given unit string.
+        ut_unit = self._parsed.get(unit)
+        if ut_unit is None:
+            with _stats.timed("udunits.parse"), _UT_LOCK:
+                ut_unit = _ud.parse(self._ut_system, unit.encode("utf8"), UT_UTF8)
+            self._parsed[unit] = ut_unit
+        return ut_unit
+
+    def _time_unit(self, unit, calendar):
+        # Return the time reference unit of the unit string and calendar
+        # given to num2date or date2num. This is cached, as these are called
+        # repeatedly with the same few unit strings, e.g. for each file.
+        key = (unit, calendar)
+        result = self._time_units.get(key)
+        if result is None:
+            #
+            # ensure to strip out any 'UTC' postfix which is generated by
+            # UDUNITS-2 formatted output and causes the cftime parser
+            # to choke
+            #
+            unit_string = unit.rstrip(" UTC")
+            if unit_string.endswith(" since epoch"):
+                unit_string = unit_string.replace("epoch", EPOCH)
+            result = Unit(unit_string, calendar=calendar, system=self)
+            self._time_units[key] = result
+        return result
+
+    def _is_dimensionless(self, symbol):
+        # Return whether the named base unit is dimensionless, e.g. radian.
+        result = self._dimensionless.get(symbol)
+        if result is None:
+            ut_unit = self._parse(symbol)
+            with _UT_LOCK:
+                result = self._dimensionless[symbol] = _ud.is_dimensionless(ut_unit)
+        return result
+
+    def _get_converter(self, from_unit, to_unit):
+        # Return the UDUNITS-2 converter between two units of this system.
+        # Units derived by operations have no origin, so are not cached.
+        key = (from_unit.origin, to_unit.origin)
+        cacheable = None not in key
+        ut_converter = self._converters.get(key) if cacheable else None
+        if ut_converter is None:
+            with _stats.timed("udunits.converter"), _UT_LOCK:
+                ut_converter = _ud.get_converter(from_unit.ut_unit, to_unit.ut_unit)
+            if cacheable:
+                self._converters[key] = ut_converter
+        return ut_converter
+
+
+_default_system = UnitSystem()
+_ud_system = _default_system._ut_system
+
+
+_UNPICKLE_SYSTEM_LOCK = threading.Lock()
+
+
+def _unpickle_system(xml_path, key=None):
+    # Reconstruct a pickled UnitSystem. A system which is alive in this
+    # process is returned as itself. Otherwise its database is loaded once,
+    # and the new system takes on the identity of the pickled system, so
+    # that later unpickling of it in this process returns the same system.
+    if key is None:
+        return _default_system
+    with _UNPICKLE_SYSTEM_LOCK:
+        result = _SYSTEMS.get(key)
+        if result is None:
+            result = UnitSystem(xml_path)
+            del _SYSTEMS[result._key]
+            result._key = key
+            _SYSTEMS[key] = result
+    return result
+
+
 ########################################################################
 #
 # module level function definitions
@@ -335,6 +585,182 @@ def decode_time(time):
     return _ud.decode_time(time)
 
 
+def _as_ints(values):
+    # Return integer values as an array of C ints.
+    values = np.asarray(values)
+    if values.size == 0:
+        # An empty sequence is float64 to numpy, but has no values to check.
+        return values.astype(np.int32)
+    if values.dtype.kind not in "iu":
+        raise TypeError(f"Expected integer values, got {values.dtype}.")
+    if values.min() < _MIN_INT32 or values.max() > _MAX_INT32:
+        raise OverflowError("Values outside range of 32 bit signed integers.")
+    return values.astype(np.int32, copy=False)
+
+
+def _loop(function, inputs, outputs):
+    # Apply a loop of UDUNITS-2 over the input arrays, broadcast together,
+    # into the output arrays. The loop is given one-dimensional views of
+    # the arrays, without copying them, so broadcast inputs are read with a
+    # stride of zero. There is one view per array for most arrays, or one
+    # per row where the arrays cannot be flattened without a copy.
+    op_flags = [["readonly"]] * len(inputs) + [["writeonly"]] * len(outputs)
+    with np.nditer(
+        [*inputs, *outputs],
+        flags=["external_loop", "zerosize_ok"],
+        op_flags=op_flags,
+    ) as iterator:
+        for views in iterator:
+            function(*views)
+
+
+def encode_times(year, month, day, hour, minute, second):
+    """Return arrays of dates/clock times encoded as double precision values.
+
+    As :func:`encode_time`, for arrays of each part of the dates/clock
+    times, which are broadcast together. Each element is encoded by
+    UDUNITS-2 in a single loop, without a call of Python per element.
+
+    Args:
+
+    * year (int/numpy.ndarray):
+        Year values to be encoded.
+    * month (int/numpy.ndarray):
+        Month values to be encoded.
+    * day (int/numpy.ndarray):
+        Day values to be encoded.
+    * hour (int/numpy.ndarray):
+        Hour values to be encoded.
+    * minute (int/numpy.ndarray):
+        Minute values to be encoded.
+    * second (float/numpy.ndarray):
+        Second values to be encoded.
+
+    Returns
+    -------
+        numpy.ndarray of floats.
+
+    For example:
+
+        >>> import cf_units
+        >>> cf_units.encode_times([1970, 2001], 1, 1, 0, 0, [0, 30.5])
+        array([-9.783072e+08,  3.050000e+01])
+
+    """
+    arrays = [
+        _as_ints(year),
+        _as_ints(month),
+        _as_ints(day),
+        _as_ints(hour),
+        _as_ints(minute),
+        np.asarray(second, dtype=np.float64),
+    ]
+    result = np.empty(np.broadcast_shapes(*(a.shape for a in arrays)))
+    _loop(_ud.encode_times, arrays, [result])
+    return result
+
+
+def encode_dates(year, month, day):
+    """Return arrays of dates encoded as double precision values.
+
+    As :func:`encode_date`, for arrays of each part of the dates, which are
+    broadcast together. Each element is encoded by UDUNITS-2 in a single
+    loop, without a call of Python per element.
+
+    Args:
+
+    * year (int/numpy.ndarray):
+        Year values to be encoded.
+    * month (int/numpy.ndarray):
+        Month values to be encoded.
+    * day (int/numpy.ndarray):
+        Day values to be encoded.
+
+    Returns
+    -------
+        numpy.ndarray of floats.
+
+    For example:
+
+        >>> import cf_units
+        >>> cf_units.encode_dates(1970, [1, 2], 1)
+        array([-9.783072e+08, -9.756288e+08])
+
+    """
+    arrays = [_as_ints(year), _as_ints(month), _as_ints(day)]
+    result = np.empty(np.broadcast_shapes(*(a.shape for a in arrays)))
+    _loop(_ud.encode_dates, arrays, [result])
+    return result
+
+
+def encode_clocks(hour, minute, second):
+    """Return arrays of clock times encoded as double precision values.
+
+    As :func:`encode_clock`, for arrays of each part of the clock times,
+    which are broadcast together. Each element is encoded by UDUNITS-2 in
+    a single loop, without a call of Python per element.
+
+    Args:
+
+    * hour (int/numpy.ndarray):
+        Hour values to be encoded.
+    * minute (int/numpy.ndarray):
+        Minute values to be encoded.
+    * second (float/numpy.ndarray):
+        Second values to be encoded.
+
+    Returns
+    -------
+        numpy.ndarray of floats.
+
+    For example:
+
+        >>> import cf_units
+        >>> cf_units.encode_clocks([0, 12], 30, 0)
+        array([ 1800., 45000.])
+
+    """
+    arrays = [_as_ints(hour), _as_ints(minute), np.asarray(second, dtype=np.float64)]
+    result = np.empty(np.broadcast_shapes(*(a.shape for a in arrays)))
+    _loop(_ud.encode_clocks, arrays, [result])
+    return result
+
+
+def decode_times(time):
+    """Decode an array of double precision date/clock time values into their
+    component parts.
+
+    As :func:`decode_time`, for an array of date/clock times. Each element
+    is decoded by UDUNITS-2 in a single loop, without a call of Python per
+    element.
+
+    Args:
+
+    * time (float/numpy.ndarray):
+        Date/clock times encoded as double precision values.
+
+    Returns
+    -------
+        numpy.ndarray of the shape of the times, of a structured dtype with
+        the fields "year", "month", "day", "hour", "minute", "second" and
+        "resolution".
+
+    For example:
+
+        >>> import cf_units
+        >>> times = cf_units.decode_times([0.0, 86400.5])
+        >>> times['day']
+        array([1, 2], dtype=int32)
+        >>> times['second']
+        array([0. , 0.5])
+
+    """
+    time = np.asarray(time, dtype=np.float64)
+    result = np.empty(time.shape, dtype=_DECODED_TIME)
+    _loop(_ud.decode_times, [time], [result[name] for name in _DECODED_TIME.names])
+    return result
+
+
 def date2num(date, unit, calendar):
     """Return numeric time value (resolution of 1 second) encoding of
     datetime object.
@@ -385,16 +811,7 @@ def date2num(date, unit, calendar):
         array([5, 6])
 
     """
-    #
-    # ensure to strip out any 'UTC' postfix which is generated by
-    # UDUNITS-2 formatted output and causes the cftime parser
-    # to choke
-    #
-    unit_string = unit.rstrip(" UTC")
-    if unit_string.endswith(" since epoch"):
-        unit_string = unit_string.replace("epoch", EPOCH)
-    unit_inst = Unit(unit_string, calendar=calendar)
-    return unit_inst.date2num(date)
+    return _default_system._time_unit(unit, calendar).date2num(date)
 
 
 def num2date(
@@ -464,15 +881,7 @@ def num2date(
         ['1970-01-01 06:00:00', '1970-01-01 07:00:00']
 
     """
-    #
-    # ensure to strip out any 'UTC' postfix which is generated by
-    # UDUNITS-2 formatted output and causes the cftime parser
-    # to choke
-    #
-    unit_string = unit.rstrip(" UTC")
-    if unit_string.endswith(" since epoch"):
-        unit_string = unit_string.replace("epoch", EPOCH)
-    unit_inst = Unit(unit_string, calendar=calendar)
+    unit_inst = _default_system._time_unit(unit, calendar)
     return unit_inst.num2date(
         time_value,
         only_use_cftime_datetimes=only_use_cftime_datetimes,
@@ -498,7 +907,138 @@ def num2pydate(time_value, unit, calendar):
     )
 
 
-_CACHE = {}
+def enable_stats(enabled=True):
+    """Enable, or disable, the counting of the work done by cf-units.
+
+    The counts are disabled by default. While enabled, cf-units counts, and
+    times, its parsing and formatting of units, its creation of converters
+    and its conversion of values. See :func:`stats`.
+
+    """
+    _stats.enabled = enabled
+
+
+def stats(reset=False):
+    """Return the counts of the work done by cf-units while counting was
+    enabled by :func:`enable_stats`.
+
+    Args:
+
+    * reset (bool):
+        Whether to reset the counts to zero.
+
+    Returns
+    -------
+        dict mapping each counter name to a dict of its "count", and
+        the total "seconds" spent. The counters are:
+
+        * "udunits.parse", "udunits.format" and "udunits.converter":
+          the UDUNITS-2 units parsed, formatted, and converters created.
+        * "as_unit.hit" and "as_unit.miss": lookups of the unit cache.
+        * "convert.udunits.float32" and "convert.udunits.float64": values
+          converted by UDUNITS-2, by type.
+        * "convert.cftime": time reference values converted by cftime.
+        * "num2date" and "date2num": time values and dates converted.
+        * "num2date.cache.hit" and "num2date.cache.miss": lookups of the
+          decoded dates cache, see :func:`enable_date_cache`.
+
+    For example:
+
+        >>> import cf_units
+        >>> import numpy as np
+        >>> cf_units.enable_stats()
+        >>> _ = cf_units.stats(reset=True)
+        >>> cf_units.Unit('km').convert(np.arange(3.0), 'm')
+        array([   0., 1000., 2000.])
+        >>> cf_units.stats()['convert.udunits.float64']['count']
+        3
+        >>> cf_units.enable_stats(enabled=False)
+
+    """
+    return _stats.snapshot(reset=reset)
+
+
+def add_hook(callback=None, span=None):
+    """Register hooks to run around the main operations of cf-units.
+
+    The operations are "Unit.__init__", "Unit.convert", "Unit.num2date",
+    "Unit.date2num", "tex" and "tex_many". The size of an operation is the
+    number of values converted or unit strings formatted, or one.
+
+    Hooks may be used, for example, to create tracing spans or to feed a
+    profiler. While no hooks are registered, they cost next to nothing.
+
+    Args:
+
+    * callback (callable):
+        Called as ``callback(operation, size, seconds)`` after each
+        operation, with the time taken by the operation in seconds.
+    * span (callable):
+        Called as ``span(operation, size)`` before each operation, to return
+        a context manager which is entered for the duration of the
+        operation.
+
+    For example:
+
+        >>> import cf_units
+        >>> import numpy as np
+        >>> km, m = cf_units.Unit('km'), cf_units.Unit('m')
+        >>> def callback(operation, size, seconds):
+        ...     print(operation, size)
+        >>> cf_units.add_hook(callback)
+        >>> km.convert(np.arange(3.0), m)
+        Unit.convert 3
+        array([   0., 1000., 2000.])
+        >>> _ = cf_units.Unit('m s-1')
+        Unit.__init__ 1
+        >>> cf_units.remove_hook(callback)
+
+    """
+    _stats.add_hook(callback=callback, span=span)
+
+
+def remove_hook(hook):
+    """Unregister a callback or span hook registered by :func:`add_hook`."""
+    _stats.remove_hook(hook)
+
+
+def enable_date_cache(enabled=True, max_dates=1000000):
+    """Enable, or disable, the caching of the dates decoded from arrays of
+    time values by :meth:`Unit.num2date` and :func:`num2date`.
+
+    The cache is disabled by default. While enabled, the dates of an array
+    of time values are looked up by the unit, the calendar, the content of
+    the time values and the output options, so that an identical time
+    coordinate, such as that of every member of an ensemble, is decoded
+    once. The least recently used dates are evicted from the cache once it
+    holds more than the maximum number of dates.
+
+    The same array of dates is returned by each lookup of the cache, so is
+    read-only. Scalar and masked time values, and arrays of more than the
+    maximum number of dates, are not cached.
+
+    Kwargs:
+
+    * enabled (bool):
+        Whether to cache decoded dates. Enabling the cache empties it.
+    * max_dates (int):
+        The maximum total number of dates held by the cache.
+
+    For example:
+
+        >>> import cf_units
+        >>> import numpy as np
+        >>> cf_units.enable_date_cache()
+        >>> u = cf_units.Unit('hours since 1970-01-01 00:00:00')
+        >>> dates = u.num2date(np.arange(24.0))
+        >>> u.num2date(np.arange(24.0)) is dates
+        True
+        >>> dates.flags.writeable
+        False
+        >>> cf_units.enable_date_cache(enabled=False)
+
+    """
+    _time.cache = _time.DateCache(max_dates) if enabled else None
 
 
 def as_unit(unit):
@@ -509,19 +1049,148 @@ def as_unit(unit):
         If the given unit is already a Unit it will be returned unchanged.
 
     """
-    if isinstance(unit, Unit):
-        result = unit
-    else:
-        result = None
-        use_cache = isinstance(unit, str) or unit is None
-        if use_cache:
-            result = _CACHE.get(unit)
-        if result is None:
-            # Typically unit is a string, however we cater for other types of
-            # 'unit' (e.g. iris.unit.Unit).
-            result = Unit(unit, calendar=getattr(unit, "calendar", None))
-            if use_cache:
-                _CACHE[unit] = result
+    return _default_system.as_unit(unit)
+
+
+def _integral(scale, offset, inverse):
+    # Return the integers nearest the scale and offset of a conversion, if
+    # they are its exact coefficients, or None. The float coefficients may
+    # be rounded, e.g. 12.000000000000002 for ft to in, so the integers are
+    # accepted if the inverse conversion of values by them agrees within a
+    # few ulps.
+    if not (math.isfinite(scale) and math.isfinite(offset)):
+        return None
+    scale, offset = round(scale), round(offset)
+    if scale == 0:
+        return None
+    tolerance = 4 * (
+        math.ulp(1.0) + math.ulp(float(abs(scale) + abs(offset))) / abs(scale)
+    )
+    if abs(inverse(float(offset))) > tolerance:
+        return None
+    if abs(inverse(float(scale + offset)) - 1) > tolerance:
+        return None
+    return scale, offset
+
+
+def _calendar(calendar):
+    # Return the standard name of the calendar of a time reference unit.
+    if calendar is None:
+        return CALENDAR_STANDARD
+    if not isinstance(calendar, str):
+        msg = "Expected string-like calendar argument, got {!r}."
+        raise TypeError(msg.format(type(calendar)))
+    result = calendar.lower()
+    if result in CALENDAR_ALIASES:
+        result = CALENDAR_ALIASES[result]
+    if result not in CALENDARS:
+        msg = "{!r} is an unsupported calendar."
+        raise ValueError(msg.format(calendar))
+    return result
+
+
+def parse_many(unit_strings, calendar=None, system=None):
+    """Return a Unit for each of the given unit strings.
+
+    Each distinct unit string is parsed only once, so this is much faster
+    than creating a Unit for each string when there are many repeats, such
+    as when scanning the attributes of many files.
+
+    Args:
+
+    * unit_strings:
+        An iterable of unit strings.
+    * calendar (string):
+        The calendar of the time reference units.
+    * system (cf_units.UnitSystem):
+        The unit system of the units.
+
+    Returns
+    -------
+        list of the Unit for each unit string, in input order. Where a unit
+        string cannot be parsed, the ValueError that :class:`Unit` would
+        raise is returned in its place, rather than raised.
+
+    For example:
+
+        >>> import cf_units
+        >>> units = cf_units.parse_many(['m', 'kelvin', 'm', 'jigawatt'])
+        >>> units[:3]
+        [Unit('m'), Unit('kelvin'), Unit('m')]
+        >>> print(repr(units[3]))
+        ValueError('[UT_UNKNOWN] Failed to parse unit "jigawatt"...')
+
+    """
+    if system is None:
+        system = _default_system
+    if calendar is not None:
+        # An invalid calendar applies to every unit, so is raised.
+        calendar = _calendar(calendar)
+    unit_strings = list(unit_strings)
+    results = dict.fromkeys(unit_strings)
+    with suppress_errors():
+        for unit_str in results:
+            try:
+                if calendar is None:
+                    results[unit_str] = system.as_unit(unit_str)
+                else:
+                    results[unit_str] = Unit(unit_str, calendar=calendar, system=system)
+            except ValueError as error:
+                results[unit_str] = error
+    return [results[unit_str] for unit_str in unit_strings]
+
+
+# The reference of a logarithmic unit definition, e.g. "0.1 lg(re 1 W)".
+_LOG_REFERENCE = re.compile(r"\b\w+\(re (.+)\)$")
+# A factor of a unit definition, e.g. "m-2".
+_DEFINITION_FACTOR = re.compile(r"(.*?)(-?\d*)")
+
+
+def _parse_dimensions(definition, system):
+    # Return the dimensions of an ASCII UDUNITS-2 unit definition, and
+    # whether it is a time reference. UDUNITS-2 ignores dimensionless base
+    # units, such as radian, in deciding convertibility, so they are
+    # omitted. A logarithmic unit has the dimensions of its reference.
+    time_reference = False
+    if " @ " in definition:
+        definition, origin = definition.split(" @ ", 1)
+        try:
+            float(origin)
+        except ValueError:
+            # The origin is a timestamp, rather than an offset.
+            time_reference = True
+    match = _LOG_REFERENCE.search(definition)
+    if match:
+        definition = match.group(1)
+    # Ignore any scale factor, e.g. "(3600 s)" or "1000 m".
+    product = definition.strip("()").split()[-1]
+    exponents = {}
+    for factor in product.split("."):
+        symbol, exponent = _DEFINITION_FACTOR.fullmatch(factor).groups()
+        if symbol and not system._is_dimensionless(symbol):
+            exponents[symbol] = exponents.get(symbol, 0) + int(exponent or 1)
+    dimensions = tuple(sorted(item for item in exponents.items() if item[1]))
+    return dimensions, time_reference
+
+
+# The most recently unpickled units.
+_UNPICKLE_CACHE = _LRUCache(4096)
+
+
+def _unpickle_unit(unit_text, calendar=None, system=None, cls=None):
+    # Reconstruct a pickled Unit, or Unit subclass. Units are immutable, so
+    # the same instance is shared by every unpickling of a given unit in a
+    # process, while it remains in the cache.
+    if cls is None:
+        cls = Unit
+    key = (cls, unit_text, calendar, system)
+    result = _UNPICKLE_CACHE.get(key)
+    if result is None:
+        if system is None:
+            result = cls(unit_text, calendar=calendar)
+        else:
+            result = cls(unit_text, calendar=calendar, system=system)
+        _UNPICKLE_CACHE[key] = result
     return result
 
 
@@ -571,6 +1240,13 @@ def is_vertical(unit):
     return as_unit(unit).is_vertical()
 
 
+def _is_integer(value):
+    # Whether the value is an integer, or an array of integers.
+    if isinstance(value, np.ndarray):
+        return value.dtype.kind in "iu"
+    return isinstance(value, (int, np.integer)) and not isinstance(value, bool)
+
+
 def _ud_value_error(ud_err, message):
     """Return a ValueError that has extra context from a _udunits2.UdunitsError."""
     # NOTE: We aren't raising here, just giving the caller a well formatted
@@ -629,7 +1305,7 @@ class Unit(_OrderedHashable):
 
     # Declare the attribute names relevant to the ordered and hashable
     #  behaviour.
-    _names = ("category", "ut_unit", "calendar", "origin")
+    _names = ("category", "ut_unit", "calendar", "origin", "system")
 
     category = None
     "Is this an unknown unit, a no-unit, or a UDUNITS-2 unit."
@@ -643,9 +1319,12 @@ class Unit(_OrderedHashable):
     origin = None
     "The original string used to create this unit."
 
+    system = None
+    "The :class:`UnitSystem` of this unit."
+
     __slots__ = ()
 
-    def __init__(self, unit, calendar=None):
+    def __init__(self, unit, calendar=None, system=None):
         """Create a wrapper instance for UDUNITS-2.
 
         An optional calendar may be provided for a unit which defines a
@@ -679,6 +1358,9 @@ class Unit(_OrderedHashable):
             Describes the calendar used in time calculations. The
             default is 'standard' or 'gregorian' for a time reference
             unit.
+        * system (cf_units.UnitSystem):
+            The unit system of the unit. The default is the system of
+            the UDUNITS-2 unit database.
 
         Returns
         -------
@@ -695,10 +1377,18 @@ class Unit(_OrderedHashable):
             >>> unknown = Unit(None)
 
         """
+        if _stats.hooks.active:
+            with _stats.operation("Unit.__init__"):
+                self._create(unit, calendar, system)
+        else:
+            self._create(unit, calendar, system)
+
+    def _create(self, unit, calendar, system):
         ut_unit = _ud.NULL_UNIT
         calendar_ = None
 
-        encoding = UT_UTF8
+        if system is None:
+            system = _default_system
 
         if unit is None:
             unit = ""
@@ -728,25 +1418,14 @@ class Unit(_OrderedHashable):
             category = _CATEGORY_UDUNIT
             str_unit = unit
             try:
-                ut_unit = _ud.parse(_ud_system, unit.encode("utf8"), encoding)
+                ut_unit = system._parse(unit)
             except _ud.UdunitsError as exception:
                 value_error = _ud_value_error(
                     exception, f'Failed to parse unit "{str_unit}"'
                 )
                 raise value_error from None
             if _OP_SINCE in unit.lower():
-                if calendar is None:
-                    calendar_ = CALENDAR_STANDARD
-                elif isinstance(calendar, str):
-                    calendar_ = calendar.lower()
-                    if calendar_ in CALENDAR_ALIASES:
-                        calendar_ = CALENDAR_ALIASES[calendar_]
-                    if calendar_ not in CALENDARS:
-                        msg = "{!r} is an unsupported calendar."
-                        raise ValueError(msg.format(calendar))
-                else:
-                    msg = "Expected string-like calendar argument, got {!r}."
-                    raise TypeError(msg.format(type(calendar)))
+                calendar_ = _calendar(calendar)
 
         # Call the OrderedHashable's init.
         self._init(
@@ -754,43 +1433,64 @@ class Unit(_OrderedHashable):
             ut_unit,
             calendar_,
             unit,
+            system,
         )
 
     @classmethod
-    def _new_from_existing_ut(cls, category, ut_unit, calendar=None, origin=None):
+    def _new_from_existing_ut(
+        cls, category, ut_unit, calendar=None, origin=None, system=None
+    ):
         # Short-circuit __init__ if we know what we are doing and already
         # have a UT handle.
+        if system is None:
+            system = _default_system
         unit = cls.__new__(cls)
-        unit._init(category, ut_unit, calendar, origin)
+        unit._init(category, ut_unit, calendar, origin, system)
         return unit
 
     # NOTE:
-    # "__getstate__" and "__setstate__" functions are defined here to
-    # provide a custom interface for Pickle
+    # "__reduce__" is defined here to provide a custom interface for Pickle
     #  : Pickle "normal" behaviour is just to save/reinstate the object
     #    dictionary
     #  : that won't work here, because the "ut_unit" attribute is an
     #    object handle
     #    - the corresponding udunits object only exists in the original
     #      invocation
-    def __getstate__(self):
-        # state capture method for Pickle.dump()
-        #  - return the instance data needed to reconstruct a Unit value
+    #  : instead, only the unit text and calendar are pickled, and the
+    #    Unit is rebuilt by "_unpickle_unit", which caches the result so
+    #    that many pickles of the same unit are only parsed once per process
+    def __reduce__(self):
         # After certain operations, self.origin will be set to None,
         # so we need to use self.symbol for these cases
-        origin = self.origin or self.symbol
-        return {"unit_text": origin, "calendar": self.calendar}
+        unit_text = self.origin or self.symbol
+        if type(self) is not Unit:
+            system = None if self.system is _default_system else self.system
+            return _unpickle_unit, (unit_text, self.calendar, system, type(self))
+        if self.system is not _default_system:
+            return _unpickle_unit, (unit_text, self.calendar, self.system)
+        if self.calendar is None:
+            return _unpickle_unit, (unit_text,)
+        return _unpickle_unit, (unit_text, self.calendar)
 
     def __setstate__(self, state):
-        # object reconstruction method for Pickle.load()
-        # intercept the Pickle.load() operation and call own __init__ again
-        #  - this is to ensure a valid ut_unit attribute (as these
-        #    handles aren't persistent)
+        # object reconstruction method for Pickle.load() of pickles
+        # written by earlier versions, which captured the state in a dict
+        #  - call own __init__ again to ensure a valid ut_unit attribute
+        #    (as these handles aren't persistent)
         self.__init__(state["unit_text"], calendar=state["calendar"])
 
     def __copy__(self):
         return self
 
+    def _cache(self):
+        # Return the cache of the representations of the unit, which are
+        # each computed at most once, as the unit is immutable. It is not
+        # part of the pickled state.
+        try:
+            return self.__dict__["_representations"]
+        except KeyError:
+            return self.__dict__.setdefault("_representations", {})
+
     def __deepcopy__(self, memo):
         return self
 
@@ -815,8 +1515,9 @@ class Unit(_OrderedHashable):
         if self.is_unknown() or self.is_no_unit():
             result = False
         else:
-            day = _ud.get_unit_by_name(_ud_system, b"day")
-            result = _ud.are_convertible(self.ut_unit, day)
+            with _UT_LOCK:
+                day = _ud.get_unit_by_name(self.system._ut_system, b"day")
+                result = _ud.are_convertible(self.ut_unit, day)
         return result
 
     def is_vertical(self):
@@ -841,11 +1542,12 @@ class Unit(_OrderedHashable):
         if self.is_unknown() or self.is_no_unit():
             result = False
         else:
-            bar = _ud.get_unit_by_name(_ud_system, b"bar")
-            result = _ud.are_convertible(self.ut_unit, bar)
-            if not result:
-                meter = _ud.get_unit_by_name(_ud_system, b"meter")
-                result = _ud.are_convertible(self.ut_unit, meter)
+            with _UT_LOCK:
+                bar = _ud.get_unit_by_name(self.system._ut_system, b"bar")
+                result = _ud.are_convertible(self.ut_unit, bar)
+                if not result:
+                    meter = _ud.get_unit_by_name(self.system._ut_system, b"meter")
+                    result = _ud.are_convertible(self.ut_unit, meter)
         return result
 
     def is_udunits(self):
@@ -987,20 +1689,77 @@ class Unit(_OrderedHashable):
             True
 
         """
-        other = as_unit(other)
+        other = self.system.as_unit(other)
         if (
             self.is_unknown()
             or self.is_no_unit()
             or other.is_unknown()
             or other.is_no_unit()
+            or self.calendar != other.calendar
         ):
             result = False
         else:
-            result = self.calendar == other.calendar and _ud.are_convertible(
-                self.ut_unit, other.ut_unit
-            )
+            with _UT_LOCK:
+                result = _ud.are_convertible(self.ut_unit, other.ut_unit)
+        return result
+
+    @property
+    def dimensions(self):
+        """The exponents of the base units of the unit, as a tuple of
+        (base unit symbol, exponent) pairs, or None if the unit is
+        unknown or no_unit. Dimensionless base units, such as radian, are
+        omitted.
+
+        Units with the same, or reciprocal, dimensions are convertible,
+        unless only one of them is a time reference, or their calendars
+        differ. See
+        :class:`cf_units.dimensions.DimensionIndex` for grouping many units
+        by convertibility.
+
+        For example:
+
+            >>> from cf_units import Unit
+            >>> Unit('hPa').dimensions
+            (('kg', 1), ('m', -1), ('s', -2))
+            >>> Unit('degrees').dimensions
+            ()
+
+        """
+        return self._dimensions()[0]
+
+    def _dimensions(self):
+        # Return the dimensions of the unit, and whether it is a time
+        # reference. This is cached on the unit, and by unit string on the
+        # unit system, as it formats and parses the definition of the unit.
+        representations = self._cache()
+        try:
+            return representations["dimensions"]
+        except KeyError:
+            pass
+        cache = self.system._dimensions
+        result = cache.get(self.origin)
+        if result is None:
+            if self.is_unknown() or self.is_no_unit():
+                result = (None, False)
+            else:
+                result = _parse_dimensions(self.definition, self.system)
+            if self.origin is not None:
+                cache[self.origin] = result
+        representations["dimensions"] = result
         return result
 
+    def _convertibility_key(self):
+        # Return a key which is equal for convertible units, or None if
+        # the unit is not convertible to any unit.
+        dimensions, time_reference = self._dimensions()
+        if dimensions is None:
+            return None
+        # UDUNITS-2 converts between reciprocal units, e.g. s and Hz, so
+        # the exponents are negated if the first of them is negative.
+        if dimensions and dimensions[0][1] < 0:
+            dimensions = tuple((symbol, -power) for symbol, power in dimensions)
+        return (self.system, self.calendar, time_reference, dimensions)
+
     def is_dimensionless(self):
         """Return whether the unit is dimensionless.
 
@@ -1019,9 +1778,10 @@ class Unit(_OrderedHashable):
             True
 
         """
-        return self.category == _CATEGORY_UDUNIT and bool(
-            _ud.is_dimensionless(self.ut_unit)
-        )
+        if self.category != _CATEGORY_UDUNIT:
+            return False
+        with _UT_LOCK:
+            return bool(_ud.is_dimensionless(self.ut_unit))
 
     def is_unknown(self):
         """Return whether the unit is defined to be an *unknown* unit.
@@ -1114,11 +1874,15 @@ class Unit(_OrderedHashable):
                 option = [option]
             for i in option:
                 bitmask |= i
-        encoding = bitmask & (UT_ASCII | UT_ISO_8859_1 | UT_LATIN1 | UT_UTF8)
-        encoding_str = _encoding_lookup[encoding]
-        result = _ud.format(self.ut_unit, bitmask)
+        representations = self._cache()
+        result = representations.get(bitmask)
+        if result is None:
+            encoding = bitmask & (UT_ASCII | UT_ISO_8859_1 | UT_LATIN1 | UT_UTF8)
+            encoding_str = _encoding_lookup[encoding]
+            with _stats.timed("udunits.format"), _UT_LOCK:
+                result = _ud.format(self.ut_unit, bitmask)
 
-        result = str(result.decode(encoding_str))
+            result = representations[bitmask] = str(result.decode(encoding_str))
         return result
 
     @property
@@ -1221,12 +1985,15 @@ class Unit(_OrderedHashable):
         if not isinstance(origin, float | int):
             raise TypeError("a numeric type for the origin argument is required")
         try:
-            ut_unit = _ud.offset_by_time(self.ut_unit, origin)
+            with _UT_LOCK:
+                ut_unit = _ud.offset_by_time(self.ut_unit, origin)
         except _ud.UdunitsError as exception:
             value_error = _ud_value_error(exception, f"Failed to offset {self!r}")
             raise value_error from None
         calendar = None
-        return Unit._new_from_existing_ut(_CATEGORY_UDUNIT, ut_unit, calendar)
+        return Unit._new_from_existing_ut(
+            _CATEGORY_UDUNIT, ut_unit, calendar, system=self.system
+        )
 
     def invert(self):
         """Invert the unit i.e. find the reciprocal of the unit, and return
@@ -1249,9 +2016,10 @@ class Unit(_OrderedHashable):
         elif self.is_no_unit():
             raise ValueError("Cannot invert a 'no-unit'.")
         else:
-            ut_unit = _ud.invert(self.ut_unit)
+            with _UT_LOCK:
+                ut_unit = _ud.invert(self.ut_unit)
             result = Unit._new_from_existing_ut(
-                _CATEGORY_UDUNIT, ut_unit, calendar=None
+                _CATEGORY_UDUNIT, ut_unit, calendar=None, system=self.system
             )
         return result
 
@@ -1285,11 +2053,12 @@ class Unit(_OrderedHashable):
         elif self.is_no_unit():
             raise ValueError("Cannot take the root of a 'no-unit'.")
         # only update the unit if it is not scalar
-        elif self == Unit("1"):
+        elif self == Unit("1", system=self.system):
             result = self
         else:
             try:
-                ut_unit = _ud.root(self.ut_unit, root)
+                with _UT_LOCK:
+                    ut_unit = _ud.root(self.ut_unit, root)
             except _ud.UdunitsError as exception:
                 value_error = _ud_value_error(
                     exception,
@@ -1297,7 +2066,9 @@ class Unit(_OrderedHashable):
                 )
                 raise value_error from None
             calendar = None
-            result = Unit._new_from_existing_ut(_CATEGORY_UDUNIT, ut_unit, calendar)
+            result = Unit._new_from_existing_ut(
+                _CATEGORY_UDUNIT, ut_unit, calendar, system=self.system
+            )
         return result
 
     def log(self, base):
@@ -1326,7 +2097,8 @@ class Unit(_OrderedHashable):
             raise ValueError("Cannot take the logarithm of a 'no-unit'.")
         else:
             try:
-                ut_unit = _ud.log(base, self.ut_unit)
+                with _UT_LOCK:
+                    ut_unit = _ud.log(base, self.ut_unit)
             except TypeError:
                 raise TypeError("A numeric type for the base argument is required")
             except _ud.UdunitsError as exception:
@@ -1336,7 +2108,9 @@ class Unit(_OrderedHashable):
                 )
                 raise value_err from None
             calendar = None
-            result = Unit._new_from_existing_ut(_CATEGORY_UDUNIT, ut_unit, calendar)
+            result = Unit._new_from_existing_ut(
+                _CATEGORY_UDUNIT, ut_unit, calendar, system=self.system
+            )
         return result
 
     def __str__(self):
@@ -1371,10 +2145,16 @@ class Unit(_OrderedHashable):
             "Unit('meters')"
 
         """
-        if self.calendar is None:
-            result = f"{self.__class__.__name__}('{self}')"
-        else:
-            result = f"{self.__class__.__name__}('{self}', calendar='{self.calendar}')"
+        representations = self._cache()
+        result = representations.get("repr")
+        if result is None:
+            if self.calendar is None:
+                result = f"{self.__class__.__name__}('{self}')"
+            else:
+                result = (
+                    f"{self.__class__.__name__}('{self}', calendar='{self.calendar}')"
+                )
+            representations["repr"] = result
         return result
 
     def _offset_common(self, offset):
@@ -1384,12 +2164,13 @@ class Unit(_OrderedHashable):
             raise ValueError("Cannot offset a 'no-unit'.")
         else:
             try:
-                ut_unit = _ud.offset(self.ut_unit, offset)
+                with _UT_LOCK:
+                    ut_unit = _ud.offset(self.ut_unit, offset)
             except TypeError:
                 result = NotImplemented
             else:
                 result = Unit._new_from_existing_ut(
-                    _CATEGORY_UDUNIT, ut_unit, calendar=None
+                    _CATEGORY_UDUNIT, ut_unit, calendar=None, system=self.system
                 )
         return result
 
@@ -1411,16 +2192,17 @@ class Unit(_OrderedHashable):
 
         op_label = op_func.__name__
 
-        other = as_unit(other)
+        other = self.system.as_unit(other)
 
         if self.is_no_unit() or other.is_no_unit():
             raise ValueError(f"Cannot {op_label:s} a 'no-unit'.")
 
         if self.is_unknown() or other.is_unknown():
-            result = Unit(_UNKNOWN_UNIT_STRING)
+            result = Unit(_UNKNOWN_UNIT_STRING, system=self.system)
         else:
             try:
-                ut_unit = op_func(self.ut_unit, other.ut_unit)
+                with _UT_LOCK:
+                    ut_unit = op_func(self.ut_unit, other.ut_unit)
             except _ud.UdunitsError as exception:
                 value_err = _ud_value_error(
                     exception,
@@ -1428,7 +2210,9 @@ class Unit(_OrderedHashable):
                 )
                 raise value_err from None
             calendar = None
-            result = Unit._new_from_existing_ut(_CATEGORY_UDUNIT, ut_unit, calendar)
+            result = Unit._new_from_existing_ut(
+                _CATEGORY_UDUNIT, ut_unit, calendar, system=self.system
+            )
         return result
 
     def __rmul__(self, other):
@@ -1549,7 +2333,7 @@ class Unit(_OrderedHashable):
             result = self
         elif self.is_no_unit():
             raise ValueError("Cannot raise the power of a 'no-unit'.")
-        elif self == Unit("1"):
+        elif self == Unit("1", system=self.system):
             # 1 ** N -> 1
             result = self
         # UDUNITS-2 does not support floating point raise/root.
@@ -1570,14 +2354,17 @@ class Unit(_OrderedHashable):
             power = round(power)
 
             try:
-                ut_unit = _ud.raise_(self.ut_unit, power)
+                with _UT_LOCK:
+                    ut_unit = _ud.raise_(self.ut_unit, power)
             except _ud.UdunitsError as exception:
                 value_err = _ud_value_error(
                     exception,
                     f"Failed to raise the power of {self!r}",
                 )
                 raise value_err from None
-            result = Unit._new_from_existing_ut(_CATEGORY_UDUNIT, ut_unit)
+            result = Unit._new_from_existing_ut(
+                _CATEGORY_UDUNIT, ut_unit, system=self.system
+            )
         return result
 
     def __eq__(self, other):
@@ -1601,7 +2388,7 @@ class Unit(_OrderedHashable):
 
         """
         try:
-            other = as_unit(other)
+            other = self.system.as_unit(other)
         except ValueError:
             return NotImplemented
 
@@ -1675,19 +2462,26 @@ class Unit(_OrderedHashable):
             Value/s to be converted.
         * other (string/Unit):
             Target unit to convert to.
-        * ctype (cf_units.FLOAT32/cf_units.FLOAT64):
+        * ctype (cf_units.FLOAT32/cf_units.FLOAT64/cf_units.INT64):
             Floating point 32-bit single-precision (cf_units.FLOAT32) or
             64-bit double-precision (cf_units.FLOAT64) used for conversion
             when `value` is not a NumPy array or is a NumPy array composed of
             NumPy integers. The default is 64-bit double-precision conversion.
+            With 64-bit integers (cf_units.INT64), integer values are
+            converted exactly with integer arithmetic, and other values with
+            64-bit double-precision.
         * inplace (bool):
             If ``False``, return a deep copy of the value array. If ``True``,
             convert the values in-place. A new array will be created if
-            ``value`` is an integer NumPy array.
+            ``value`` is an integer NumPy array, except with
+            cf_units.INT64, for which an integer array must be of
+            numpy.int64 to be converted in-place.
 
         Returns
         -------
-            float or numpy.ndarray of appropriate float type.
+            float or numpy.ndarray of appropriate float type, or int or
+            numpy.ndarray of numpy.int64 for integer values converted with
+            cf_units.INT64.
 
         For example:
 
@@ -1717,13 +2511,43 @@ class Unit(_OrderedHashable):
            >>> a.convert(365.75, b)
            0.75
 
+        .. note::
+
+           Integer values are only converted with cf_units.INT64 if each
+           converted value is an exact integer, otherwise a ValueError is
+           raised. For example, rebasing time values or converting them to
+           a shorter time unit:
+
+           >>> a = Unit('seconds since 1970-01-01')
+           >>> b = Unit('seconds since 2000-01-01')
+           >>> a.convert(np.array([946684800, 2000000000]), b, cf_units.INT64)
+           array([         0, 1053315200])
+           >>> Unit('days').convert(np.arange(3), 'hours', cf_units.INT64)
+           array([ 0, 24, 48])
+
+        .. note::
+
+           Units may be converted concurrently from several threads. Only
+           the creation of the UDUNITS-2 converter is serialised; applying
+           it to an array of values releases the GIL.
+
         """
-        other = as_unit(other)
+        if _stats.hooks.active:
+            with _stats.operation("Unit.convert", value):
+                return self._convert(value, other, ctype, inplace)
+        return self._convert(value, other, ctype, inplace)
+
+    def _convert(self, value, other, ctype, inplace):
+        other = self.system.as_unit(other)
 
         if self == other:
             return value
 
         if self.is_convertible(other):
+            if ctype is INT64 and _is_integer(value):
+                return self._convert_int64(value, other, inplace)
+            if ctype is INT64:
+                ctype = FLOAT64
             if inplace:
                 result = value
             else:
@@ -1731,12 +2555,13 @@ class Unit(_OrderedHashable):
             # Use cftime for converting reference times that are not using a
             # gregorian calendar as it handles these and udunits does not.
             if self.is_time_reference() and self.calendar != CALENDAR_STANDARD:
-                result_datetimes = cftime.num2date(
-                    result, self.cftime_unit, self.calendar
-                )
-                result = cftime.date2num(
-                    result_datetimes, other.cftime_unit, other.calendar
-                )
+                with _stats.timed("convert.cftime", result):
+                    result_datetimes = cftime.num2date(
+                        result, self.cftime_unit, self.calendar
+                    )
+                    result = cftime.date2num(
+                        result_datetimes, other.cftime_unit, other.calendar
+                    )
                 convert_type = isinstance(value, np.ndarray) and np.issubdtype(
                     value.dtype, np.floating
                 )
@@ -1744,7 +2569,7 @@ class Unit(_OrderedHashable):
                     result = result.astype(value.dtype)
             else:
                 try:
-                    ut_converter = _ud.get_converter(self.ut_unit, other.ut_unit)
+                    ut_converter = self.system._get_converter(self, other)
                 except _ud.UdunitsError as exception:
                     value_err = _ud_value_error(
                         exception,
@@ -1777,8 +2602,10 @@ class Unit(_OrderedHashable):
                     # Utilise global convenience dictionary
                     # _cv_convert_array to convert our array in 1d form
                     result_tmp = result.ravel(order="A")
-                    # Do the actual conversion.
-                    _cv_convert_array[ctype](ut_converter, result_tmp, result_tmp)
+                    # Do the actual conversion. This needs no lock, and
+                    # releases the GIL while converting.
+                    with _stats.timed(_cv_convert_stats[ctype], result_tmp):
+                        _cv_convert_array[ctype](ut_converter, result_tmp, result_tmp)
                     # If result_tmp was a copy, not a view (i.e. not C
                     # contiguous), copy the data back to the original.
                     if not np.shares_memory(result, result_tmp):
@@ -1794,10 +2621,104 @@ class Unit(_OrderedHashable):
                         )
                     # Utilise global convenience dictionary
                     # _cv_convert_scalar
-                    result = _cv_convert_scalar[ctype](ut_converter, result)
+                    with _stats.timed(_cv_convert_stats[ctype]):
+                        result = _cv_convert_scalar[ctype](ut_converter, result)
             return result
         raise ValueError(f"Unable to convert from '{self!r}' to '{other!r}'.")
 
+    def _int64_coefficients(self, other):
+        # Return the integers (scale, offset, divisor) of the exact
+        # conversion of integer values to the other unit, as
+        # (value * scale + offset) / divisor, or None if there are none.
+        representations = self._cache()
+        key = ("int64", other)
+        if key in representations:
+            return representations[key]
+        if self.is_time_reference():
+            # The time origins are exact, in whole microseconds, whatever
+            # the calendar.
+            origin = self._time_origin()
+            target = other._time_origin()
+            coefficients = (
+                origin.factor,
+                target._date_microseconds(origin.basedate),
+                target.factor,
+            )
+        else:
+            offset = self.convert(0.0, other)
+            scale = self.convert(1.0, other) - offset
+            inverse_offset = other.convert(0.0, self)
+            inverse_scale = other.convert(1.0, self) - inverse_offset
+            forward = _integral(scale, offset, lambda v: other.convert(v, self))
+            inverse = _integral(
+                inverse_scale, inverse_offset, lambda v: self.convert(v, other)
+            )
+            if forward is not None:
+                coefficients = (*forward, 1)
+            elif inverse is not None:
+                coefficients = (1, -inverse[1], inverse[0])
+            else:
+                coefficients = None
+        if coefficients is not None:
+            scale, offset, divisor = coefficients
+            if divisor < 0:
+                scale, offset, divisor = -scale, -offset, -divisor
+            common = math.gcd(scale, offset, divisor)
+            coefficients = (scale // common, offset // common, divisor // common)
+        representations[key] = coefficients
+        return coefficients
+
+    def _convert_int64(self, value, other, inplace):
+        # Convert integer values exactly, with 64-bit integer arithmetic.
+        coefficients = self._int64_coefficients(other)
+        if coefficients is None:
+            raise ValueError(
+                f"Unable to convert from '{self!r}' to '{other!r}' with "
+                "integer arithmetic."
+            )
+        scale, offset, divisor = coefficients
+        if isinstance(value, np.ndarray):
+            if inplace and value.dtype != INT64:
+                raise TypeError(
+                    "Unable to convert an array of "
+                    f"'{value.dtype}' in-place with 64-bit integer arithmetic."
+                )
+            if value.size:
+                # The bounds of the products, and of the sums, of the values.
+                products = (int(value.min()) * scale, int(value.max()) * scale)
+                ends = (*products, *(product + offset for product in products))
+                if min(ends) < _MIN_INT64 or max(ends) > _MAX_INT64:
+                    raise OverflowError(
+                        "Converted values outside range of 64 bit signed integers."
+                    )
+            result = value.astype(INT64)
+            if scale != 1:
+                result *= scale
+            if offset:
+                result += offset
+            if divisor != 1:
+                result, remainder = np.divmod(result, divisor)
+                if remainder.any():
+                    raise ValueError(
+                        f"Unable to convert from '{self!r}' to '{other!r}' "
+                        "exactly with integer arithmetic."
+                    )
+            if inplace:
+                value[...] = result
+                return value
+            return result
+        result, remainder = divmod(int(value) * scale + offset, divisor)
+        if remainder:
+            raise ValueError(
+                f"Unable to convert from '{self!r}' to '{other!r}' "
+                "exactly with integer arithmetic."
+            )
+        if not _MIN_INT64 <= result <= _MAX_INT64:
+            raise OverflowError(
+                "Converted values outside range of 64 bit signed integers."
+            )
+        return result
+
     @property
     def cftime_unit(self):
         """Returns a string suitable for passing as a unit to cftime.num2date and
@@ -1807,11 +2728,26 @@ class Unit(_OrderedHashable):
         if self.calendar is None:
             raise ValueError("Unit has undefined calendar")
 
-        #
-        # ensure to strip out non-parsable 'UTC' postfix, which
-        # is generated by UDUNITS-2 formatted output
-        #
-        return str(self).rstrip(" UTC")
+        representations = self._cache()
+        result = representations.get("cftime_unit")
+        if result is None:
+            #
+            # ensure to strip out non-parsable 'UTC' postfix, which
+            # is generated by UDUNITS-2 formatted output
+            #
+            result = representations["cftime_unit"] = str(self).rstrip(" UTC")
+        return result
+
+    def _time_origin(self):
+        # Return the parsed origin and interval of the time reference unit,
+        # so that cftime does not parse the unit string on each conversion.
+        representations = self._cache()
+        result = representations.get("time_origin")
+        if result is None:
+            result = representations["time_origin"] = _time.TimeOrigin(
+                self.cftime_unit, self.calendar
+            )
+        return result
 
     def date2num(self, date):
         """Returns the numeric time value calculated from the datetime
@@ -1855,7 +2791,8 @@ class Unit(_OrderedHashable):
             array([5, 6])
 
         """
-        return cftime.date2num(date, self.cftime_unit, self.calendar)
+        with _stats.operation("Unit.date2num", date), _stats.timed("date2num", date):
+            return self._time_origin().date2num(date)
 
     def num2date(
         self,
@@ -1914,13 +2851,34 @@ class Unit(_OrderedHashable):
             ['1970-01-01 06:00:00', '1970-01-01 07:00:00']
 
         """
-        return cftime.num2date(
-            time_value,
-            units=self.cftime_unit,
-            calendar=self.calendar,
-            only_use_cftime_datetimes=only_use_cftime_datetimes,
-            only_use_python_datetimes=only_use_python_datetimes,
-        )
+        with (
+            _stats.operation("Unit.num2date", time_value),
+            _stats.timed("num2date", time_value),
+        ):
+            origin = self._time_origin()
+            cache = _time.cache
+            key = None
+            if cache is not None:
+                options = (
+                    bool(only_use_cftime_datetimes),
+                    bool(only_use_python_datetimes),
+                )
+                key = cache.key(origin, time_value, options)
+            if key is not None:
+                result = cache.get(key)
+                _stats.count(
+                    "num2date.cache.miss" if result is None else "num2date.cache.hit"
+                )
+                if result is not None:
+                    return result
+            result = origin.num2date(
+                time_value,
+                only_use_cftime_datetimes=only_use_cftime_datetimes,
+                only_use_python_datetimes=only_use_python_datetimes,
+            )
+            if key is not None:
+                result = cache.put(key, result)
+            return result
 
     def num2pydate(self, time_value):
         """Convert time value(s) to python datetime.datetime objects, or raise an
@@ -1935,3 +2893,206 @@ class Unit(_OrderedHashable):
             only_use_cftime_datetimes=False,
             only_use_python_datetimes=True,
         )
+
+    def num_range(self, start, stop, step):
+        """Return the numeric time values of evenly spaced dates, from a start
+        date up to but excluding a stop date, using the current calendar and
+        unit time reference.
+
+        The time values are calculated together, in whole microseconds since
+        the time origin, rather than by encoding each date with
+        :meth:`date2num`. As for :meth:`date2num`, the time values are
+        integers if they can all be encoded exactly as integers with the
+        units, otherwise floats.
+
+        Args:
+
+        * start (datetime):
+            The first date.
+        * stop (datetime):
+            The date which ends the range.
+        * step (datetime.timedelta/int/float):
+            The non-zero interval between the dates, as a timedelta, or as
+            a number of the time units of this unit.
+
+        Returns
+        -------
+            numpy.ndarray of integers or floats.
+
+        For example:
+
+            >>> import cf_units
+            >>> import cftime
+            >>> import datetime
+            >>> u = cf_units.Unit('days since 2000-01-01', calendar='360_day')
+            >>> u.num_range(cftime.datetime(2000, 2, 29, calendar='360_day'),
+            ...             cftime.datetime(2000, 3, 2, calendar='360_day'),
+            ...             datetime.timedelta(hours=12))
+            array([58. , 58.5, 59. , 59.5, 60. , 60.5])
+            >>> u.num_range(datetime.datetime(2000, 1, 1),
+            ...             datetime.datetime(2000, 1, 11), 3)
+            array([0, 3, 6, 9])
+
+        """
+        origin = self._time_origin()
+        if not isinstance(step, datetime.timedelta):
+            step = origin.interval * step
+        return origin.range(start, stop, step)
+
+    def period_bounds(self, time_value, period):
+        """Return the numeric time values of the start and end of the calendar
+        month, season or year of each numeric time value, using the current
+        calendar and unit time reference.
+
+        Seasons are December-February, March-May, June-August and
+        September-November, so the season of a date in January begins in
+        December of the previous year. Each period includes its start, and
+        excludes its end.
+
+        Only the earliest and latest time values are decoded. The start of
+        each period of the years spanned is encoded once, then the period
+        of each time value is found by a binary search.
+
+        Args:
+
+        * time_value (int/float/numpy.ndarray):
+            Numeric time values.
+        * period (string):
+            One of 'month', 'season' or 'year'.
+
+        Returns
+        -------
+            numpy.ndarray of the time values of the start and end of each
+            period, with a last dimension of length 2.
+
+        For example:
+
+            >>> import cf_units
+            >>> import numpy as np
+            >>> u = cf_units.Unit('days since 2000-01-01', calendar='360_day')
+            >>> u.period_bounds([15, 45, 400], 'month')
+            array([[  0,  30],
+                   [ 30,  60],
+                   [390, 420]])
+            >>> u.period_bounds([15, 45, 400], 'season')
+            array([[-30,  60],
+                   [-30,  60],
+                   [330, 420]])
+
+        """
+        return self._time_origin().period_bounds(time_value, period)
+
+    def date_index(self, time_value, date, side="left", sorter=None):
+        """Return the indices at which the dates would be inserted into the
+        numeric time values, to keep them in order.
+
+        The dates are encoded with :meth:`date2num`, then found by a binary
+        search of the time values, as for :func:`numpy.searchsorted`, so the
+        time values are not decoded.
+
+        Args:
+
+        * time_value (numpy.ndarray):
+            One-dimensional numeric time values in this unit, in ascending
+            order unless a sorter is given.
+        * date (datetime):
+            A datetime object or a sequence of datetime objects.
+
+        Kwargs:
+
+        * side ('left' or 'right'):
+            As for :func:`numpy.searchsorted`, whether the index of a date
+            equal to a time value is that of the time value, or the next.
+        * sorter (numpy.ndarray):
+            The indices which sort unordered time values, such as from
+            :func:`numpy.argsort`.
+
+        Returns
+        -------
+            integer or numpy.ndarray of integers.
+
+        For example:
+
+            >>> import cf_units
+            >>> import datetime
+            >>> import numpy as np
+            >>> u = cf_units.Unit('hours since 1970-01-01 00:00:00')
+            >>> times = np.arange(0, 240, 6)
+            >>> int(u.date_index(times, datetime.datetime(1970, 1, 2)))
+            4
+
+        """
+        time_value = np.asanyarray(time_value)
+        return np.searchsorted(
+            time_value, self.date2num(date), side=side, sorter=sorter
+        )
+
+    def date_slice(self, time_value, start=None, stop=None, sorter=None):
+        """Return the selection of the numeric time values from a start date,
+        up to but excluding a stop date.
+
+        The dates are encoded with :meth:`date2num`, then found by a binary
+        search of the time values, so the time values are not decoded.
+        Time values in ascending or descending order are selected by a
+        slice. Unordered time values are selected by the indices of the
+        selected time values, in their original order, given the indices
+        which sort them.
+
+        Args:
+
+        * time_value (numpy.ndarray):
+            One-dimensional numeric time values in this unit.
+
+        Kwargs:
+
+        * start (datetime):
+            The first date of the selection. Defaults to no lower bound.
+        * stop (datetime):
+            The date which ends the selection. Defaults to no upper bound.
+        * sorter (numpy.ndarray):
+            The indices which sort unordered time values, such as from
+            :func:`numpy.argsort`.
+
+        Returns
+        -------
+            slice, or numpy.ndarray of integers if a sorter is given.
+
+        For example:
+
+            >>> import cf_units
+            >>> import datetime
+            >>> import numpy as np
+            >>> u = cf_units.Unit('hours since 1970-01-01 00:00:00')
+            >>> times = np.arange(0, 240, 6)
+            >>> u.date_slice(times, datetime.datetime(1970, 1, 2),
+            ...              datetime.datetime(1970, 1, 3))
+            slice(4, 8, None)
+            >>> u.date_slice(times[::-1], datetime.datetime(1970, 1, 2),
+            ...              datetime.datetime(1970, 1, 3))
+            slice(32, 36, None)
+
+        """
+        time_value = np.asanyarray(time_value)
+        if time_value.ndim != 1:
+            raise ValueError(
+                f"Expected one-dimensional time values, got {time_value.ndim} "
+                "dimensions."
+            )
+        size = time_value.size
+        descending = sorter is None and size > 1 and time_value[0] > time_value[-1]
+        if descending:
+            # A reversed view is in ascending order, without a copy.
+            time_value = time_value[::-1]
+        lower = (
+            0 if start is None else self.date_index(time_value, start, "left", sorter)
+        )
+        upper = (
+            size if stop is None else self.date_index(time_value, stop, "left", sorter)
+        )
+        lower = int(lower)
+        upper = max(lower, int(upper))
+        if sorter is not None:
+            return np.sort(np.asarray(sorter)[lower:upper])
+        if descending:
+            return slice(size - upper, size - lower)
+        return slice(lower, upper)
@@ -0,0 +1,151 @@
+# Copyright cf-units contributors
+#
+# This file is part of cf-units and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Opt-in instrumentation of the work done by cf-units.
+
+See :func:`cf_units.enable_stats` and :func:`cf_units.stats` for the
+counters, and :func:`cf_units.add_hook` for the hooks around operations.
+
+"""
+
+from collections import Counter
+from contextlib import ExitStack, nullcontext
+import threading
+from time import perf_counter
+
+import numpy as np
+
+#: Whether the counters are updated. The instrumented code only checks this
+#: flag, so the counters cost next to nothing when disabled.
+enabled = False
+
+_LOCK = threading.Lock()
+_counts = Counter()
+_seconds = Counter()
+_NULL_TIMER = nullcontext()
+
+
+def record(name, count=1, seconds=0.0):
+    """Add to the count and the time of the named counter."""
+    with _LOCK:
+        _counts[name] += count
+        _seconds[name] += seconds
+
+
+def count(name):
+    """Count one event of the named counter, if the counters are enabled."""
+    if enabled:
+        record(name)
+
+
+class _Timer:
+    __slots__ = ("_count", "_name", "_start")
+
+    def __init__(self, name, count):
+        self._name = name
+        self._count = count
+
+    def __enter__(self):
+        self._start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        record(self._name, self._count, perf_counter() - self._start)
+
+
+def timed(name, values=None):
+    """Return a context manager which times the named counter.
+
+    The count is incremented by the number of elements of the given values,
+    or by one if there are no values.
+
+    """
+    if not enabled:
+        return _NULL_TIMER
+    return _Timer(name, 1 if values is None else np.size(values))
+
+
+def snapshot(reset=False):
+    """Return the count and time of each counter, and optionally reset them."""
+    with _LOCK:
+        result = {
+            name: {"count": _counts[name], "seconds": _seconds[name]}
+            for name in sorted(_counts)
+        }
+        if reset:
+            _counts.clear()
+            _seconds.clear()
+    return result
+
+
+class _Hooks:
+    # The registered hooks. The tuples are replaced rather than modified,
+    # so that an operation in another thread always sees a consistent set.
+    __slots__ = ("active", "callbacks", "spans")
+
+    def __init__(self):
+        self.callbacks = ()
+        self.spans = ()
+        #: Whether any hooks are registered. The instrumented operations
+        #: only check this flag, so cost next to nothing without hooks.
+        self.active = False
+
+    def update(self, callbacks, spans):
+        self.callbacks = callbacks
+        self.spans = spans
+        self.active = bool(callbacks or spans)
+
+
+hooks = _Hooks()
+
+
+def add_hook(callback=None, span=None):
+    """Register a callback, and/or a span factory, for the hooks."""
+    with _LOCK:
+        hooks.update(
+            hooks.callbacks if callback is None else (*hooks.callbacks, callback),
+            hooks.spans if span is None else (*hooks.spans, span),
+        )
+
+
+def remove_hook(hook):
+    """Unregister a callback or a span factory, if registered."""
+    with _LOCK:
+        hooks.update(
+            tuple(item for item in hooks.callbacks if item is not hook),
+            tuple(item for item in hooks.spans if item is not hook),
+        )
+
+
+class _Operation:
+    __slots__ = ("_name", "_size", "_spans", "_start")
+
+    def __init__(self, name, size):
+        self._name = name
+        self._size = size
+
+    def __enter__(self):
+        self._spans = ExitStack()
+        for factory in hooks.spans:
+            self._spans.enter_context(factory(self._name, self._size))
+        self._start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        seconds = perf_counter() - self._start
+        self._spans.__exit__(exc_type, exc_value, traceback)
+        for callback in hooks.callbacks:
+            callback(self._name, self._size, seconds)
+
+
+def operation(name, values=None):
+    """Return a context manager which runs the hooks around an operation.
+
+    The size of the operation is the number of elements of the given values,
+    or one if there are no values.
+
+    """
+    if not hooks.active:
+        return _NULL_TIMER
+    return _Operation(name, 1 if values is None else np.size(values))
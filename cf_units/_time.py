@@ -0,0 +1,427 @@
+# Copyright cf-units contributors
+#
+# This file is part of cf-units and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""The parsed time origin of a time reference unit.
+
+cftime parses the "<time-unit> since <time-origin>" string on every call
+of :func:`cftime.num2date` and :func:`cftime.date2num`. A
+:class:`TimeOrigin` parses it once, then converts between time values and
+dates as cftime does. Inputs which cftime treats specially, such as masked
+or non-finite values, are passed on to cftime.
+
+"""
+
+from collections import OrderedDict
+import datetime
+import hashlib
+import math
+import threading
+import warnings
+
+import cftime
+import numpy as np
+
+_MICROSECOND = datetime.timedelta(microseconds=1)
+_MIN_INT64 = np.iinfo(np.int64).min
+_MAX_INT64 = np.iinfo(np.int64).max
+# The microseconds of each second, whose rounding cftime nudges, and the
+# time units for which it does not.
+_SECOND = 1000000
+_SUBSECOND_FACTORS = (1, 1000)
+# The calendars whose dates before the Gregorian reform are Julian dates,
+# unlike those of datetime.datetime.
+_REFORM_CALENDARS = ("standard", "gregorian")
+_REFORM = datetime.datetime(1582, 10, 15)
+
+#: The months which begin each calendar period of TimeOrigin.period_bounds.
+PERIODS = {
+    "month": tuple(range(1, 13)),
+    "season": (3, 6, 9, 12),
+    "year": (1,),
+}
+
+#: The DateCache of the dates decoded by cf_units.Unit.num2date, or None if
+#: decoded dates are not cached. See cf_units.enable_date_cache.
+cache = None
+
+
+class TimeOrigin:
+    """The origin and interval of a cftime unit string, and calendar.
+
+    Args:
+
+    * unit (string):
+        A cftime unit string, of the form '<time-unit> since <time-origin>'.
+    * calendar (string):
+        The name of the calendar.
+
+    """
+
+    __slots__ = ("basedate", "calendar", "factor", "interval", "pybasedate", "unit")
+
+    def __init__(self, unit, calendar):
+        self.unit = unit
+        self.calendar = calendar
+        #: The origin, as a calendar specific cftime.datetime, including any
+        #: time zone offset of the unit string.
+        self.basedate = cftime.num2date(0, unit, calendar)
+        #: The length of one time unit, as a datetime.timedelta.
+        self.interval = cftime.num2date(1, unit, calendar) - self.basedate
+        #: The length of one time unit, in microseconds.
+        self.factor = self.interval // _MICROSECOND
+        #: The origin as a datetime.datetime, or None if the origin or the
+        #: calendar cannot be represented by one.
+        try:
+            self.pybasedate = cftime.num2pydate(0, unit, calendar)
+        except ValueError:
+            self.pybasedate = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.unit!r}, {self.calendar!r})"
+
+    def _scalar_microseconds(self, time):
+        # Return the time as integer microseconds since the origin, as for
+        # _microseconds, avoiding the overhead of numpy for a single value.
+        if isinstance(time, float):
+            scaled = self.factor * np.longdouble(time)
+            if scaled < _MIN_INT64 or scaled > _MAX_INT64:
+                raise OverflowError(
+                    "time values outside range of 64 bit signed integers"
+                )
+            result = int(np.rint(scaled))
+            if self.factor not in _SUBSECOND_FACTORS:
+                remainder = result % _SECOND
+                if remainder == 1:
+                    result = int(np.floor(scaled))
+                elif remainder == _SECOND - 1:
+                    result = int(np.ceil(scaled))
+            return result
+        result = int(time) * self.factor
+        if result < _MIN_INT64 or result > _MAX_INT64:
+            raise OverflowError("time values outside range of 64 bit signed integers")
+        return result
+
+    def _microseconds(self, times):
+        # Return the times as integer microseconds since the origin, as
+        # cftime.num2date rounds them.
+        if times.dtype.kind == "f":
+            scaled = self.factor * times.astype(np.longdouble)
+            if scaled.size and (scaled.min() < _MIN_INT64 or scaled.max() > _MAX_INT64):
+                raise OverflowError(
+                    "time values outside range of 64 bit signed integers"
+                )
+            result = np.rint(scaled).astype(np.int64)
+            if self.factor not in _SUBSECOND_FACTORS:
+                # cftime rounds to the second values within a microsecond.
+                remainder = result % _SECOND
+                below = remainder == 1
+                above = remainder == _SECOND - 1
+                if below.any() or above.any():
+                    result = np.where(below, np.floor(scaled).astype(np.int64), result)
+                    result = np.where(above, np.ceil(scaled).astype(np.int64), result)
+            return result
+        times = times.astype(np.int64)
+        if times.size and (
+            np.min(times).item() * self.factor < _MIN_INT64
+            or np.max(times).item() * self.factor > _MAX_INT64
+        ):
+            raise OverflowError("time values outside range of 64 bit signed integers")
+        return times * self.factor
+
+    def num2date(
+        self, times, only_use_cftime_datetimes=True, only_use_python_datetimes=False
+    ):
+        """Return the dates of the time values, as :func:`cftime.num2date`."""
+        use_python_datetime = not only_use_cftime_datetimes and (
+            only_use_python_datetimes or self.pybasedate is not None
+        )
+        if use_python_datetime and self.pybasedate is None:
+            raise ValueError("illegal calendar or reference date for python datetime")
+        values = np.asanyarray(times)
+        scalar = values.item() if values.ndim == 0 else None
+        if (
+            np.ma.isMaskedArray(values)
+            or values.dtype.kind not in "biuf"
+            or not (
+                math.isfinite(scalar) if values.ndim == 0 else np.isfinite(values).all()
+            )
+        ):
+            return cftime.num2date(
+                times,
+                self.unit,
+                self.calendar,
+                only_use_cftime_datetimes=only_use_cftime_datetimes,
+                only_use_python_datetimes=only_use_python_datetimes,
+            )
+        basedate = self.pybasedate if use_python_datetime else self.basedate
+        if values.ndim == 0:
+            microseconds = self._scalar_microseconds(scalar)
+        else:
+            microseconds = self._microseconds(values)
+        try:
+            if values.ndim == 0:
+                return basedate + datetime.timedelta(microseconds=microseconds)
+            if microseconds.size == 0:
+                return basedate + microseconds.astype("timedelta64[us]").astype(
+                    datetime.timedelta
+                )
+            return _decode(microseconds, basedate)
+        except OverflowError:
+            raise ValueError(
+                "OverflowError in datetime, possibly because year < datetime.MINYEAR"
+            ) from None
+
+    def date2num(self, dates):
+        """Return the time values of the dates, as :func:`cftime.date2num`."""
+        try:
+            dates[0]
+        except Exception:  # noqa: BLE001
+            if not dates:
+                return np.array([], dtype=float)
+            scalar = True
+        else:
+            scalar = False
+        values = np.asanyarray(dates)
+        if np.ma.isMaskedArray(values) or values.dtype.kind != "O":
+            return cftime.date2num(dates, self.unit, self.calendar)
+        basedate = self.basedate
+        reform = self.calendar in _REFORM_CALENDARS
+        interval = self.interval
+        times = []
+        for item in values.flat:
+            date = item
+            if not (
+                isinstance(item, cftime.datetime)
+                and item.calendar == basedate.calendar
+                and item.has_year_zero == basedate.has_year_zero
+            ):
+                if isinstance(item, datetime.datetime) and (
+                    item.tzinfo is not None or (reform and item < _REFORM)
+                ):
+                    # Versions of cftime differ in their handling of these.
+                    return cftime.date2num(dates, self.unit, self.calendar)
+                date = self._as_date(item)
+            delta = date - basedate
+            if delta % interval:
+                times.append(delta / interval)
+            else:
+                times.append(np.int64(delta // interval))
+        if scalar:
+            return times[0]
+        return np.reshape(np.array(times), values.shape)
+
+    def _as_date(self, date):
+        # Return the date as a cftime.datetime of the calendar of the origin.
+        basedate = self.basedate
+        return type(basedate)(
+            date.year,
+            date.month,
+            date.day,
+            date.hour,
+            date.minute,
+            date.second,
+            date.microsecond,
+            calendar=basedate.calendar,
+            has_year_zero=basedate.has_year_zero,
+        )
+
+    def _date_microseconds(self, date):
+        # Return the date as integer microseconds since the origin.
+        basedate = self.basedate
+        if isinstance(date, datetime.datetime) and date.tzinfo is not None:
+            date = date.replace(tzinfo=None) - date.utcoffset()
+        if not (
+            isinstance(date, cftime.datetime)
+            and date.calendar == basedate.calendar
+            and date.has_year_zero == basedate.has_year_zero
+        ):
+            date = self._as_date(date)
+        return (date - basedate) // _MICROSECOND
+
+    def range(self, start, stop, step):
+        """Return the time values of the dates from the start date, by the
+        step, up to but excluding the stop date.
+
+        Args:
+
+        * start (datetime):
+            The first date.
+        * stop (datetime):
+            The date which ends the range.
+        * step (datetime.timedelta):
+            The non-zero interval between the dates.
+
+        """
+        first = self._date_microseconds(start)
+        last = self._date_microseconds(stop)
+        step = step // _MICROSECOND
+        if step == 0:
+            raise ValueError("The step must be at least one microsecond.")
+        count = max(0, -((first - last) // step))
+        end = first + step * max(count - 1, 0)
+        if not _MIN_INT64 <= min(first, end) <= max(first, end) <= _MAX_INT64:
+            raise OverflowError("time values outside range of 64 bit signed integers")
+        microseconds = first + step * np.arange(count, dtype=np.int64)
+        if first % self.factor == 0 and step % self.factor == 0:
+            return microseconds // self.factor
+        # The whole time units and their fractions are converted separately,
+        # as microseconds beyond 2**53 are not exactly representable.
+        whole, fraction = np.divmod(microseconds, self.factor)
+        return whole + fraction / self.factor
+
+    def period_bounds(self, times, period):
+        """Return the time values of the start and end of the calendar
+        period of each time value.
+
+        Args:
+
+        * times:
+            The numeric time values.
+        * period (string):
+            One of the names of :data:`PERIODS`.
+
+        """
+        try:
+            months = PERIODS[period]
+        except KeyError:
+            raise ValueError(
+                f"Unknown period {period!r}, expected one of {sorted(PERIODS)}."
+            ) from None
+        values = np.asarray(times)
+        if values.dtype.kind not in "biuf":
+            raise TypeError(f"Expected numeric time values, got {values.dtype}.")
+        if values.size == 0:
+            return np.empty((*values.shape, 2), dtype=values.dtype)
+        if not np.isfinite(values).all():
+            raise ValueError("Expected finite time values.")
+        # Only the first and last dates are decoded, to find the years of
+        # the edges of the periods. The periods of all the time values are
+        # then found by a binary search of the encoded edges.
+        first = self.num2date(values.min().item())
+        last = self.num2date(values.max().item())
+        basedate = self.basedate
+        date_type = type(basedate)
+        # The edges span the years before and after those of the dates,
+        # which step over year zero in calendars without it.
+        lower, upper = first.year - 1, last.year + 1
+        if not basedate.has_year_zero:
+            if lower == 0:
+                lower = -1
+            if upper == 0:
+                upper = 1
+        with warnings.catch_warnings():
+            # cftime warns of the year before year 1, which is not in CF
+            # calendars without year zero, but is only used as an edge.
+            warnings.simplefilter("ignore", cftime.CFWarning)
+            edges = self.date2num(
+                [
+                    date_type(
+                        year,
+                        month,
+                        1,
+                        calendar=basedate.calendar,
+                        has_year_zero=basedate.has_year_zero,
+                    )
+                    for year in range(lower, upper + 1)
+                    if year or basedate.has_year_zero
+                    for month in months
+                ]
+            )
+        index = np.searchsorted(edges, values, side="right")
+        # Each time value is within the edges, so no index wraps around.
+        assert index.min() > 0
+        assert index.max() < len(edges)
+        return np.stack([edges[index - 1], edges[index]], axis=-1)
+
+
+class DateCache:
+    """A bounded, least recently used cache of the dates of arrays of time
+    values, keyed by the time origin, the content of the time values and
+    the output options of num2date.
+
+    Args:
+
+    * max_dates (int):
+        The maximum total number of dates held by the cache.
+
+    """
+
+    def __init__(self, max_dates):
+        self.max_dates = max_dates
+        self._dates = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.max_dates!r})"
+
+    @staticmethod
+    def key(origin, times, options):
+        """Return the key of the time values, or None if they are not a
+        plain numeric array which may be cached.
+
+        """
+        if (
+            type(times) is not np.ndarray
+            or times.ndim == 0
+            or times.dtype.kind not in "biuf"
+        ):
+            return None
+        digest = hashlib.blake2b(np.ascontiguousarray(times).data, digest_size=16)
+        return (
+            origin.unit,
+            origin.calendar,
+            times.dtype.str,
+            times.shape,
+            digest.digest(),
+            options,
+        )
+
+    def get(self, key):
+        """Return the read-only dates of the key, or None if not cached."""
+        with self._lock:
+            dates = self._entries.get(key)
+            if dates is not None:
+                self._entries.move_to_end(key)
+            return dates
+
+    def put(self, key, dates):
+        """Cache the dates of the key, and return them.
+
+        Cached dates are made read-only, as they are shared by every hit.
+        Dates too many to cache are returned unchanged.
+
+        """
+        if dates.size > self.max_dates:
+            return dates
+        dates.flags.writeable = False
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._dates -= previous.size
+            self._entries[key] = dates
+            self._dates += dates.size
+            while self._dates > self.max_dates:
+                _, evicted = self._entries.popitem(last=False)
+                self._dates -= evicted.size
+        return dates
+
+
+def _decode(microseconds, basedate):
+    # Return the dates of an array of microseconds since the base date.
+    # As for cftime, the dates are decoded in order, each relative to the
+    # previous date, to minimise the length of the timedeltas added.
+    order = np.argsort(microseconds, axis=None)
+    ordered = microseconds.ravel()[order]
+    date = basedate + datetime.timedelta(microseconds=int(ordered[0]))
+    dates = [date]
+    for step in np.diff(ordered).astype("timedelta64[us]").tolist():
+        date = date + step
+        dates.append(date)
+    result = np.empty(ordered.shape, dtype=object)
+    result[order] = dates
+    return result.reshape(microseconds.shape)
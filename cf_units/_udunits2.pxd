@@ -62,17 +62,17 @@ cdef extern from "udunits2.h":
 
     int ut_format(ut_unit* unit, char* buf, size_t size, unsigned opts)
 
-    double ut_encode_date(int year, int month, int day)
+    double ut_encode_date(int year, int month, int day) nogil
 
-    double ut_encode_clock(int hours, int minutes, double seconds)
+    double ut_encode_clock(int hours, int minutes, double seconds) nogil
 
     double ut_encode_time(int year, int month, int day,
-                          int hour, int minute, double second)
+                          int hour, int minute, double second) nogil
 
     void ut_decode_time(double value,
                         int* year, int* month, int* day,
                         int* hour, int* minute, double* second,
-                        double* resolution)
+                        double* resolution) nogil
 
     ut_status ut_get_status()
 
@@ -84,8 +84,8 @@ cdef extern from "udunits2.h":
 
     double cv_convert_double(cv_converter* converter, double value)
 
-    float* cv_convert_floats(cv_converter* converter, float* in_, size_t count, float* out)
+    float* cv_convert_floats(cv_converter* converter, float* in_, size_t count, float* out) nogil
 
-    double* cv_convert_doubles(cv_converter* converter, double* const in_, size_t count, double* out)
+    double* cv_convert_doubles(cv_converter* converter, double* const in_, size_t count, double* out) nogil
 
     void cv_free(cv_converter* conv)
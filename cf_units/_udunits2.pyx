@@ -16,6 +16,7 @@ See also: `UDUNITS-2
 
 import numpy as np
 
+cimport cython
 cimport numpy as np
 from libc cimport errno, string
 
@@ -285,6 +286,49 @@ def decode_time(double value):
                    &resolution)
     return (year, month, day, hour, minute, second, resolution)
 
+# The array encodings and decodings apply the scalar ones to each element
+# of one-dimensional arrays of equal length, without the GIL.
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def encode_dates(const int[:] year, const int[:] month, const int[:] day,
+                 double[:] out):
+    cdef Py_ssize_t i
+    with nogil:
+        for i in range(out.shape[0]):
+            out[i] = ut_encode_date(year[i], month[i], day[i])
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def encode_clocks(const int[:] hours, const int[:] minutes,
+                  const double[:] seconds, double[:] out):
+    cdef Py_ssize_t i
+    with nogil:
+        for i in range(out.shape[0]):
+            out[i] = ut_encode_clock(hours[i], minutes[i], seconds[i])
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def encode_times(const int[:] year, const int[:] month, const int[:] day,
+                 const int[:] hour, const int[:] minute,
+                 const double[:] second, double[:] out):
+    cdef Py_ssize_t i
+    with nogil:
+        for i in range(out.shape[0]):
+            out[i] = ut_encode_time(year[i], month[i], day[i],
+                                    hour[i], minute[i], second[i])
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def decode_times(const double[:] value, int[:] year, int[:] month,
+                 int[:] day, int[:] hour, int[:] minute, double[:] second,
+                 double[:] resolution):
+    cdef Py_ssize_t i
+    with nogil:
+        for i in range(value.shape[0]):
+            ut_decode_time(value[i], &year[i], &month[i], &day[i], &hour[i],
+                           &minute[i], &second[i], &resolution[i])
+
 def set_error_message_handler(ErrorMessageHandler handler):
     cdef ErrorMessageHandler result = ErrorMessageHandler()
     result.chandler = ut_set_error_message_handler(handler.chandler)
@@ -293,13 +337,26 @@ def set_error_message_handler(ErrorMessageHandler handler):
 def convert_float(Converter converter, float value):
     return cv_convert_float(converter.cconverter, value)
 
+# The array conversions only read the converter, so they release the GIL
+# and may be applied from several threads at once.
+
 def convert_floats(Converter converter, np.ndarray[np.float32_t] in_, np.ndarray[np.float32_t] out):
-    cv_convert_floats(converter.cconverter, <float*> in_.data, in_.size, <float*> out.data)
+    cdef cv_converter* cconverter = converter.cconverter
+    cdef float* cin = <float*> in_.data
+    cdef float* cout = <float*> out.data
+    cdef size_t count = in_.size
+    with nogil:
+        cv_convert_floats(cconverter, cin, count, cout)
     return out
 
 def convert_double(Converter converter, double value):
     return cv_convert_double(converter.cconverter, value)
 
 def convert_doubles(Converter converter, np.ndarray[np.float64_t] in_, np.ndarray[np.float64_t] out):
-    cv_convert_doubles(converter.cconverter, <double*> in_.data, in_.size, <double*> out.data)
+    cdef cv_converter* cconverter = converter.cconverter
+    cdef double* cin = <double*> in_.data
+    cdef double* cout = <double*> out.data
+    cdef size_t count = in_.size
+    with nogil:
+        cv_convert_doubles(cconverter, cin, count, cout)
     return out
@@ -3,9 +3,10 @@
 # This file is part of cf-units and is released under the BSD license.
 # See LICENSE in the root of the repository for full licensing details.
 
-import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
-from . import graph
+from . import graph, recursive_descent
 from ._antlr4_runtime import (
     CommonTokenStream,
     InputStream,
@@ -16,6 +17,16 @@ from ._antlr4_runtime.error.ErrorListener import (
 from .parser.udunits2Lexer import udunits2Lexer
 from .parser.udunits2Parser import udunits2Parser
 from .parser.udunits2ParserVisitor import udunits2ParserVisitor
+from .recursive_descent import handle_UNICODE_EXPONENT
+
+#: The available parser implementations. "descent" is a hand-written
+#: recursive-descent parser, which is considerably faster than the reference
+#: "antlr" parser generated from the grammar, and which produces identical
+#: expression graphs.
+BACKENDS = ("descent", "antlr")
+
+#: The parser implementation used when no backend is specified.
+DEFAULT_BACKEND = "descent"
 
 # Dictionary mapping token rule id to token name.
 TOKEN_ID_NAMES = {
@@ -23,14 +34,6 @@ TOKEN_ID_NAMES = {
 }
 
 
-def handle_UNICODE_EXPONENT(string):
-    # Convert unicode to compatibility form, replacing unicode minus with
-    # ascii minus (which is actually a less good version
-    # of unicode minus).
-    normd = unicodedata.normalize("NFKC", string).replace("−", "-")
-    return int(normd)
-
-
 class UnitParseVisitor(udunits2ParserVisitor):
     """A visitor which converts the parse tree into an abstract expression graph."""
 
@@ -186,17 +189,86 @@ def _debug_tokens(unit_string):
         print(f"{token.text}: {rule}")
 
 
-def normalize(unit_string):
+def normalize(unit_string, backend=None):
     """Parse the given unit string, and return its string representation.
 
     No standardisation of units, nor simplification of expressions is done,
     but some tokens and operators will be converted to their canonical form.
 
     """
-    return str(parse(unit_string))
+    return str(parse(unit_string, backend=backend))
+
+
+def normalize_many(unit_strings, backend=None, processes=None):
+    """Return the normalized form of each of the given unit strings.
+
+    The batch equivalent of :func:`normalize`: each distinct unit string is
+    parsed only once, and the results are returned as a list in the same
+    order as the input. If ``processes`` is greater than one, the distinct
+    unit strings are shared between a pool of that many worker processes.
+
+    """
+    return _map_unique(
+        partial(_normalize_unique, backend=backend), unit_strings, processes
+    )
 
 
-def parse(unit_str):
+def _normalize_unique(unit_strings, backend=None):
+    return [normalize(unit_str, backend=backend) for unit_str in unit_strings]
+
+
+def _map_unique(batch_func, unit_strings, processes=None):
+    """Apply a batch function to the distinct unit strings of an iterable.
+
+    The ``batch_func`` is given a list of distinct unit strings, and must
+    return a list of results of the same length. The result for each of
+    the given ``unit_strings`` is returned, in input order.
+
+    If ``processes`` is greater than one, the distinct unit strings are
+    split into chunks which are processed by a pool of that many worker
+    processes, in which case ``batch_func`` must be picklable.
+
+    """
+    unit_strings = list(unit_strings)
+    unique = list(dict.fromkeys(unit_strings))
+    if processes is not None and processes > 1 and len(unique) > 1:
+        # Several chunks per worker, to balance the load.
+        n_chunks = min(len(unique), processes * 4)
+        chunks = [unique[i::n_chunks] for i in range(n_chunks)]
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            chunk_results = list(executor.map(batch_func, chunks))
+        lookup = {}
+        for chunk, results in zip(chunks, chunk_results, strict=True):
+            lookup.update(zip(chunk, results, strict=True))
+    else:
+        lookup = dict(zip(unique, batch_func(unique), strict=True))
+    return [lookup[unit_str] for unit_str in unit_strings]
+
+
+def parse(unit_str, backend=None):
+    """Parse the given unit string, and return its expression graph.
+
+    The ``backend`` may be any of :data:`BACKENDS`, and defaults to
+    :data:`DEFAULT_BACKEND`. A SyntaxError is raised if the unit string is
+    not valid.
+
+    """
+    if backend is None:
+        backend = DEFAULT_BACKEND
+    if backend not in BACKENDS:
+        msg = f"Unknown parser backend {backend!r}, expected one of {BACKENDS}."
+        raise ValueError(msg)
+    if backend == "descent":
+        try:
+            return recursive_descent.parse(unit_str)
+        except recursive_descent.ParseError:
+            # The recursive-descent parser makes no attempt at error
+            # reporting, so defer to ANTLR for a well-formed SyntaxError.
+            pass
+    return _antlr_parse(unit_str)
+
+
+def _antlr_parse(unit_str):
     # The udunits2 definition (C code) says to strip the unit string
     # first.
     unit_str = unit_str.strip()
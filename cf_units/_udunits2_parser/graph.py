@@ -3,36 +3,113 @@
 # This file is part of cf-units and is released under the BSD license.
 # See LICENSE in the root of the repository for full licensing details.
 
+# Nodes are immutable, so their attributes must be set via the base class.
+_setattr = object.__setattr__
+
 
 class Node:
-    """Represents a node in an expression graph."""
+    """Represents a node in an expression graph.
+
+    A generic node holds arbitrary keyword attributes. The concrete node types
+    of the expression graph instead declare a fixed ``__slots__`` layout, and
+    name their attributes (in order) in ``_fields``.
+
+    Nodes are immutable, and compare and hash by structure, so that equivalent
+    expression graphs may be used interchangeably (e.g. as dictionary keys).
+
+    """
+
+    __slots__ = ("_attrs", "_hash")
+
+    #: The names of the attributes of a node with a fixed layout.
+    _fields = ()
 
     def __init__(self, **kwargs):
-        self._attrs = kwargs
+        _setattr(self, "_attrs", kwargs)
+
+    def _items(self):
+        # Return the (name, value) pairs of the node's attributes, in order.
+        if self._fields:
+            return [(name, getattr(self, name)) for name in self._fields]
+        return list(self._attrs.items())
 
     def children(self):
         """Return the children of this node."""
         # Since this is py>=36, the order of the attributes is well defined.
-        return list(self._attrs.values())
+        return [value for _, value in self._items()]
 
     def __getattr__(self, name):
+        # Only called when normal attribute lookup fails, i.e. for the
+        # keyword attributes of a generic Node.
+        try:
+            attrs = object.__getattribute__(self, "_attrs")
+        except AttributeError:
+            msg = f"{type(self).__name__!r} object has no attribute {name!r}"
+            raise AttributeError(msg) from None
         # Allow the dictionary to raise KeyError if the key doesn't exist.
-        return self._attrs[name]
+        return attrs[name]
+
+    # Prevent attribute updates
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Instances of {type(self).__name__:s} are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Instances of {type(self).__name__:s} are immutable")
+
+    # Provide structural equality and hash semantics
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, Node):
+            return NotImplemented
+        return type(self) is type(other) and self._items() == other._items()
+
+    def __hash__(self):
+        # The hash is cached, as nodes are immutable and hashing a graph
+        # would otherwise visit every node below it.
+        try:
+            result = object.__getattribute__(self, "_hash")
+        except AttributeError:
+            values = tuple(value for _, value in self._items())
+            result = hash((type(self), values))
+            _setattr(self, "_hash", result)
+        return result
+
+    def __reduce__(self):
+        if self._fields:
+            return type(self), tuple(value for _, value in self._items())
+        return _new_node, (type(self), self._attrs)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
     def _repr_ctx(self):
         # Return a dictionary that is useful for passing to string.format.
-        kwargs = ", ".join(f"{key}={value!r}" for key, value in self._attrs.items())
+        kwargs = ", ".join(f"{key}={value!r}" for key, value in self._items())
         return {"cls_name": self.__class__.__name__, "kwargs": kwargs}
 
     def __repr__(self):
         return "{cls_name}({kwargs})".format(**self._repr_ctx())
 
 
+def _new_node(cls, attrs):
+    # Unpickle a generic keyword-attribute Node.
+    return cls(**attrs)
+
+
 class Terminal(Node):
     """A generic terminal node in an expression graph."""
 
+    __slots__ = ("content",)
+    _fields = ("content",)
+
     def __init__(self, content):
-        super().__init__(content=content)
+        _setattr(self, "content", content)
 
     def children(self):
         return []
@@ -42,41 +119,63 @@ class Terminal(Node):
 
 
 class Operand(Terminal):
-    pass
+    __slots__ = ()
 
 
 class Number(Terminal):
-    pass
+    __slots__ = ()
 
 
 class Identifier(Terminal):
     """The unit itself (e.g. meters, m, km and π)"""
 
+    __slots__ = ()
+
 
 class BinaryOp(Node):
+    __slots__ = ("lhs", "rhs")
+    _fields = ("lhs", "rhs")
+
     def __init__(self, lhs, rhs):
-        super().__init__(lhs=lhs, rhs=rhs)
+        _setattr(self, "lhs", lhs)
+        _setattr(self, "rhs", rhs)
+
+    def children(self):
+        return [self.lhs, self.rhs]
 
 
 class Raise(BinaryOp):
+    __slots__ = ()
+
     def __str__(self):
         return f"{self.lhs}^{self.rhs}"
 
 
 class Multiply(BinaryOp):
+    __slots__ = ()
+
     def __str__(self):
         return f"{self.lhs}·{self.rhs}"
 
 
 class Divide(BinaryOp):
+    __slots__ = ()
+
     def __str__(self):
         return f"{self.lhs}/{self.rhs}"
 
 
 class Shift(Node):
+    __slots__ = ("shift_from", "unit")
+    _fields = ("unit", "shift_from")
+
     def __init__(self, unit, shift_from):
         # The product unit to be shifted.
-        super().__init__(unit=unit, shift_from=shift_from)
+        _setattr(self, "unit", unit)
+        _setattr(self, "shift_from", shift_from)
+
+    def children(self):
+        return [self.unit, self.shift_from]
 
     def __str__(self):
         return f"({self.unit} @ {self.shift_from})"
@@ -86,7 +185,55 @@ class Timestamp(Terminal):
     # Currently we do not try to interpret the timestamp.
     # This is likely to change in the future, but there are some
     # gnarly test cases, and should not be undertaken lightly.
-    pass
+    __slots__ = ()
+
+
+class Interner:
+    """A hash-consing table for expression graphs.
+
+    Interning a graph returns a structurally equal graph, in which every node
+    is the canonical instance held by the table. Identical subtrees (such as
+    ``m``, ``s-1`` or ``kg``) are therefore shared between all of the graphs
+    interned by the same table.
+
+    For example:
+
+        >>> from cf_units._udunits2_parser import parse
+        >>> interner = Interner()
+        >>> a = interner.intern(parse("kg m-2"))
+        >>> b = interner.intern(parse("kg.m^-2"))
+        >>> a is b
+        True
+
+    """
+
+    def __init__(self):
+        self._nodes = {}
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def clear(self):
+        """Remove all of the interned nodes."""
+        self._nodes.clear()
+
+    def intern(self, node):
+        """Return the canonical instance of the given node."""
+        result = self._nodes.get(node)
+        if result is None:
+            if node._fields:
+                # Intern the children, rebuilding the node only if needed.
+                children = node.children()
+                interned = [
+                    self.intern(child) if isinstance(child, Node) else child
+                    for child in children
+                ]
+                if any(
+                    new is not old for new, old in zip(interned, children, strict=True)
+                ):
+                    node = type(node)(*interned)
+            self._nodes[node] = result = node
+        return result
 
 
 class Visitor:
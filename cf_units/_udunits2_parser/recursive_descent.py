@@ -0,0 +1,392 @@
+# Copyright cf-units contributors
+#
+# This file is part of cf-units and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""A hand-written lexer and recursive-descent parser for the UDUNITS-2 grammar.
+
+This is a drop-in alternative to the ANTLR generated parser, producing
+identical :mod:`~cf_units._udunits2_parser.graph` trees for every input that
+the ANTLR parser accepts. It exists purely for speed: the vendored ANTLR
+runtime is a general purpose (and pure Python) adaptive LL(*) implementation,
+which is a lot of machinery for such a small grammar.
+
+The lexer mirrors the modal lexer defined in ``udunits2Lexer.g4.jinja``,
+including its longest-match and rule-priority semantics. The parser mirrors
+``udunits2Parser.g4``, resolving the grammar's ambiguities in the same way as
+ANTLR (i.e. choosing the first alternative which leads to a successful parse).
+
+No attempt is made to reproduce ANTLR's error reporting. Instead a
+:class:`ParseError` is raised, and it is expected that the caller will defer
+to the reference ANTLR implementation to produce a helpful
+:class:`SyntaxError`.
+
+"""
+
+import re
+import unicodedata
+
+from . import graph
+
+
+class ParseError(Exception):
+    """The unit string is not valid under the UDUNITS-2 grammar."""
+
+
+########################################################################
+#
+# Lexer
+#
+########################################################################
+
+# Lexer modes (see udunits2Lexer.g4.jinja).
+DEFAULT_MODE, SHIFT_MODE, ID_SEEN = range(3)
+
+EOF = "EOF"
+
+_LATIN_SUBSET = "À-ÖØ-öø-ÿ\u0080­°µπΩ"
+
+_HOUR = r"(?:[+-]?[01]?[0-9]|2[0-3])"
+_MINUTE = r"[0-5]?[0-9]"
+_SECOND = rf"(?:{_MINUTE}|60)(?:\.[0-9]*)?"
+_MONTH = r"(?:0?[1-9]|1[0-2])"
+_DAY = r"(?:0?[1-9]|[12][0-9]|30|31)"
+_YEAR = r"[+-]?[0-9]+"
+_CLOCK = rf"{_HOUR}(?:{_MINUTE}(?:{_SECOND})?)?"
+_DATE = rf"{_YEAR}-{_MONTH}(?:-{_DAY})?"
+
+
+def _greedy(pattern):
+    # A matcher for rules whose greedy regular expression match is also the
+    # longest possible match.
+    match = re.compile(pattern, re.DOTALL).match
+
+    def matcher(string, pos):
+        found = match(string, pos)
+        return found.end() if found else -1
+
+    return matcher
+
+
+def _longest(pattern, required):
+    # A matcher for rules where a greedy (backtracking) match may not be the
+    # longest match, as is the case with the many optional digit groups of
+    # the timestamp tokens. The candidate span is bounded by the characters
+    # the rule can contain, and the longest full match is searched for.
+    fullmatch = re.compile(pattern).fullmatch
+    span = re.compile(r"[-+0-9:.T]+").match
+
+    def matcher(string, pos):
+        found = span(string, pos)
+        if found and required in found.group():
+            # The shortest possible match ends with the required character.
+            stop = pos + found.group().index(required)
+            for end in range(found.end(), stop, -1):
+                if fullmatch(string, pos, end):
+                    return end
+        return -1
+
+    return matcher
+
+
+# The DEFAULT_MODE lexer rules, in priority order. Each rule is
+# ``(kind, first_chars, matcher)``, where ``kind`` is the token type and
+# ``first_chars`` is a regular expression character class of the characters
+# the token may start with.
+_DEFAULT_RULES = [
+    ("SIGNED_INT", "+-", _greedy(r"[+-][0-9]+")),
+    ("PLUS", "+", _greedy(r"\+")),
+    ("MULTIPLY", "*·-", _greedy(r"[*·-]")),
+    ("DIVIDE", " /", _greedy(r" *(?:/| PER | per ) *")),
+    ("PERIOD", ".", _greedy(r"\.")),
+    ("OPEN_PAREN", "(", _greedy(r"\(")),
+    ("CLOSE_PAREN", ")", _greedy(r"\)")),
+    ("SEMICOLON", ":", _greedy(r":")),
+    ("INT", "0-9", _greedy(r"[0-9]+")),
+    ("E_POWER", "Ee", _greedy(r"[Ee][+-]?[0-9]+")),
+    (
+        "FLOAT",
+        "+\\-.0-9",
+        _greedy(
+            r"(?:[+-]?[0-9]+\.[0-9]*|\.[0-9]+)(?:[Ee][+-]?[0-9]+)?"
+            r"|[+-]?[0-9]+[Ee][+-]?[0-9]+"
+        ),
+    ),
+    ("SHIFT_OP", "@afsr", _greedy(r"@|after|from|since|ref")),
+    ("UNICODE_EXPONENT", "⁻⁺¹²³⁴⁵⁶⁷⁸⁹⁰", _greedy(r"[⁻⁺¹²³⁴⁵⁶⁷⁸⁹⁰]+")),
+    ("RAISE", "*^", _greedy(r"\^|\*\*")),
+    ("LOG", "l", _greedy(r"log|lg|ln|lb")),
+    ("LOGREF", "(", _greedy(r"\( *(?:RE|re):? *")),
+    ("ID", f"A-Za-z_{_LATIN_SUBSET}", _greedy(f"[A-Za-z_{_LATIN_SUBSET}]+")),
+    ("LATIN_SUBSET", _LATIN_SUBSET, _greedy(f"[{_LATIN_SUBSET}]")),
+    ("WS", " ", _greedy(" ")),
+    ("ERRORCHARACTER", None, _greedy(".")),
+]
+
+_SHIFT_RULES = [
+    ("TIMEZONE", "UZG", _greedy(r"UTC|Z|GMT")),
+    ("HOUR_MINUTE_SECOND", "+\\-0-9", _longest(f"{_HOUR}:{_MINUTE}:{_SECOND}", ":")),
+    ("HOUR_MINUTE", "+\\-0-9", _longest(f"{_HOUR}:{_MINUTE}", ":")),
+    ("M_MINUS", "-", _greedy("-")),
+    ("DATE", "+\\-0-9", _longest(_DATE, "-")),
+    (
+        "TIMESTAMP",
+        "+\\-0-9",
+        _longest(rf"{_YEAR}(?:{_MONTH}(?:{_DAY})?)?T{_CLOCK}", "T"),
+    ),
+    ("DT_T_CLOCK", "+\\-0-9", _longest(rf"{_DATE}T{_CLOCK}", "T")),
+    *_DEFAULT_RULES,
+]
+
+_ID_SEEN_RULES = [
+    ("SIGNED_INT", "+-", _greedy(r"[+-][0-9]+")),
+    # EXTRA_MULTIPLY.
+    ("MULTIPLY", ".-", _greedy(r"[.-]")),
+    *[rule for rule in _DEFAULT_RULES if rule[0] != "FLOAT"],
+]
+
+_MODE_RULES = {
+    DEFAULT_MODE: _DEFAULT_RULES,
+    SHIFT_MODE: _SHIFT_RULES,
+    ID_SEEN: _ID_SEEN_RULES,
+}
+
+# A cache of the candidate rules for a given (mode, first character).
+_CANDIDATES = {}
+
+
+def _candidates(mode, char):
+    key = (mode, char)
+    rules = _CANDIDATES.get(key)
+    if rules is None:
+        rules = tuple(
+            (kind, matcher)
+            for kind, first_chars, matcher in _MODE_RULES[mode]
+            if first_chars is None or re.match(f"[{first_chars}]", char)
+        )
+        _CANDIDATES[key] = rules
+    return rules
+
+
+def tokenize(unit_str):
+    """Return a list of ``(token_type, text)`` pairs for the given string.
+
+    The list is terminated by an ``EOF`` token.
+
+    """
+    tokens = []
+    mode = DEFAULT_MODE
+    pos = 0
+    length = len(unit_str)
+    while pos < length:
+        best_end = -1
+        best_type = None
+        # Longest match wins, with ties going to the first rule defined.
+        for kind, matcher in _candidates(mode, unit_str[pos]):
+            end = matcher(unit_str, pos)
+            if end > best_end:
+                best_end = end
+                best_type = kind
+        tokens.append((best_type, unit_str[pos:best_end]))
+        pos = best_end
+
+        # Lexer mode transitions. Note that lexer commands are only
+        # executed for the rule which matched, and not for the rules that
+        # it references.
+        if mode == DEFAULT_MODE:
+            if best_type == "ID":
+                mode = ID_SEEN
+            elif best_type == "SHIFT_OP":
+                mode = SHIFT_MODE
+        elif mode == ID_SEEN:
+            mode = DEFAULT_MODE
+    tokens.append((EOF, "<EOF>"))
+    return tokens
+
+
+########################################################################
+#
+# Parser
+#
+########################################################################
+
+_INTEGER = ("INT", "SIGNED_INT")
+_POWER_START = ("ID", "OPEN_PAREN", "INT", "SIGNED_INT", "FLOAT")
+_EXPONENT = ("RAISE", "UNICODE_EXPONENT")
+_SIGNED_CLOCK = ("HOUR_MINUTE_SECOND", "HOUR_MINUTE", "INT", "SIGNED_INT")
+_TIMEZONE_OFFSET = ("HOUR_MINUTE", "INT", "SIGNED_INT")
+_SHIFT_SPEC_END = (EOF, "CLOSE_PAREN")
+
+
+def handle_UNICODE_EXPONENT(string):
+    # Convert unicode to compatibility form, replacing unicode minus with
+    # ascii minus (which is actually a less good version
+    # of unicode minus).
+    normd = unicodedata.normalize("NFKC", string).replace("−", "-")
+    return int(normd)
+
+
+class Parser:
+    """Build an expression graph from the tokens of a unit string.
+
+    Each method corresponds to a rule of ``udunits2Parser.g4``, and returns
+    the graph node that the ``UnitParseVisitor`` would produce for it.
+
+    """
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+        # The ANTLR implementation builds the graph only once the whole
+        # input has been parsed, so any error from interpreting a token is
+        # held back until the input is known to be syntactically valid.
+        self._deferred_error = None
+
+    def _type(self, offset=0):
+        return self.tokens[self.pos + offset][0]
+
+    def _advance(self):
+        text = self.tokens[self.pos][1]
+        self.pos += 1
+        return text
+
+    def _expect(self, kinds):
+        if self._type() not in kinds:
+            raise ParseError(self.pos)
+        return self._advance()
+
+    def _optional_ws_then(self, kinds):
+        # Consume "WS? <one of kinds>", returning whether it matched.
+        offset = 1 if self._type() == "WS" else 0
+        if self._type(offset) in kinds:
+            self.pos += offset + 1
+            return True
+        return False
+
+    def unit_spec(self):
+        if self._type() == EOF:
+            return graph.Terminal("")
+        node = self.shift_spec()
+        self._expect((EOF,))
+        if self._deferred_error is not None:
+            raise self._deferred_error
+        return node
+
+    def shift_spec(self):
+        node = self.product()
+        offset = 1 if self._type() == "WS" else 0
+        if self._type(offset) == "SHIFT_OP":
+            self.pos += offset + 1
+            if self._type() == "WS":
+                self.pos += 1
+            # A lone INT is both a valid number and a valid timestamp, in
+            # which case the number alternative takes precedence.
+            kind = self._type()
+            if kind in ("SIGNED_INT", "FLOAT") or (
+                kind == "INT" and self._type(1) in _SHIFT_SPEC_END
+            ):
+                node = graph.Shift(node, self.number())
+            else:
+                node = graph.Shift(node, self.timestamp())
+        return node
+
+    def product(self):
+        node = self.power()
+        while True:
+            kind = self._type()
+            if kind in _POWER_START:
+                op_type = graph.Multiply
+            elif kind == "MULTIPLY":
+                op_type = graph.Multiply
+                self.pos += 1
+            elif kind == "DIVIDE":
+                op_type = graph.Divide
+                self.pos += 1
+            elif kind == "WS":
+                # "WS+ power" continues the product, otherwise the
+                # whitespace belongs to the enclosing shift_spec.
+                offset = 1
+                while self._type(offset) == "WS":
+                    offset += 1
+                if self._type(offset) not in _POWER_START:
+                    break
+                op_type = graph.Multiply
+                self.pos += offset
+            else:
+                break
+            node = op_type(node, self.power())
+        return node
+
+    def power(self):
+        node = self.basic_spec()
+        kind = self._type()
+        if kind in _INTEGER:
+            # Prefer "basic_spec integer", unless the integer is itself
+            # being raised to a power (e.g. "m2^3" is m·2^3), in which case
+            # the integer starts the next power of the product.
+            if self._type(1) not in _EXPONENT:
+                node = graph.Raise(node, self.integer())
+        elif kind == "RAISE":
+            self.pos += 1
+            node = graph.Raise(node, self.integer())
+        elif kind == "UNICODE_EXPONENT":
+            text = self._advance()
+            try:
+                exponent = handle_UNICODE_EXPONENT(text)
+            except ValueError as err:
+                self._deferred_error = self._deferred_error or err
+                exponent = None
+            node = graph.Raise(node, graph.Terminal(exponent))
+        return node
+
+    def basic_spec(self):
+        kind = self._type()
+        if kind == "ID":
+            node = graph.Identifier(self._advance())
+        elif kind == "OPEN_PAREN":
+            self.pos += 1
+            node = self.shift_spec()
+            self._expect(("CLOSE_PAREN",))
+        else:
+            node = self.number()
+        return node
+
+    def integer(self):
+        return graph.Number(int(self._expect(_INTEGER)))
+
+    def number(self):
+        if self._type() == "FLOAT":
+            # Preserve precision as str.
+            return graph.Number(self._advance())
+        return self.integer()
+
+    def timestamp(self):
+        start = self.pos
+        kind = self._type()
+        if kind in ("DATE", "INT"):
+            self.pos += 1
+            if self._optional_ws_then(_SIGNED_CLOCK):
+                self._optional_ws_then(_TIMEZONE_OFFSET)
+        elif kind == "DT_T_CLOCK":
+            self.pos += 1
+        elif kind == "TIMESTAMP":
+            self.pos += 1
+            if self._type() == "WS":
+                self.pos += 1
+            if self._type() in _TIMEZONE_OFFSET:
+                self.pos += 1
+        else:
+            raise ParseError(self.pos)
+        # For now, we simply amalgamate timestamps into a single Terminal.
+        content = "".join(text for _, text in self.tokens[start : self.pos])
+        return graph.Terminal(content)
+
+
+def parse(unit_str):
+    """Return the expression graph of the given unit string.
+
+    Raises a :class:`ParseError` if the unit string cannot be parsed.
+
+    """
+    # The udunits2 definition (C code) says to strip the unit string
+    # first.
+    return Parser(tokenize(unit_str.strip())).unit_spec()
@@ -0,0 +1,334 @@
+# Copyright cf-units contributors
+#
+# This file is part of cf-units and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Grouping, and bulk conversion, of many units by convertibility."""
+
+from collections import Counter
+import math
+
+import numpy as np
+
+from . import _LOG_REFERENCE, CALENDAR_STANDARD, Unit
+
+__all__ = ["ConversionPlan", "DimensionIndex"]
+
+
+def _as_unit(unit):
+    return unit if isinstance(unit, Unit) else Unit(unit)
+
+
+class DimensionIndex:
+    """An index of items, such as the variables of a dataset, by the
+    convertibility of their units.
+
+    Each unit is reduced to its :attr:`cf_units.Unit.dimensions`, together
+    with its unit system, its calendar and whether it is a time reference.
+    Units with equal reductions are convertible, so finding all the items
+    convertible to a unit is a single dictionary lookup, rather than a call
+    of :meth:`cf_units.Unit.is_convertible` for each item.
+
+    For example:
+
+        >>> from cf_units.dimensions import DimensionIndex
+        >>> index = DimensionIndex()
+        >>> index.add('air_pressure', 'hPa')
+        >>> index.add('air_temperature', 'K')
+        >>> index.add('surface_pressure', 'Pa')
+        >>> index.convertible_to('atm')
+        ['air_pressure', 'surface_pressure']
+
+    """
+
+    def __init__(self):
+        # The items of each group, keyed by the convertibility key.
+        self._groups = {}
+        # The convertibility key of each item.
+        self._keys = {}
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, item):
+        return item in self._keys
+
+    def __repr__(self):
+        return f"<{type(self).__name__} of {len(self)} items>"
+
+    def add(self, item, unit):
+        """Add an item with the given unit, replacing any existing entry.
+
+        Args:
+
+        * item:
+            The hashable item, such as a variable name.
+        * unit (string/Unit):
+            The unit of the item.
+
+        """
+        unit = _as_unit(unit)
+        self.discard(item)
+        key = unit._convertibility_key()
+        self._keys[item] = key
+        if key is not None:
+            self._groups.setdefault(key, {})[item] = unit
+
+    def discard(self, item):
+        """Remove the item, if present."""
+        key = self._keys.pop(item, None)
+        group = self._groups.get(key)
+        if group is not None:
+            del group[item]
+            if not group:
+                del self._groups[key]
+
+    def convertible_to(self, unit):
+        """Return the items whose units are convertible to the given unit.
+
+        Args:
+
+        * unit (string/Unit):
+            The unit to convert to.
+
+        Returns
+        -------
+            list of the items, in the order they were added.
+
+        """
+        unit = _as_unit(unit)
+        return list(self._groups.get(unit._convertibility_key(), ()))
+
+    def groups(self):
+        """Return the groups of items with mutually convertible units.
+
+        Items with unknown or no_unit units are not convertible to any
+        unit, so do not belong to any group.
+
+        Returns
+        -------
+            list of dicts, mapping each item of a group to its unit.
+
+        """
+        return [dict(group) for group in self._groups.values()]
+
+
+class _Linear:
+    # The conversion of values by the linear function scale * x + offset.
+    __slots__ = ("offset", "scale")
+
+    def __init__(self, scale, offset):
+        self.scale = scale
+        self.offset = offset
+
+    def __call__(self, values):
+        if not isinstance(values, np.ndarray):
+            return values * self.scale + self.offset
+        if not np.issubdtype(values.dtype, np.floating):
+            values = values.astype(np.float64)
+        ftype = values.dtype.type
+        result = values * ftype(self.scale)
+        if self.offset:
+            result += ftype(self.offset)
+        return result
+
+
+class _Fallback:
+    # The conversion of values which are not linearly related.
+    __slots__ = ("target", "unit")
+
+    def __init__(self, unit, target):
+        self.unit = unit
+        self.target = target
+
+    def __call__(self, values):
+        return self.unit.convert(values, self.target)
+
+
+def _identity(values):
+    return values
+
+
+def _is_logarithmic(unit):
+    return _LOG_REFERENCE.search(unit.definition) is not None
+
+
+def _linear(unit, target):
+    # Return the linear conversion from the unit to the target, or None if
+    # the conversion is not linear. Conversions between logarithmic and
+    # non-logarithmic units are not, and time references of calendars other
+    # than the standard calendar are converted by cftime, so are left to
+    # Unit.convert.
+    logarithmic = _is_logarithmic(unit)
+    if logarithmic != _is_logarithmic(target):
+        return None
+    if unit.is_time_reference() and unit.calendar != CALENDAR_STANDARD:
+        return None
+    offset = unit.convert(0.0, target)
+    if logarithmic:
+        scale = unit.convert(1.0, target) - offset
+    else:
+        # Multiplying by one drops the offset, or time origin, of a unit, so
+        # the scale is not subject to the rounding of the offset.
+        one = Unit("1", system=unit.system)
+        scale = (unit * one).convert(1.0, target * one)
+    # Units of reciprocal dimensions, such as s and Hz, are convertible but
+    # not linearly related, so the coefficients must reproduce another value.
+    value = unit.convert(2.0, target)
+    if not all(map(math.isfinite, (scale, offset, value))):
+        return None
+    if not math.isclose(value, 2.0 * scale + offset, rel_tol=1e-12):
+        return None
+    return _Linear(scale, offset)
+
+
+class ConversionPlan:
+    """The conversion of each of many units to a canonical unit of its
+    group of convertible units, such as when harmonising the variables of
+    many datasets.
+
+    The units are grouped by :meth:`cf_units.Unit.is_convertible`, and a
+    canonical unit is chosen for each group. This is the first of the given
+    canonical units that is convertible to the group or, failing that, the
+    most frequent unit of the group, which needs no conversion. The
+    conversion of each distinct unit is prepared up front, as a scale
+    factor and offset where it is linear, so that :meth:`converter` makes
+    no further UDUNITS-2 calls.
+
+    Units that are not convertible to any unit, such as unknown and no_unit,
+    are their own canonical units.
+
+    Args:
+
+    * units:
+        An iterable of the unit, as a string or :class:`cf_units.Unit`,
+        of each variable.
+
+    Kwargs:
+
+    * canonical:
+        An iterable of the preferred canonical units, as strings or
+        :class:`cf_units.Unit`.
+
+    For example:
+
+        >>> from cf_units.dimensions import ConversionPlan
+        >>> plan = ConversionPlan(['hPa', 'K', 'degC', 'Pa', 'Pa'])
+        >>> plan.canonical
+        (Unit('Pa'), Unit('K'))
+        >>> plan.coefficients('hPa')
+        (100.0, 0.0)
+        >>> plan = ConversionPlan(['hPa', 'K', 'degC'], canonical=['degC'])
+        >>> plan.target('K')
+        Unit('degC')
+        >>> plan.convert(300.0, 'K')
+        26.850000000000023
+
+    """
+
+    def __init__(self, units, canonical=()):
+        counts = Counter(units)
+        distinct = {}
+        for item, count in counts.items():
+            unit = _as_unit(item)
+            distinct[unit] = distinct.get(unit, 0) + count
+
+        preferred = {}
+        for unit in map(_as_unit, canonical):
+            preferred.setdefault(unit._convertibility_key() or unit, unit)
+
+        groups = {}
+        for unit in distinct:
+            groups.setdefault(unit._convertibility_key() or unit, []).append(unit)
+
+        targets = {}
+        converters = {}
+        for key, members in groups.items():
+            target = preferred.get(key)
+            if target is None:
+                target = max(members, key=distinct.__getitem__)
+            for unit in members:
+                targets[unit] = target
+                if unit == target:
+                    converters[unit] = _identity
+                else:
+                    converters[unit] = _linear(unit, target) or _Fallback(unit, target)
+        #: The canonical unit of each group, in order of first occurrence.
+        self.canonical = tuple(dict.fromkeys(targets.values()))
+        self._targets = targets
+        self._converters = converters
+
+    def __repr__(self):
+        return f"<{type(self).__name__} of {len(self._targets)} units>"
+
+    def _lookup(self, mapping, unit):
+        unit = _as_unit(unit)
+        try:
+            return mapping[unit]
+        except KeyError:
+            raise ValueError(f"The unit {unit!r} is not part of the plan.") from None
+
+    def target(self, unit):
+        """Return the canonical unit which the unit is converted to.
+
+        Args:
+
+        * unit (string/Unit):
+            One of the units of the plan.
+
+        """
+        return self._lookup(self._targets, unit)
+
+    def coefficients(self, unit):
+        """Return the linear coefficients of the conversion of the unit.
+
+        Args:
+
+        * unit (string/Unit):
+            One of the units of the plan.
+
+        Returns
+        -------
+            tuple of the (scale, offset) of the conversion of values from the
+            unit to its canonical unit, or None if the conversion is not
+            linear.
+
+        """
+        converter = self._lookup(self._converters, unit)
+        if converter is _identity:
+            return (1.0, 0.0)
+        if isinstance(converter, _Linear):
+            return (float(converter.scale), float(converter.offset))
+        return None
+
+    def converter(self, unit):
+        """Return the function converting values of the unit to its canonical
+        unit.
+
+        Look up the converter of each variable once, then apply it to the
+        values of the variable, as for :meth:`cf_units.Unit.convert`. Values
+        already in their canonical unit are returned unchanged.
+
+        Args:
+
+        * unit (string/Unit):
+            One of the units of the plan.
+
+        """
+        return self._lookup(self._converters, unit)
+
+    def convert(self, values, unit):
+        """Convert values of the unit to its canonical unit.
+
+        Args:
+
+        * values (int/float/numpy.ndarray):
+            The values to convert.
+        * unit (string/Unit):
+            One of the units of the plan.
+
+        Returns
+        -------
+            float or numpy.ndarray of the converted values.
+
+        """
+        return self.converter(unit)(values)
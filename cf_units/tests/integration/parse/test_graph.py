@@ -3,6 +3,11 @@
 # This file is part of cf-units and is released under the BSD license.
 # See LICENSE in the root of the repository for full licensing details.
 
+import copy
+import pickle
+
+import pytest
+
 from cf_units._udunits2_parser import parse
 import cf_units._udunits2_parser.graph as g
 
@@ -58,3 +63,63 @@ def test_large_graph():
     lhs, rhs = lhs.children()
     assert str(lhs) == "m"
     assert str(rhs) == "2"
+
+
+def test_slotted_nodes():
+    graph = parse("m2 s-1 @ 10")
+    nodes = [graph, *graph.children(), *graph.unit.children()]
+    for node in nodes:
+        assert not hasattr(node, "__dict__")
+    assert nodes[1].lhs is nodes[3]
+    assert nodes[3].lhs.content == "m"
+
+
+def test_slotted_node_repr():
+    node = g.Shift(g.Multiply(g.Identifier("m"), g.Number(2)), g.Number("1.5"))
+    expected = (
+        "Shift(unit=Multiply(lhs=Identifier(content='m'), rhs=Number(content=2)), "
+        "shift_from=Number(content='1.5'))"
+    )
+    assert repr(node) == expected
+
+
+def test_slotted_node_missing_attribute():
+    with pytest.raises(AttributeError, match="no attribute 'foo'"):
+        _ = g.Identifier("m").foo
+
+
+def test_structural_equality():
+    assert parse("kg m-2") == parse("kg.m^-2")
+    assert parse("kg m-2") != parse("kg m-3")
+    assert hash(parse("kg m-2")) == hash(parse("kg·m-2"))
+    # The node type is significant, not just the content.
+    assert g.Identifier("m") != g.Terminal("m")
+    assert g.Node(a=1, b=2) == g.Node(a=1, b=2)
+    assert g.Node(a=1, b=2) != g.Node(b=2, a=1)
+
+
+def test_immutable():
+    node = parse("m2")
+    with pytest.raises(AttributeError, match="immutable"):
+        node.lhs = g.Identifier("s")
+    with pytest.raises(AttributeError, match="immutable"):
+        del node.rhs
+
+
+def test_pickle_and_copy():
+    for node in [parse("m2/4.1.2π per second @ 10"), g.Node(a=1, kwarg="two")]:
+        assert pickle.loads(pickle.dumps(node)) == node  # noqa: S301
+        assert copy.deepcopy(node) is node
+
+
+def test_interner():
+    interner = g.Interner()
+    first = interner.intern(parse("kg·m-2·s-1"))
+    second = interner.intern(parse("(kg m-2) m"))
+    assert first == parse("kg m-2 s-1")
+    # The common "kg m-2" subtree is shared.
+    assert second.lhs is first.lhs
+    assert interner.intern(parse("kg·m-2·s-1")) is first
+    assert len(interner) == 10
+    interner.clear()
+    assert len(interner) == 0
@@ -7,7 +7,7 @@ import re
 import pytest
 
 import cf_units
-from cf_units._udunits2_parser import normalize
+from cf_units._udunits2_parser import normalize, normalize_many, parse
 
 testdata = [
     "",
@@ -292,3 +292,38 @@ def test_invalid_syntax_units(_, unit_str):
 
     with pytest.raises(SyntaxError):
         normalize(unit_str)
+
+
+@pytest.mark.parametrize(
+    "_, unit_str",
+    enumerate(testdata + [unit_str for unit_str, _ in not_udunits]),
+)
+def test_backends_equivalent(_, unit_str):
+    # The recursive-descent parser must produce exactly the same graph as
+    # the reference ANTLR parser.
+    expected = parse(unit_str, backend="antlr")
+    result = parse(unit_str, backend="descent")
+    assert repr(result) == repr(expected)
+    assert str(result) == str(expected)
+
+
+@pytest.mark.parametrize("_, unit_str", enumerate(invalid + not_allowed))
+def test_backends_invalid(_, unit_str):
+    with pytest.raises(SyntaxError):
+        parse(unit_str, backend="descent")
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError, match="Unknown parser backend"):
+        parse("m", backend="yacc")
+
+
+def test_normalize_many():
+    result = normalize_many(testdata * 2)
+    assert result == [normalize(unit_str) for unit_str in testdata * 2]
+
+
+def test_normalize_many_processes():
+    unit_strs = ["m2", "s since 1990-1-1", "m2", "kg m-2"]
+    expected = ["m^2", "(s @ 1990-1-1)", "m^2", "kg·m^-2"]
+    assert normalize_many(unit_strs, backend="antlr", processes=2) == expected
@@ -0,0 +1,92 @@
+# Copyright cf-units contributors
+#
+# This file is part of cf-units and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Test methods :meth:`cf_units.Unit.date_index` and
+:meth:`cf_units.Unit.date_slice`.
+
+"""
+
+import cftime
+import numpy as np
+import pytest
+
+import cf_units
+
+UNIT = cf_units.Unit("days since 2000-01-01", calendar="360_day")
+TIMES = np.arange(0.0, 100.0, 2.5)
+START = cftime.datetime(2000, 1, 11, calendar="360_day")
+STOP = cftime.datetime(2000, 2, 6, 12, calendar="360_day")
+
+
+def _expected(times, start=None, stop=None):
+    # The indices of the selected times, by decoding and comparing them.
+    dates = UNIT.num2date(times)
+    selected = np.ones(dates.shape, dtype=bool)
+    if start is not None:
+        selected &= dates >= start
+    if stop is not None:
+        selected &= dates < stop
+    return np.flatnonzero(selected)
+
+
+class Test_date_index:
+    def test_scalar(self):
+        assert UNIT.date_index(TIMES, START) == 4
+        assert UNIT.date_index(TIMES, START, side="right") == 5
+
+    def test_sequence(self):
+        result = UNIT.date_index(TIMES, [START, STOP])
+        np.testing.assert_array_equal(result, [4, 15])
+
+    def test_sorter(self):
+        times = np.array([30.0, 0.0, 20.0, 10.0])
+        result = UNIT.date_index(times, START, sorter=np.argsort(times))
+        assert result == 1
+
+
+class Test_date_slice:
+    @pytest.mark.parametrize(
+        ("start", "stop"), [(START, STOP), (None, STOP), (START, None), (None, None)]
+    )
+    def test_ascending(self, start, stop):
+        result = UNIT.date_slice(TIMES, start, stop)
+        assert isinstance(result, slice)
+        expected = _expected(TIMES, start, stop)
+        np.testing.assert_array_equal(np.arange(TIMES.size)[result], expected)
+
+    @pytest.mark.parametrize(("start", "stop"), [(START, STOP), (None, STOP)])
+    def test_descending(self, start, stop):
+        times = TIMES[::-1]
+        result = UNIT.date_slice(times, start, stop)
+        assert isinstance(result, slice)
+        expected = _expected(times, start, stop)
+        np.testing.assert_array_equal(np.arange(times.size)[result], expected)
+
+    def test_unordered(self):
+        times = np.random.default_rng(0).permutation(TIMES)
+        result = UNIT.date_slice(times, START, STOP, sorter=np.argsort(times))
+        np.testing.assert_array_equal(result, _expected(times, START, STOP))
+
+    def test_stop_before_start(self):
+        result = UNIT.date_slice(TIMES, STOP, START)
+        assert np.arange(TIMES.size)[result].size == 0
+
+    def test_empty(self):
+        assert UNIT.date_slice(np.array([]), START, STOP) == slice(0, 0)
+
+    def test_integer_times(self):
+        times = np.arange(0, 100, 5)
+        result = UNIT.date_slice(times, START, STOP)
+        assert result == slice(2, 8)
+
+    def test_python_datetime(self):
+        unit = cf_units.Unit("hours since 1970-01-01")
+        times = np.arange(0, 240, 6)
+        dates = unit.num2date(times, only_use_cftime_datetimes=False)
+        result = unit.date_slice(times, dates[3], dates[10])
+        assert result == slice(3, 10)
+
+    def test_not_one_dimensional(self):
+        with pytest.raises(ValueError, match="one-dimensional"):
+            UNIT.date_slice(TIMES.reshape(2, -1), START, STOP)
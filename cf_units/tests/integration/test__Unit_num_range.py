@@ -0,0 +1,90 @@
+# Copyright cf-units contributors
+#
+# This file is part of cf-units and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Test method :meth:`cf_units.Unit.num_range`."""
+
+import datetime
+
+import cftime
+import numpy as np
+import pytest
+
+import cf_units
+
+CALENDARS = sorted(cf_units.CALENDARS)
+
+
+def _expected(unit, start, stop, step):
+    # Encode each date of the range with date2num.
+    dates = []
+    date = start
+    while (date < stop) if step > datetime.timedelta(0) else (date > stop):
+        dates.append(date)
+        date = date + step
+    return unit.date2num(dates)
+
+
+@pytest.mark.parametrize("calendar", CALENDARS)
+@pytest.mark.parametrize(
+    ("unit", "step"),
+    [
+        ("hours since 1850-01-01", datetime.timedelta(hours=6)),
+        ("days since 1850-01-01", datetime.timedelta(hours=6)),
+        ("days since 1850-01-01", datetime.timedelta(hours=8)),
+        ("seconds since 2000-01-01 12:00", datetime.timedelta(days=3)),
+        ("minutes since 1990-06-01", datetime.timedelta(seconds=-4321)),
+    ],
+)
+def test_date2num(calendar, unit, step):
+    unit = cf_units.Unit(unit, calendar=calendar)
+    start = cftime.datetime(1999, 12, 30, 3, calendar=calendar)
+    stop = cftime.datetime(2000, 3, 2, calendar=calendar)
+    if step < datetime.timedelta(0):
+        start, stop = stop, start
+    result = unit.num_range(start, stop, step)
+    expected = _expected(unit, start, stop, step)
+    assert result.dtype.kind == expected.dtype.kind
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_numeric_step():
+    unit = cf_units.Unit("hours since 1970-01-01", calendar="noleap")
+    start = cftime.datetime(1970, 1, 2, calendar="noleap")
+    stop = cftime.datetime(1970, 1, 3, calendar="noleap")
+    np.testing.assert_array_equal(unit.num_range(start, stop, 6), [24, 30, 36, 42])
+    result = unit.num_range(start, stop, 7.5)
+    np.testing.assert_array_equal(result, [24.0, 31.5, 39.0, 46.5])
+
+
+def test_python_datetime():
+    unit = cf_units.Unit("hours since 1970-01-01")
+    start = datetime.datetime(1970, 1, 1, 3, tzinfo=datetime.UTC)
+    result = unit.num_range(start, datetime.datetime(1970, 1, 2), 6)
+    np.testing.assert_array_equal(result, [3, 9, 15, 21])
+
+
+def test_empty():
+    unit = cf_units.Unit("hours since 1970-01-01")
+    start = datetime.datetime(1970, 1, 2)
+    result = unit.num_range(start, datetime.datetime(1970, 1, 1), 1)
+    assert result.shape == (0,)
+
+
+def test_long():
+    # Five centuries of hourly times, beyond the 2**53 microseconds which
+    # are exactly representable as floats.
+    unit = cf_units.Unit("days since 1800-01-01", calendar="360_day")
+    start = cftime.datetime(1800, 1, 1, calendar="360_day")
+    stop = cftime.datetime(2300, 1, 1, calendar="360_day")
+    result = unit.num_range(start, stop, datetime.timedelta(hours=1))
+    assert result.shape == (500 * 360 * 24,)
+    assert result[-1] == 500 * 360 - 1 / 24
+    np.testing.assert_array_equal(result[::24], np.arange(500 * 360))
+
+
+def test_zero_step():
+    unit = cf_units.Unit("hours since 1970-01-01")
+    start = datetime.datetime(1970, 1, 1)
+    with pytest.raises(ValueError, match="at least one microsecond"):
+        unit.num_range(start, datetime.datetime(1970, 1, 2), 0)
@@ -0,0 +1,89 @@
+# Copyright cf-units contributors
+#
+# This file is part of cf-units and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Test method :meth:`cf_units.Unit.period_bounds`."""
+
+import cftime
+import numpy as np
+import pytest
+
+import cf_units
+
+CALENDARS = sorted(cf_units.CALENDARS)
+
+
+def _start(date, period):
+    # The start of the period of the date, by date manipulation.
+    year, month = date.year, date.month
+    if period == "year":
+        month = 1
+    elif period == "season":
+        month = month - month % 3
+        if month == 0:
+            year, month = year - 1, 12
+    return cftime.datetime(
+        year, month, 1, calendar=date.calendar, has_year_zero=date.has_year_zero
+    )
+
+
+def _next(start, period):
+    months = {"month": 1, "season": 3, "year": 12}[period]
+    year, month = divmod(start.year * 12 + start.month - 1 + months, 12)
+    return cftime.datetime(
+        year, month + 1, 1, calendar=start.calendar, has_year_zero=start.has_year_zero
+    )
+
+
+def _expected(unit, times, period):
+    lower = [_start(date, period) for date in unit.num2date(times)]
+    upper = [_next(start, period) for start in lower]
+    return np.stack([unit.date2num(lower), unit.date2num(upper)], axis=-1)
+
+
+@pytest.mark.parametrize("calendar", CALENDARS)
+@pytest.mark.parametrize("period", ["month", "season", "year"])
+def test_num2date(calendar, period):
+    unit = cf_units.Unit("days since 1999-11-15 06:00", calendar=calendar)
+    times = np.random.default_rng(0).uniform(-400, 800, 200)
+    result = unit.period_bounds(times, period)
+    np.testing.assert_array_equal(result, _expected(unit, times, period))
+
+
+@pytest.mark.parametrize("period", ["month", "season", "year"])
+def test_edges(period):
+    # The start of each period is in the period, and its end is not.
+    unit = cf_units.Unit("hours since 2000-01-01", calendar="noleap")
+    bounds = unit.period_bounds(np.arange(0, 24 * 800, 24), period)
+    edges = np.unique(bounds)
+    result = unit.period_bounds(edges, period)
+    np.testing.assert_array_equal(result[:, 0], edges)
+    np.testing.assert_array_equal(result[:-1, 1], edges[1:])
+
+
+@pytest.mark.parametrize("calendar", ["standard", "gregorian", "julian"])
+def test_year_one(calendar):
+    # The season of January of year 1 starts in December of year -1, as
+    # there is no year zero.
+    unit = cf_units.Unit("days since 0001-01-01", calendar=calendar)
+    np.testing.assert_array_equal(unit.period_bounds([15.0], "season"), [[-31, 59]])
+    np.testing.assert_array_equal(unit.period_bounds([15.0], "year"), [[0, 365]])
+
+
+def test_shape():
+    unit = cf_units.Unit("days since 2000-01-01", calendar="360_day")
+    assert unit.period_bounds(np.zeros((2, 3)), "year").shape == (2, 3, 2)
+    np.testing.assert_array_equal(unit.period_bounds(400, "year"), [360, 720])
+    assert unit.period_bounds([], "month").shape == (0, 2)
+
+
+def test_unknown_period():
+    unit = cf_units.Unit("days since 2000-01-01")
+    with pytest.raises(ValueError, match="Unknown period 'decade'"):
+        unit.period_bounds([0], "decade")
+
+
+def test_not_finite():
+    unit = cf_units.Unit("days since 2000-01-01")
+    with pytest.raises(ValueError, match="finite"):
+        unit.period_bounds([0, np.nan], "month")
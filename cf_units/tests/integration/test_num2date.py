@@ -6,6 +6,7 @@
 
 import pytest
 
+import cf_units
 from cf_units import num2date
 
 
@@ -19,3 +20,21 @@ class Test:
                 only_use_cftime_datetimes=False,
                 only_use_python_datetimes=True,
             )
+
+    def test_unit_cached(self):
+        cf_units.enable_stats()
+        try:
+            num2date(1, "days since 1971-02-03 UTC", calendar="360_day")
+            cf_units.stats(reset=True)
+            for day in range(3):
+                result = num2date(day, "days since 1971-02-03 UTC", "360_day")
+                assert str(result) == f"1971-02-{3 + day:02d} 00:00:00"
+            counts = cf_units.stats(reset=True)
+        finally:
+            cf_units.enable_stats(enabled=False)
+        assert "udunits.parse" not in counts
+        assert "udunits.format" not in counts
+
+    def test_epoch(self):
+        result = num2date(1, "days since epoch", "standard")
+        assert str(result) == "1970-01-02 00:00:00"
@@ -0,0 +1,209 @@
+# Copyright cf-units contributors
+#
+# This file is part of cf-units and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Test :attr:`cf_units.Unit.dimensions` and the
+:mod:`cf_units.dimensions` module.
+
+"""
+
+import numpy as np
+import pytest
+
+from cf_units import Unit
+from cf_units.dimensions import ConversionPlan, DimensionIndex
+
+UNITS = [
+    Unit("m"),
+    Unit("km"),
+    Unit("m2"),
+    Unit("Pa"),
+    Unit("hPa"),
+    Unit("kg m-1 s-2"),
+    Unit("K"),
+    Unit("degC"),
+    Unit("degF"),
+    Unit("s"),
+    Unit("hours"),
+    Unit("s-1"),
+    Unit("Hz"),
+    Unit("radian s-1"),
+    Unit("1"),
+    Unit("%"),
+    Unit("radian"),
+    Unit("degrees"),
+    Unit("sr"),
+    Unit("W"),
+    Unit("W m-2"),
+    Unit("lg(re 1 mW)"),
+    Unit("lg(re 1 W)"),
+    Unit("ln(re 1 Pa)"),
+    Unit("hours since 1970-01-01"),
+    Unit("days since 2000-01-01 12:00"),
+    Unit("days since 2000-01-01", calendar="360_day"),
+    Unit("hours since 1900-01-01", calendar="360_day"),
+    Unit("days since 2000-01-01", calendar="noleap"),
+    Unit("mol m-3"),
+    Unit("kg kg-1"),
+    Unit("m s-1"),
+    Unit("knot"),
+    Unit("unknown"),
+    Unit("no_unit"),
+]
+
+
+class Test_dimensions:
+    def test_derived(self):
+        assert Unit("hPa").dimensions == (("kg", 1), ("m", -1), ("s", -2))
+
+    def test_cancelled(self):
+        assert Unit("kg kg-1").dimensions == ()
+
+    def test_dimensionless_base(self):
+        assert Unit("radian s-1").dimensions == (("s", -1),)
+
+    def test_offset(self):
+        assert Unit("degC").dimensions == (("K", 1),)
+
+    def test_logarithmic(self):
+        assert Unit("lg(re 1 mW)").dimensions == Unit("W").dimensions
+
+    def test_time_reference(self):
+        assert Unit("hours since 1970-01-01").dimensions == (("s", 1),)
+
+    def test_reciprocal(self):
+        assert Unit("Hz").dimensions == (("s", -1),)
+        assert Unit("Hz")._convertibility_key() == Unit("s")._convertibility_key()
+
+    @pytest.mark.parametrize("unit", ["unknown", "no_unit"])
+    def test_not_convertible(self, unit):
+        assert Unit(unit).dimensions is None
+
+    @pytest.mark.parametrize("unit", UNITS, ids=str)
+    def test_is_convertible(self, unit):
+        # The units with equal keys are exactly the convertible units.
+        key = unit._convertibility_key()
+        for other in UNITS:
+            expected = unit.is_convertible(other)
+            assert (key is not None and key == other._convertibility_key()) == (
+                expected
+            ), other
+
+
+class Test_DimensionIndex:
+    def setup_method(self):
+        self.index = DimensionIndex()
+        self.index.add("pressure", "hPa")
+        self.index.add("temperature", Unit("K"))
+        self.index.add("celsius", "degC")
+        self.index.add("time", "days since 2000-01-01")
+        self.index.add("frequency", "Hz")
+        self.index.add("missing", "unknown")
+
+    def test_len(self):
+        assert len(self.index) == 6
+        assert "missing" in self.index
+        assert "spam" not in self.index
+
+    def test_convertible_to(self):
+        assert self.index.convertible_to("degF") == ["temperature", "celsius"]
+        assert self.index.convertible_to("atm") == ["pressure"]
+        assert self.index.convertible_to("hours since 1970-01-01") == ["time"]
+        assert self.index.convertible_to("s") == ["frequency"]
+        assert self.index.convertible_to("unknown") == []
+
+    def test_add_replaces(self):
+        self.index.add("temperature", "Pa")
+        assert self.index.convertible_to("K") == ["celsius"]
+        assert self.index.convertible_to("Pa") == ["pressure", "temperature"]
+        assert len(self.index) == 6
+
+    def test_discard(self):
+        self.index.discard("celsius")
+        self.index.discard("missing")
+        self.index.discard("spam")
+        assert self.index.convertible_to("K") == ["temperature"]
+        assert len(self.index) == 4
+
+    def test_groups(self):
+        groups = self.index.groups()
+        assert [list(group) for group in groups] == [
+            ["pressure"],
+            ["temperature", "celsius"],
+            ["time"],
+            ["frequency"],
+        ]
+        assert groups[1]["celsius"] == Unit("degC")
+
+
+class Test_ConversionPlan:
+    def test_canonical_most_frequent(self):
+        plan = ConversionPlan(["hPa", "K", "Pa", "degC", "Pa", "degC"])
+        assert plan.canonical == (Unit("Pa"), Unit("degC"))
+        assert plan.target("hPa") == Unit("Pa")
+        assert plan.target("K") == Unit("degC")
+
+    def test_canonical_preferred(self):
+        plan = ConversionPlan(["hPa", "Pa", "K"], canonical=["atm", "degC", "m"])
+        assert plan.canonical == (Unit("atm"), Unit("degC"))
+        assert plan.target("Pa") == Unit("atm")
+
+    def test_not_in_plan(self):
+        plan = ConversionPlan(["hPa"])
+        with pytest.raises(ValueError, match="not part of the plan"):
+            plan.target("K")
+
+    def test_identity(self):
+        plan = ConversionPlan(["Pa", "unknown", "no_unit"])
+        values = np.arange(3.0)
+        assert plan.convert(values, "Pa") is values
+        assert plan.convert(values, "unknown") is values
+        assert plan.coefficients("no_unit") == (1.0, 0.0)
+        assert plan.canonical == (Unit("Pa"), Unit("unknown"), Unit("no_unit"))
+
+    @pytest.mark.parametrize(
+        ("unit", "target", "coefficients"),
+        [
+            ("hPa", "Pa", (100.0, 0.0)),
+            ("degC", "K", (1.0, 273.15)),
+            ("hours since 1970-01-02", "days since 1970-01-01", (1 / 24, 1.0)),
+            ("lg(re 1 mW)", "lg(re 1 W)", (1.0, -3.0)),
+        ],
+    )
+    def test_linear(self, unit, target, coefficients):
+        plan = ConversionPlan([unit], canonical=[target])
+        assert plan.coefficients(unit) == pytest.approx(coefficients, rel=1e-15)
+        values = np.array([-40.0, 0.0, 1.5, 100.0])
+        expected = Unit(unit).convert(values, target)
+        np.testing.assert_allclose(plan.convert(values, unit), expected, rtol=1e-15)
+
+    def test_not_linear(self):
+        plan = ConversionPlan(["W"], canonical=["lg(re 1 mW)"])
+        assert plan.coefficients("W") is None
+        assert plan.convert(10.0, "W") == Unit("W").convert(10.0, "lg(re 1 mW)")
+
+    @pytest.mark.parametrize(("unit", "target"), [("s", "Hz"), ("Hz", "min")])
+    def test_reciprocal(self, unit, target):
+        plan = ConversionPlan([target, target, unit], canonical=[target])
+        assert plan.coefficients(unit) is None
+        values = np.array([1.0, 2.0, 4.0])
+        expected = Unit(unit).convert(values, target)
+        np.testing.assert_array_equal(plan.convert(values, unit), expected)
+
+    def test_calendar(self):
+        unit = Unit("days since 2000-01-01", calendar="360_day")
+        target = Unit("hours since 2000-01-01", calendar="360_day")
+        plan = ConversionPlan([unit], canonical=[target])
+        assert plan.coefficients(unit) is None
+        assert plan.convert(1.5, unit) == 36.0
+
+    def test_dtype(self):
+        plan = ConversionPlan(["km"], canonical=["m"])
+        converter = plan.converter("km")
+        result = converter(np.arange(3, dtype=np.float32))
+        assert result.dtype == np.float32
+        result = converter(np.arange(3))
+        assert result.dtype == np.float64
+        np.testing.assert_array_equal(result, [0.0, 1000.0, 2000.0])
+        masked = converter(np.ma.masked_array([1.0, 2.0], mask=[False, True]))
+        np.testing.assert_array_equal(masked.mask, [False, True])
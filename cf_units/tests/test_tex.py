@@ -3,7 +3,7 @@
 # This file is part of cf-units and is released under the BSD license.
 # See LICENSE in the root of the repository for full licensing details.
 
-from cf_units.tex import tex
+from cf_units.tex import tex, tex_many
 
 
 def test_basic():
@@ -40,3 +40,11 @@ def test_complex():
     u = "microW^2 / (5^-2)π per sec @ 42"
     expected = r"{\frac{{\frac{{{\mu}W}^{2}}{{5}^{-2}}}\cdot{π}}{sec}} @ {42}"
     assert tex(u) == expected
+
+
+def test_many():
+    units = ["kg kg-1", "m^2", "kg kg-1", "foo per bar", "kg·kg-1"]
+    expected = [tex(u) for u in units]
+    assert tex_many(units) == expected
+    assert tex_many(iter(units), processes=2) == expected
+    assert tex_many([]) == []
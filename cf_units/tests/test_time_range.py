@@ -0,0 +1,162 @@
+# Copyright cf-units contributors
+#
+# This file is part of cf-units and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Test the :mod:`cf_units.time_range` module."""
+
+import datetime
+
+import cftime
+import numpy as np
+import pytest
+
+from cf_units import Unit
+from cf_units.time_range import TimeRange
+
+UNIT = Unit("hours since 2000-01-01", calendar="360_day")
+
+
+class Test_from_values:
+    @pytest.mark.parametrize(
+        "values",
+        [
+            np.arange(10),
+            np.arange(10.0) * 0.1,
+            np.arange(5.0, -5.0, -2.5),
+            np.array([3.0]),
+            np.array([], dtype=int),
+        ],
+    )
+    def test_regular(self, values):
+        time_range = TimeRange.from_values(values, UNIT)
+        assert len(time_range) == len(values)
+        np.testing.assert_array_equal(time_range.values(), values)
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            np.array([0.0, 1.0, 3.0]),
+            np.arange(4.0).reshape(2, 2),
+            np.array(1.0),
+            np.array(["a", "b"]),
+        ],
+    )
+    def test_irregular(self, values):
+        assert TimeRange.from_values(values, UNIT) is None
+
+    def test_calendar(self):
+        time_range = TimeRange.from_values([0, 24], "days since 2000-01-01", "noleap")
+        assert time_range.unit == Unit("days since 2000-01-01", calendar="noleap")
+
+
+class Test___init__:
+    def test_not_time_reference(self):
+        with pytest.raises(ValueError, match="Expected a time reference unit"):
+            TimeRange(0, 1, 10, "hours")
+
+    def test_zero_stride(self):
+        with pytest.raises(ValueError, match="must not be zero"):
+            TimeRange(0, 1, 10, UNIT, stride=0)
+
+    def test_negative_length(self):
+        with pytest.raises(ValueError, match="must not be negative"):
+            TimeRange(0, 1, -1, UNIT)
+
+
+class Test_indexing:
+    def setup_method(self):
+        self.time_range = TimeRange(12, 6, 1000, UNIT)
+        self.expected = UNIT.num2date(12 + 6 * np.arange(1000))
+
+    @pytest.mark.parametrize("index", [0, 1, 999, -1, -1000, np.int32(7)])
+    def test_int(self, index):
+        assert self.time_range[index] == self.expected[index]
+
+    @pytest.mark.parametrize("index", [1000, -1001])
+    def test_out_of_range(self, index):
+        with pytest.raises(IndexError):
+            self.time_range[index]
+
+    @pytest.mark.parametrize(
+        "index",
+        [slice(None), slice(5, 20), slice(None, None, -3), slice(-10, None, 4)],
+    )
+    def test_slice(self, index):
+        result = self.time_range[index]
+        assert isinstance(result, TimeRange)
+        np.testing.assert_array_equal(result.dates(), self.expected[index])
+
+    def test_slice_values(self):
+        # The time values of a slice are exactly those of the same slice of
+        # the time values, however the slices are composed.
+        time_range = TimeRange(0.1, 0.1, 1000, UNIT)
+        values = time_range.values()
+        for start in [None, 0, 3, 997, -1, -7, 1000]:
+            for stop in [None, 0, 5, 500, -2, -999]:
+                for step in [None, 1, 2, 7, 333, -1, -3, -50]:
+                    index = slice(start, stop, step)
+                    result = time_range[index]
+                    np.testing.assert_array_equal(result.values(), values[index])
+                    for inner in [slice(1, None, 3), slice(None, None, -2)]:
+                        np.testing.assert_array_equal(
+                            result[inner].values(), values[index][inner]
+                        )
+                    if len(result):
+                        assert result[-1] == UNIT.num2date(values[index][-1])
+
+    def test_empty_slice(self):
+        result = self.time_range[20:10]
+        assert len(result) == 0
+        assert result.dates().shape == (0,)
+
+    def test_array(self):
+        index = np.array([[3, -1], [0, 500]])
+        np.testing.assert_array_equal(self.time_range[index], self.expected[index])
+
+    def test_array_out_of_range(self):
+        with pytest.raises(IndexError):
+            self.time_range[np.array([0, 1000])]
+
+    def test_not_integer(self):
+        with pytest.raises(TypeError, match="indices must be integers"):
+            self.time_range[1.5]
+
+
+class Test_dates:
+    def test_iter(self):
+        time_range = TimeRange(0.5, 0.25, 3000, UNIT)
+        expected = UNIT.num2date(0.5 + 0.25 * np.arange(3000))
+        assert list(time_range) == list(expected)
+
+    def test_asarray(self):
+        time_range = TimeRange(0, 1, 5, UNIT)
+        result = np.asarray(time_range)
+        assert result.dtype == object
+        np.testing.assert_array_equal(result, time_range.dates())
+
+    def test_python_datetimes(self):
+        time_range = TimeRange(
+            0,
+            24,
+            3,
+            "hours since 2000-01-01",
+            only_use_cftime_datetimes=False,
+            only_use_python_datetimes=True,
+        )
+        assert time_range[2] == datetime.datetime(2000, 1, 3)
+        assert isinstance(time_range[1:][0], datetime.datetime)
+
+    def test_cftime_datetimes(self):
+        time_range = TimeRange(0, 24, 3, "hours since 2000-01-01")
+        assert isinstance(time_range[0], cftime.datetime)
+
+    def test_repr(self):
+        assert repr(TimeRange(0, 1.5, 3, UNIT)) == (
+            "TimeRange(0, 1.5, 3, Unit('hours since 2000-01-01', calendar='360_day'))"
+        )
+
+    def test_repr_slice(self):
+        assert repr(TimeRange(0, 1.5, 30, UNIT)[27:2:-3]) == (
+            "TimeRange(0, 1.5, 9, Unit('hours since 2000-01-01', calendar='360_day'), "
+            "offset=27, stride=-3)"
+        )
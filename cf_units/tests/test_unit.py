@@ -4,6 +4,7 @@
 # See LICENSE in the root of the repository for full licensing details.
 """Test Unit the wrapper class for Unidata udunits2."""
 
+from concurrent.futures import ThreadPoolExecutor
 import copy
 import datetime as datetime
 import operator
@@ -467,6 +468,10 @@ class Test_invalid_origin_post_operation:
         assert x == u.symbol
 
 
+class _UnitSubclass(Unit):
+    pass
+
+
 class Test_pickle_with_unit_operations:
     def test_pickle_unit(self):
         u = Unit("K")
@@ -491,6 +496,36 @@ class Test_pickle_with_unit_operations:
             temp_file.seek(0)
             assert pickle.load(temp_file) == u / v  # noqa: S301
 
+    def test_pickle_calendar(self):
+        u = Unit("days since 2000-01-01", calendar="360_day")
+        result = pickle.loads(pickle.dumps(u))  # noqa: S301
+        assert result == u
+        assert result.calendar == "360_day"
+
+    def test_unpickle_cache(self):
+        u = Unit("m s-1")
+        first = pickle.loads(pickle.dumps(u))  # noqa: S301
+        second = pickle.loads(pickle.dumps(Unit("m s-1")))  # noqa: S301
+        assert first is second
+
+    def test_pickle_subclass(self):
+        u = _UnitSubclass("days since 2000-01-01", calendar="360_day")
+        result = pickle.loads(pickle.dumps(u))  # noqa: S301
+        assert type(result) is _UnitSubclass
+        assert result == u
+
+    def test_unpickle_cache_bounded(self, monkeypatch):
+        monkeypatch.setattr(cf_units, "_UNPICKLE_CACHE", cf_units._LRUCache(2))
+        for unit in ["m", "s", "kg"]:
+            pickle.loads(pickle.dumps(Unit(unit)))  # noqa: S301
+        assert len(cf_units._UNPICKLE_CACHE) == 2
+
+    def test_unpickle_legacy_state(self):
+        # Pickles written by earlier versions captured a state dict.
+        u = Unit.__new__(Unit)
+        u.__setstate__({"unit_text": "days since 1970-01-01", "calendar": "noleap"})
+        assert u == Unit("days since 1970-01-01", calendar="noleap")
+
 
 class Test_power:
     def test_basic(self):
@@ -989,6 +1024,117 @@ class TestTimeEncoding:
         assert (year, month, day, hour, min, sec) == (2006, 1, 15, 12, 6, 0)
 
 
+class TestTimeEncodingArrays:
+    def setup_method(self):
+        self.year = np.array([1, 1582, 1582, 1970, 2006, 2400])
+        self.month = np.array([1, 10, 10, 1, 1, 12])
+        self.day = np.array([1, 4, 15, 1, 15, 31])
+        self.hour = np.array([0, 23, 0, 6, 12, 23])
+        self.minute = np.array([0, 59, 0, 30, 6, 59])
+        self.second = np.array([0.0, 59.5, 0.0, 1.25, 0.0, 30.0])
+
+    def test_encode_times(self):
+        fields = (
+            self.year,
+            self.month,
+            self.day,
+            self.hour,
+            self.minute,
+            self.second,
+        )
+        result = cf_units.encode_times(*fields)
+        expected = [cf_units.encode_time(*time) for time in zip(*fields, strict=True)]
+        np.testing.assert_array_equal(result, expected)
+
+    def test_encode_dates(self):
+        result = cf_units.encode_dates(self.year, self.month, self.day)
+        expected = [
+            cf_units.encode_date(*date)
+            for date in zip(self.year, self.month, self.day, strict=True)
+        ]
+        np.testing.assert_array_equal(result, expected)
+
+    def test_encode_clocks(self):
+        result = cf_units.encode_clocks(self.hour, self.minute, self.second)
+        expected = [
+            cf_units.encode_clock(*clock)
+            for clock in zip(self.hour, self.minute, self.second, strict=True)
+        ]
+        np.testing.assert_array_equal(result, expected)
+
+    def test_broadcast(self):
+        result = cf_units.encode_dates(self.year.reshape(2, 3), [[1], [2]], 1)
+        assert result.shape == (2, 3)
+        assert result[1, 2] == cf_units.encode_date(2400, 2, 1)
+        assert cf_units.encode_clocks(12, 6, 0).shape == ()
+
+    def test_broadcast_not_copied(self, monkeypatch):
+        # The loop is given views of the inputs, broadcast with zero strides.
+        year = np.arange(1970, 1976, dtype=np.int32)
+        month = np.array([[1], [2]], dtype=np.int32)
+        day = np.array(1, dtype=np.int32)
+        views = []
+        encode_dates = cf_units._ud.encode_dates
+        monkeypatch.setattr(
+            cf_units._ud,
+            "encode_dates",
+            lambda *args: views.append(args[:3]) or encode_dates(*args),
+        )
+        result = cf_units.encode_dates(year, month, day)
+        assert result[1, 5] == cf_units.encode_date(1975, 2, 1)
+        assert len(views) == 2
+        for row in views:
+            assert all(
+                np.shares_memory(view, array)
+                for view, array in zip(row, [year, month, day], strict=True)
+            )
+            assert row[2].strides == (0,)
+
+    def test_strided(self):
+        year = self.year.reshape(3, 2).T
+        result = cf_units.encode_dates(year, self.month.reshape(3, 2).T, 1)
+        expected = [
+            [cf_units.encode_date(*date, 1) for date in zip(*row, strict=True)]
+            for row in zip(year, self.month.reshape(3, 2).T, strict=True)
+        ]
+        np.testing.assert_array_equal(result, expected)
+        decoded = cf_units.decode_times(result[:, ::-1])
+        np.testing.assert_array_equal(decoded["year"], year[:, ::-1])
+
+    def test_empty(self):
+        assert cf_units.encode_dates(np.array([], dtype=int), 1, 1).shape == (0,)
+        assert cf_units.encode_dates([], 1, 1).shape == (0,)
+        assert cf_units.encode_times([], 1, 1, 0, 0, 0.0).shape == (0,)
+        assert cf_units.encode_clocks(12, [], 0.0).shape == (0,)
+        assert cf_units.decode_times(np.empty((0, 2))).shape == (0, 2)
+
+    def test_decode_times(self):
+        times = cf_units.encode_times(
+            self.year, self.month, self.day, self.hour, self.minute, self.second
+        ).reshape(2, 3)
+        result = cf_units.decode_times(times)
+        assert result.shape == (2, 3)
+        assert result.dtype.names == (
+            "year",
+            "month",
+            "day",
+            "hour",
+            "minute",
+            "second",
+            "resolution",
+        )
+        for index in np.ndindex(times.shape):
+            assert tuple(result[index].tolist()) == cf_units.decode_time(times[index])
+
+    def test_not_integer(self):
+        with pytest.raises(TypeError, match="Expected integer values"):
+            cf_units.encode_dates([2000.5], 1, 1)
+
+    def test_overflow(self):
+        with pytest.raises(OverflowError, match="32 bit"):
+            cf_units.encode_dates([2**40], 1, 1)
+
+
 class TestNumsAndDates:
     def test_num2date(self):
         u = Unit(
@@ -1117,3 +1263,73 @@ class Test_is_vertical:
     def test_no_unit(self):
         u = Unit("no_unit")
         assert not u.is_vertical()
+
+
+class Test_threads:
+    def test_suppress_errors_overlapping(self, monkeypatch):
+        class FakeUdunits:
+            ignore = "ignore"
+            handler = "default"
+
+            @classmethod
+            def set_error_message_handler(cls, handler):
+                previous, cls.handler = cls.handler, handler
+                return previous
+
+        monkeypatch.setattr(cf_units, "_ud", FakeUdunits)
+        # Contexts entered and exited out of order, as by two threads.
+        first, second = suppress_errors(), suppress_errors()
+        first.__enter__()
+        second.__enter__()
+        first.__exit__(None, None, None)
+        assert FakeUdunits.handler == "ignore"
+        second.__exit__(None, None, None)
+        assert FakeUdunits.handler == "default"
+
+    @pytest.mark.parametrize(
+        ("name", "operation"),
+        [
+            ("root", lambda: Unit("m2").root(2)),
+            ("raise_", lambda: Unit("m") ** 2),
+            ("multiply", lambda: Unit("m") * Unit("s")),
+            ("divide", lambda: Unit("m") / Unit("s")),
+            ("invert", lambda: Unit("m").invert()),
+            ("log", lambda: Unit("m").log(10)),
+            ("offset", lambda: Unit("m") + 1),
+            ("offset_by_time", lambda: Unit("s").offset_by_time(0.0)),
+            ("are_convertible", lambda: Unit("m").is_convertible("km")),
+            ("get_unit_by_name", lambda: Unit("m").is_time()),
+            ("is_dimensionless", lambda: Unit("m").is_dimensionless()),
+        ],
+    )
+    def test_status_locked(self, monkeypatch, name, operation):
+        # Each call which may set the process-wide UDUNITS-2 status holds
+        # the lock, so that a failure reports its own status.
+        lock = cf_units._UT_LOCK
+        function = getattr(cf_units._ud, name)
+        held = []
+        monkeypatch.setattr(
+            cf_units._ud,
+            name,
+            lambda *args: held.append(lock._is_owned()) or function(*args),
+        )
+        operation()
+        assert held
+        assert all(held)
+
+    def test_c_locale_nested(self):
+        with cf_units.c_locale(), cf_units.c_locale():
+            assert Unit("1.5 m") == Unit("150 cm")
+
+    def test_concurrent(self):
+        values = np.arange(100000, dtype=np.float64)
+        expected = values * 100
+
+        def work(_):
+            unit = Unit("m s-1")
+            assert unit.format() == "m.s-1"
+            return unit.convert(values, "cm s-1")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for result in executor.map(work, range(16)):
+                np.testing.assert_array_almost_equal(result, expected)
@@ -0,0 +1,94 @@
+# Copyright cf-units contributors
+#
+# This file is part of cf-units and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Test the :class:`cf_units.unit_array.UnitArray` class."""
+
+import numpy as np
+import pytest
+
+from cf_units import FLOAT32, Unit
+from cf_units.unit_array import UnitArray
+
+
+class Test___init__:
+    def test_factorise(self):
+        units = UnitArray(["m", "km", "m", "cm", "km"])
+        assert units.units == (Unit("m"), Unit("km"), Unit("cm"))
+        np.testing.assert_array_equal(units.codes, [0, 1, 0, 2, 1])
+        assert len(units) == 5
+        assert units[3] == Unit("cm")
+
+    def test_units(self):
+        km = Unit("km")
+        units = UnitArray([km, "m", km])
+        assert units.units[0] is km
+        np.testing.assert_array_equal(units.codes, [0, 1, 0])
+
+    def test_calendar(self):
+        units = UnitArray(["days since 2000-01-01"], calendar="360_day")
+        assert units[0].calendar == "360_day"
+
+    def test_invalid_unit(self):
+        with pytest.raises(ValueError, match="Failed to parse unit"):
+            UnitArray(["m", "jigawatt"])
+
+
+class Test_from_codes:
+    def test(self):
+        units = UnitArray.from_codes([Unit("m"), Unit("km")], [1, 1, 0])
+        assert [str(unit) for unit in units] == ["km", "km", "m"]
+
+    def test_invalid_codes(self):
+        with pytest.raises(ValueError, match="must index the units"):
+            UnitArray.from_codes([Unit("m")], [0, 1])
+
+
+class Test_convert:
+    def test(self):
+        units = UnitArray(["m", "km", "cm", "km", "m"])
+        values = np.array([1.0, 2.0, 300.0, 4.0, 5.0])
+        result = units.convert(values, "m")
+        np.testing.assert_array_almost_equal(result, [1, 2000, 3, 4000, 5])
+        # The values are not modified.
+        np.testing.assert_array_equal(values, [1, 2, 300, 4, 5])
+
+    def test_matches_elementwise(self):
+        unit_strs = ["degC", "K", "degF", "degC", "mK"] * 20
+        values = np.linspace(-50, 50, len(unit_strs))
+        result = UnitArray(unit_strs).convert(values, "K")
+        expected = [
+            Unit(unit_str).convert(value, "K")
+            for unit_str, value in zip(unit_strs, values, strict=True)
+        ]
+        np.testing.assert_array_almost_equal(result, expected)
+
+    def test_dtype(self):
+        units = UnitArray(["m", "km"])
+        result = units.convert(np.array([1, 2]), "m", ctype=FLOAT32)
+        assert result.dtype == np.float32
+        np.testing.assert_array_equal(result, [1, 2000])
+        result = units.convert(np.array([1, 2], dtype=np.float32), "m")
+        assert result.dtype == np.float32
+
+    def test_masked(self):
+        values = np.ma.masked_array([1.0, 2.0, 3.0], mask=[False, True, False])
+        result = UnitArray(["km", "m", "km"]).convert(values, "m")
+        assert isinstance(result, np.ma.MaskedArray)
+        np.testing.assert_array_equal(result.mask, [False, True, False])
+        np.testing.assert_array_equal(result.compressed(), [1000, 3000])
+
+    def test_time_reference(self):
+        units = UnitArray(
+            ["days since 2000-01-01", "days since 2000-01-02"], calendar="360_day"
+        )
+        other = Unit("days since 2000-01-01", calendar="360_day")
+        np.testing.assert_array_equal(units.convert([1.0, 1.0], other), [1, 2])
+
+    def test_wrong_shape(self):
+        with pytest.raises(ValueError, match="Expected 2 values"):
+            UnitArray(["m", "km"]).convert(np.arange(3.0), "m")
+
+    def test_not_convertible(self):
+        with pytest.raises(ValueError, match="Unable to convert"):
+            UnitArray(["m", "s"]).convert(np.arange(2.0), "m")
@@ -0,0 +1,137 @@
+# Copyright cf-units contributors
+#
+# This file is part of cf-units and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the `cf_units._time` module.
+
+The conversions of a TimeOrigin are compared with those of cftime, which
+parses the unit string on each call.
+"""
+
+import datetime
+from unittest import mock
+
+import cftime
+import numpy as np
+import pytest
+
+from cf_units import Unit
+from cf_units._time import TimeOrigin
+
+UNITS = [
+    ("hours since 1970-01-01 00:00:00", "standard"),
+    ("days since 1970-01-01 00:00:00 -06:30", "standard"),
+    ("seconds since 1500-01-01", "standard"),
+    ("milliseconds since 2000-01-01T06:00:00", "gregorian"),
+    ("days since 0001-01-01", "proleptic_gregorian"),
+    ("days since 1850-01-01 12:30", "julian"),
+    ("days since 2000-01-01", "360_day"),
+    ("months since 2000-01-01", "360_day"),
+    ("common_years since 2000-01-01", "noleap"),
+    ("hours since 2000-01-01", "all_leap"),
+]
+
+RNG = np.random.default_rng(0)
+
+TIMES = [
+    5,
+    5.5,
+    np.float32(2.25),
+    np.array(3.0),
+    [1, 2],
+    np.array([[1, 2], [3, 4]]),
+    np.arange(3, dtype=np.int32),
+    np.array([0.1, 1e-7, 1 / 3600, 1.0000000001]),
+    np.array([], dtype=float),
+    RNG.uniform(-1e4, 1e4, 20),
+    RNG.integers(-(10**5), 10**5, 20),
+]
+
+FLAGS = [(True, False), (False, False), (False, True)]
+
+
+def _call(func):
+    try:
+        return func()
+    except (ValueError, OverflowError) as error:
+        return type(error), str(error)
+
+
+def _assert_same(result, expected):
+    assert type(result) is type(expected)
+    if isinstance(expected, np.ndarray):
+        assert result.shape == expected.shape
+        assert result.dtype == expected.dtype
+        if expected.dtype == object:
+            assert [type(date) for date in result.flat] == [
+                type(date) for date in expected.flat
+            ]
+        np.testing.assert_array_equal(result, expected)
+    else:
+        assert result == expected
+
+
+@pytest.mark.parametrize(("unit", "calendar"), UNITS)
+class Test_num2date:
+    @pytest.mark.parametrize("flags", FLAGS)
+    @pytest.mark.parametrize("times", TIMES)
+    def test_cftime(self, unit, calendar, times, flags):
+        origin = TimeOrigin(unit, calendar)
+        expected = _call(lambda: cftime.num2date(times, unit, calendar, *flags))
+        result = _call(lambda: origin.num2date(times, *flags))
+        _assert_same(result, expected)
+
+    @pytest.mark.parametrize(
+        "times",
+        [
+            np.array([np.nan, 1.0]),
+            np.ma.masked_array([1.0, 2.0], mask=[False, True]),
+            1e30,
+        ],
+    )
+    def test_special(self, unit, calendar, times):
+        origin = TimeOrigin(unit, calendar)
+        expected = _call(lambda: cftime.num2date(times, unit, calendar))
+        result = _call(lambda: origin.num2date(times))
+        if isinstance(expected, np.ma.MaskedArray):
+            np.testing.assert_array_equal(result.mask, expected.mask)
+            assert result.compressed().tolist() == expected.compressed().tolist()
+        else:
+            _assert_same(result, expected)
+
+
+@pytest.mark.parametrize(("unit", "calendar"), UNITS)
+class Test_date2num:
+    @pytest.mark.parametrize("times", [times for times in TIMES if np.size(times)])
+    def test_cftime(self, unit, calendar, times):
+        dates = cftime.num2date(times, unit, calendar)
+        origin = TimeOrigin(unit, calendar)
+        _assert_same(origin.date2num(dates), cftime.date2num(dates, unit, calendar))
+
+    @pytest.mark.parametrize(
+        "dates",
+        [
+            datetime.datetime(2001, 2, 3, 4, 5, 6, 7),
+            [datetime.datetime(2001, 2, 3), cftime.DatetimeNoLeap(2001, 2, 3)],
+            datetime.datetime(1500, 2, 3),
+            datetime.datetime(2001, 2, 3, tzinfo=datetime.UTC),
+            np.array(["2001-02-03"], dtype="datetime64[s]"),
+            [],
+        ],
+    )
+    def test_other_dates(self, unit, calendar, dates):
+        origin = TimeOrigin(unit, calendar)
+        expected = _call(lambda: cftime.date2num(dates, unit, calendar))
+        _assert_same(_call(lambda: origin.date2num(dates)), expected)
+
+
+class Test_Unit:
+    def test_parsed_once(self, monkeypatch):
+        unit = Unit("hours since 1970-01-01", calendar="360_day")
+        unit.num2date(0)
+        fail = mock.Mock(side_effect=AssertionError("cftime was called"))
+        monkeypatch.setattr(cftime, "num2date", fail)
+        monkeypatch.setattr(cftime, "date2num", fail)
+        date = unit.num2date(np.arange(3.0) * 12)[2]
+        assert str(date) == "1970-01-02 00:00:00"
+        assert unit.date2num(date) == 24
@@ -250,6 +250,36 @@ class Test_time_encoding:
             res_seconds - res_resolution < self.seconds < res_seconds + res_resolution
         )
 
+    def test_encode_times(self):
+        ints = np.array([self.year, self.year], dtype=np.int32)
+        seconds = np.array([self.seconds, self.seconds + 1.5])
+        out = np.empty(2)
+        _ud.encode_times(
+            ints,
+            np.full(2, self.month, dtype=np.int32),
+            np.full(2, self.day, dtype=np.int32),
+            np.full(2, self.hours, dtype=np.int32),
+            np.full(2, self.minutes, dtype=np.int32),
+            seconds,
+            out,
+        )
+        expected = self.date_encoding + self.clock_encoding + np.array([0, 1.5])
+        np.testing.assert_array_equal(out, expected)
+
+    def test_decode_times(self):
+        value = np.array([self.date_encoding, self.date_encoding + 86400.0])
+        fields = [np.empty(2, dtype=np.int32) for _ in range(5)]
+        second, resolution = np.empty(2), np.empty(2)
+        _ud.decode_times(value, *fields, second, resolution)
+        assert [field.tolist() for field in fields] == [
+            [2000, 2000],
+            [1, 1],
+            [1, 2],
+            [0, 0],
+            [0, 0],
+        ]
+        np.testing.assert_array_equal(second, 0.0)
+
 
 class Test_convert:
     """Test case for convert operations."""
@@ -260,6 +260,111 @@ class Test_convert__masked_array:
         np.testing.assert_array_almost_equal(self.rads_array, result)
 
 
+class Test_convert__int64:
+    # Test converting integer values exactly, with integer arithmetic.
+
+    @pytest.mark.parametrize(
+        ("unit", "other", "calendar"),
+        [
+            ("seconds since 1970-01-01", "seconds since 2000-01-01", "standard"),
+            ("days since 1970-01-01", "hours since 1969-12-31 18:00", "standard"),
+            ("days since 2000-01-01 06:00 +02:00", "hours since 2000-01-01", None),
+            ("days since 2000-01-01", "minutes since 2000-02-01", "360_day"),
+            ("hours since 1850-01-01", "seconds since 1850-01-01", "noleap"),
+            ("days", "hours", None),
+            ("km", "m", None),
+        ],
+    )
+    def test_exact(self, unit, other, calendar):
+        unit = Unit(unit, calendar=calendar)
+        other = Unit(other, calendar=calendar)
+        values = np.array([-1000, 0, 1, 86400, 10**6], dtype=np.int32)
+        result = unit.convert(values, other, ctype=cf_units.INT64)
+        assert result.dtype == np.int64
+        expected = unit.convert(values.astype(np.float64), other)
+        np.testing.assert_array_equal(result, expected)
+
+    def test_large(self):
+        # Values beyond 2**53 are not exactly representable as floats.
+        unit = Unit("seconds since 1970-01-01")
+        values = np.array([2**60 + 1], dtype=np.int64)
+        result = unit.convert(values, "seconds since 1970-01-02", cf_units.INT64)
+        assert result[0] == 2**60 + 1 - 86400
+
+    def test_divisor(self):
+        result = Unit("hours").convert(np.array([24, -48]), "days", cf_units.INT64)
+        np.testing.assert_array_equal(result, [1, -2])
+
+    def test_scalar(self):
+        result = Unit("days since 1970-01-02").convert(
+            1, "hours since 1970-01-01", cf_units.INT64
+        )
+        assert result == 48
+        assert isinstance(result, int)
+
+    def test_float_values(self):
+        values = np.array([1.5])
+        result = Unit("days").convert(values, "hours", cf_units.INT64)
+        assert result.dtype == np.float64
+        np.testing.assert_array_equal(result, [36.0])
+        assert Unit("days").convert(1.5, "hours", cf_units.INT64) == 36.0
+
+    def test_inplace(self):
+        values = np.arange(3)
+        result = Unit("days").convert(values, "hours", cf_units.INT64, inplace=True)
+        assert result is values
+        np.testing.assert_array_equal(values, [0, 24, 48])
+
+    @pytest.mark.parametrize("dtype", [np.int32, np.uint64])
+    def test_inplace_not_int64(self, dtype):
+        values = np.arange(3, dtype=dtype)
+        with pytest.raises(TypeError, match="in-place with 64-bit integer"):
+            Unit("days").convert(values, "hours", cf_units.INT64, inplace=True)
+        np.testing.assert_array_equal(values, [0, 1, 2])
+
+    @pytest.mark.parametrize(
+        ("unit", "other", "values", "expected"),
+        [
+            ("ft", "in", [1, 2, -3], [12, 24, -36]),
+            ("yd", "ft", [1, 2, -3], [3, 6, -9]),
+            ("in", "ft", [12, 24, -36], [1, 2, -3]),
+        ],
+    )
+    def test_rounded_coefficients(self, unit, other, values, expected):
+        # The float coefficients of these conversions are not exactly
+        # integers, but the conversions are.
+        result = Unit(unit).convert(np.array(values), other, cf_units.INT64)
+        assert result.dtype == np.int64
+        np.testing.assert_array_equal(result, expected)
+
+    def test_masked(self):
+        values = np.ma.masked_array([24, 25, 48], mask=[False, True, False])
+        result = Unit("hours").convert(values, "days", cf_units.INT64)
+        np.testing.assert_array_equal(result.mask, [False, True, False])
+        np.testing.assert_array_equal(result.compressed(), [1, 2])
+
+    @pytest.mark.parametrize(
+        ("unit", "other"), [("degC", "K"), ("degrees", "radians"), ("m", "ft")]
+    )
+    def test_not_integral(self, unit, other):
+        with pytest.raises(ValueError, match="with integer arithmetic"):
+            Unit(unit).convert(np.arange(3), other, cf_units.INT64)
+
+    def test_not_exact(self):
+        with pytest.raises(ValueError, match="exactly with integer arithmetic"):
+            Unit("hours").convert(np.array([24, 25]), "days", cf_units.INT64)
+
+    def test_overflow(self):
+        with pytest.raises(OverflowError, match="64 bit signed integers"):
+            Unit("days").convert(np.array([2**50]), "microseconds", cf_units.INT64)
+
+    def test_cached(self):
+        unit = Unit("hours since 1970-01-01")
+        other = Unit("seconds since 1970-01-02")
+        unit.convert(np.arange(3), other, cf_units.INT64)
+        assert unit._cache()[("int64", other)] == (3600, -86400, 1)
+
+
 class Test_is_long_time_interval:
     @staticmethod
     def test_deprecated():
@@ -298,3 +403,22 @@ class Test_format:
         # constructed correctly when using pytest.
         unit = Unit.__new__(Unit)
         assert unit.format() == "unknown"
+
+    def test_cached(self):
+        unit = Unit("3.5 furlong fortnight-1")
+        cf_units.enable_stats()
+        try:
+            cf_units.stats(reset=True)
+            for _ in range(3):
+                assert unit.symbol == "0.000582084497502328 m.s-1"
+                assert unit.name == "0.000582084497502328 meter-second^-1"
+                assert unit.definition == "0.000582084497502328 m.s-1"
+                assert repr(unit) == "Unit('3.5 furlong fortnight-1')"
+            assert cf_units.stats(reset=True)["udunits.format"]["count"] == 3
+        finally:
+            cf_units.enable_stats(enabled=False)
+
+    def test_cftime_unit_cached(self):
+        unit = Unit("hours since 1970-01-01", calendar="360_day")
+        assert unit.cftime_unit is unit.cftime_unit
+        assert unit.cftime_unit == "hours since 1970-01-01"
@@ -0,0 +1,150 @@
+# Copyright cf-units contributors
+#
+# This file is part of cf-units and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the `cf_units.UnitSystem` class."""
+
+from pathlib import Path
+import pickle
+import weakref
+
+import pytest
+
+import cf_units
+from cf_units import Unit, UnitSystem, config
+
+SITE_XML = """<?xml version="1.0" encoding="US-ASCII"?>
+<unit-system>
+  <import>{}</import>
+  <unit>
+    <def>0.3048 m</def>
+    <name><singular>spam</singular></name>
+  </unit>
+</unit-system>
+"""
+
+
+@pytest.fixture(scope="module")
+def site_xml(tmp_path_factory):
+    # A site database extending the standard UDUNITS-2 unit database.
+    standard = Path(config.get_xml_path().decode())
+    if not standard.exists():
+        pytest.skip("The UDUNITS-2 unit database is not in the configured path.")
+    path = tmp_path_factory.mktemp("udunits") / "site.xml"
+    path.write_text(SITE_XML.format(standard))
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def system(site_xml):
+    return UnitSystem(site_xml)
+
+
+class Test___init__:
+    def test_default(self):
+        system = UnitSystem()
+        assert system.xml_path is None
+        assert Unit("m", system=system).system is system
+
+    def test_site_database(self, system):
+        assert Unit("spam", system=system).convert(1, "m") == 0.3048
+        with pytest.raises(ValueError, match="Failed to parse unit"):
+            Unit("spam")
+
+    def test_missing_database(self, tmp_path):
+        with pytest.raises(OSError, match="Failed to open UDUNITS-2 XML"):
+            UnitSystem(tmp_path / "missing.xml")
+
+
+class Test_units:
+    def test_default_system(self):
+        assert Unit("m").system is Unit("s").system
+
+    def test_derived_units(self, system):
+        unit = Unit("spam", system=system)
+        assert (unit * "s").system is system
+        assert (unit / 2).system is system
+        assert (unit**2).system is system
+        assert unit.invert().system is system
+        assert (unit * "spam") == Unit("spam2", system=system)
+
+    def test_other_system(self, system):
+        unit = Unit("m", system=system)
+        assert unit != Unit("m")
+        assert not unit.is_convertible(Unit("m"))
+
+    def test_time_reference(self, system):
+        unit = Unit("days since 2000-01-01", calendar="360_day", system=system)
+        assert unit.is_time_reference()
+        assert unit.num2date(30).month == 2
+
+
+class Test_caches:
+    def test_as_unit(self, system):
+        unit = system.as_unit("spam")
+        assert unit.system is system
+        assert system.as_unit("spam") is unit
+        assert system.as_unit(unit) is unit
+
+    def test_parse(self, system):
+        assert Unit("km", system=system).ut_unit is Unit("km", system=system).ut_unit
+
+    def test_bounded(self, monkeypatch):
+        monkeypatch.setattr(cf_units, "_SYSTEM_CACHE_SIZE", 2)
+        system = UnitSystem()
+        for unit in ["km", "cm", "mm"]:
+            system.as_unit(unit).convert(1, "m")
+        assert len(system._parsed) == 2
+        assert len(system._units) == 2
+        assert len(system._converters) == 2
+
+    def test_time_units_bounded(self, monkeypatch):
+        monkeypatch.setattr(cf_units, "_SYSTEM_CACHE_SIZE", 2)
+        system = UnitSystem()
+        for unit in ["days", "hours", "minutes"]:
+            system._time_unit(f"{unit} since 2000-01-01", "standard")
+        assert len(system._time_units) == 2
+        unit = system._time_unit("minutes since 2000-01-01", "standard")
+        assert system._time_unit("minutes since 2000-01-01", "standard") is unit
+
+    def test_converter(self, system):
+        spam, metre = Unit("spam", system=system), Unit("m", system=system)
+        assert spam.convert(2, metre) == 0.6096
+        converter = system._converters[("spam", "m")]
+        assert spam.convert(3, metre) == pytest.approx(0.9144)
+        assert system._converters[("spam", "m")] is converter
+
+
+class Test_pickle:
+    def test_unit(self, system):
+        unit = Unit("spam", system=system)
+        first = pickle.loads(pickle.dumps(unit))  # noqa: S301
+        second = pickle.loads(pickle.dumps(unit))  # noqa: S301
+        assert first is second
+        assert first == unit
+        assert first.system is system
+        assert first.convert(1, "m") == 0.3048
+
+    def test_custom_system(self):
+        system = UnitSystem()
+        unit = Unit("m", system=system)
+        result = pickle.loads(pickle.dumps(unit))  # noqa: S301
+        assert result == unit
+        assert result.system is system
+        assert result.system is not Unit("m").system
+
+    def test_default_system(self):
+        unit = pickle.loads(pickle.dumps(Unit("m")))  # noqa: S301
+        assert unit.system is Unit("m").system
+
+    def test_other_process(self, system, monkeypatch):
+        # A system which is not alive in this process, as in another
+        # process, is loaded once from its database.
+        data = pickle.dumps(Unit("spam", system=system))
+        monkeypatch.setattr(cf_units, "_SYSTEMS", weakref.WeakValueDictionary())
+        first = pickle.loads(data)  # noqa: S301
+        assert first.system is not system
+        assert first.system.xml_path == system.xml_path
+        assert first.convert(1, "m") == 0.3048
+        assert pickle.loads(data).system is first.system  # noqa: S301
+        assert pickle.loads(pickle.dumps(first)).system is first.system  # noqa: S301
@@ -0,0 +1,106 @@
+# Copyright cf-units contributors
+#
+# This file is part of cf-units and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the `cf_units.enable_date_cache` function."""
+
+import numpy as np
+import pytest
+
+import cf_units
+from cf_units import Unit, _time
+
+UNIT = Unit("hours since 1970-01-01", calendar="360_day")
+
+
+@pytest.fixture(autouse=True)
+def _enabled():
+    cf_units.enable_date_cache(max_dates=100)
+    yield
+    cf_units.enable_date_cache(enabled=False)
+
+
+def test_disabled():
+    cf_units.enable_date_cache(enabled=False)
+    times = np.arange(10.0)
+    dates = UNIT.num2date(times)
+    assert UNIT.num2date(times) is not dates
+    assert dates.flags.writeable
+
+
+def test_hit():
+    dates = UNIT.num2date(np.arange(10.0))
+    # An equal copy of the time values is a hit.
+    assert UNIT.num2date(np.arange(10.0)) is dates
+    assert not dates.flags.writeable
+    np.testing.assert_array_equal(dates, UNIT.num2date(np.arange(10.0).tolist()))
+
+
+def test_function():
+    unit = "hours since 1970-01-01"
+    dates = cf_units.num2date(np.arange(10.0), unit, "360_day")
+    assert cf_units.num2date(np.arange(10.0), unit, "360_day") is dates
+    assert UNIT.num2date(np.arange(10.0)) is dates
+
+
+@pytest.mark.parametrize(
+    ("unit", "times", "kwargs"),
+    [
+        (UNIT, np.arange(1.0, 11.0), {}),
+        (UNIT, np.arange(10), {}),
+        (UNIT, np.arange(10.0).reshape(2, 5), {}),
+        (Unit("hours since 1970-01-01", calendar="noleap"), np.arange(10.0), {}),
+        (Unit("days since 1970-01-01", calendar="360_day"), np.arange(10.0), {}),
+        (Unit("hours since 1970-01-01"), np.arange(10.0), {}),
+        (
+            Unit("hours since 1970-01-01"),
+            np.arange(10.0),
+            {"only_use_cftime_datetimes": False},
+        ),
+    ],
+)
+def test_miss(unit, times, kwargs):
+    dates = UNIT.num2date(np.arange(10.0))
+    result = unit.num2date(times, **kwargs)
+    assert result is not dates
+    np.testing.assert_array_equal(result, unit.num2date(times.tolist(), **kwargs))
+
+
+def test_stats():
+    cf_units.enable_stats()
+    cf_units.stats(reset=True)
+    try:
+        UNIT.num2date(np.arange(10.0))
+        UNIT.num2date(np.arange(10.0))
+        counts = {name: counter["count"] for name, counter in cf_units.stats().items()}
+    finally:
+        cf_units.enable_stats(enabled=False)
+        cf_units.stats(reset=True)
+    assert counts["num2date.cache.miss"] == 1
+    assert counts["num2date.cache.hit"] == 1
+
+
+@pytest.mark.parametrize(
+    "times",
+    [5.0, np.float64(5.0), np.ma.masked_array([1.0, 2.0], mask=[False, True])],
+)
+def test_not_cached(times):
+    UNIT.num2date(times)
+    assert len(_time.cache) == 0
+
+
+def test_bounded():
+    first = UNIT.num2date(np.arange(60.0))
+    second = UNIT.num2date(np.arange(1.0, 41.0))
+    assert len(_time.cache) == 2
+    # Adding a third array evicts the least recently used.
+    assert UNIT.num2date(np.arange(60.0)) is first
+    UNIT.num2date(np.arange(2.0, 32.0))
+    assert UNIT.num2date(np.arange(60.0)) is first
+    assert UNIT.num2date(np.arange(1.0, 41.0)) is not second
+
+
+def test_too_large():
+    dates = UNIT.num2date(np.arange(101.0))
+    assert dates.flags.writeable
+    assert len(_time.cache) == 0
@@ -0,0 +1,98 @@
+# Copyright cf-units contributors
+#
+# This file is part of cf-units and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the `cf_units.add_hook` and `cf_units.remove_hook` functions."""
+
+from contextlib import contextmanager
+
+import numpy as np
+import pytest
+
+import cf_units
+from cf_units import Unit
+from cf_units.tex import tex, tex_many
+
+
+@pytest.fixture
+def calls():
+    calls = []
+
+    def callback(operation, size, seconds):
+        assert seconds >= 0
+        calls.append((operation, size))
+
+    cf_units.add_hook(callback)
+    yield calls
+    cf_units.remove_hook(callback)
+
+
+@pytest.fixture
+def spans():
+    spans = []
+
+    @contextmanager
+    def span(operation, size):
+        spans.append(("enter", operation, size))
+        try:
+            yield
+        except Exception as error:
+            spans.append(("error", operation, type(error)))
+            raise
+        spans.append(("exit", operation, size))
+
+    cf_units.add_hook(span=span)
+    yield spans
+    cf_units.remove_hook(span)
+
+
+def test_operations(calls):
+    unit = Unit("hours since 1970-01-01")
+    dates = unit.num2date(np.arange(4))
+    unit.date2num(dates[:2])
+    Unit("km").convert(np.arange(3.0), Unit("m"))
+    tex("kg m-2")
+    tex_many(unit_str for unit_str in ["m", "s", "m"])
+    assert calls == [
+        ("Unit.__init__", 1),
+        ("Unit.num2date", 4),
+        ("Unit.date2num", 2),
+        ("Unit.__init__", 1),
+        ("Unit.__init__", 1),
+        ("Unit.convert", 3),
+        ("tex", 1),
+        ("tex_many", 3),
+    ]
+
+
+def test_span(spans):
+    Unit("m").convert(2.0, Unit("km"))
+    assert spans == [
+        ("enter", "Unit.__init__", 1),
+        ("exit", "Unit.__init__", 1),
+        ("enter", "Unit.__init__", 1),
+        ("exit", "Unit.__init__", 1),
+        ("enter", "Unit.convert", 1),
+        ("exit", "Unit.convert", 1),
+    ]
+
+
+def test_span_error(spans):
+    with pytest.raises(ValueError, match="Failed to parse unit"):
+        Unit("jigawatt")
+    assert spans == [
+        ("enter", "Unit.__init__", 1),
+        ("error", "Unit.__init__", ValueError),
+    ]
+
+
+def test_remove_hook():
+    calls = []
+
+    def callback(operation, size, seconds):
+        calls.append((operation, size, seconds))
+
+    cf_units.add_hook(callback)
+    cf_units.remove_hook(callback)
+    Unit("m")
+    assert calls == []
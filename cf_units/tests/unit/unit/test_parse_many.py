@@ -0,0 +1,61 @@
+# Copyright cf-units contributors
+#
+# This file is part of cf-units and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the `cf_units.parse_many` function."""
+
+import pytest
+
+import cf_units
+from cf_units import Unit, UnitSystem, parse_many
+
+
+def test_input_order():
+    result = parse_many(iter(["km", "m", "km", None, "no_unit"]))
+    assert result == [Unit("km"), Unit("m"), Unit("km"), Unit(None), Unit("no_unit")]
+    assert result[0] is result[2]
+
+
+def test_errors():
+    result = parse_many(["m", "jigawatt", "m", "jigawatt"])
+    assert result[0] == Unit("m")
+    assert isinstance(result[1], ValueError)
+    assert str(result[1]).startswith('[UT_UNKNOWN] Failed to parse unit "jigawatt"')
+    assert result[3] is result[1]
+
+
+def test_parsed_once():
+    cf_units.enable_stats()
+    cf_units.stats(reset=True)
+    try:
+        parse_many(["8.5 furlong", "8.5 furlong", "8.5 furlong"])
+        assert cf_units.stats()["udunits.parse"]["count"] == 1
+    finally:
+        cf_units.enable_stats(enabled=False)
+        cf_units.stats(reset=True)
+
+
+def test_calendar():
+    result = parse_many(["days since 2000-01-01", "m"], calendar="360_day")
+    assert result[0].calendar == "360_day"
+    assert result[1].calendar is None
+
+
+@pytest.mark.parametrize(
+    ("calendar", "error", "match"),
+    [
+        (360, TypeError, "Expected string-like calendar"),
+        ("lunar", ValueError, "'lunar' is an unsupported calendar"),
+    ],
+)
+@pytest.mark.parametrize("unit_strings", [["days since 2000-01-01"], ["m"], []])
+def test_invalid_calendar(calendar, error, match, unit_strings):
+    # An invalid calendar applies to every unit, so is raised.
+    with pytest.raises(error, match=match):
+        parse_many(unit_strings, calendar=calendar)
+
+
+def test_system():
+    system = UnitSystem()
+    (result,) = parse_many(["m"], system=system)
+    assert result.system is system
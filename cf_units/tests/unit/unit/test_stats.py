@@ -0,0 +1,83 @@
+# Copyright cf-units contributors
+#
+# This file is part of cf-units and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Unit tests for the `cf_units.stats` function."""
+
+import numpy as np
+import pytest
+
+import cf_units
+from cf_units import Unit
+
+
+@pytest.fixture(autouse=True)
+def _enabled():
+    cf_units.enable_stats()
+    cf_units.stats(reset=True)
+    yield
+    cf_units.enable_stats(enabled=False)
+    cf_units.stats(reset=True)
+
+
+def _counts():
+    return {name: counter["count"] for name, counter in cf_units.stats().items()}
+
+
+def test_disabled():
+    cf_units.enable_stats(enabled=False)
+    Unit("km").convert(np.arange(3.0), "m")
+    assert cf_units.stats() == {}
+
+
+def test_parse():
+    # Units are only parsed once, so use a unit unique to this test.
+    Unit("7.25 furlong fortnight-1")
+    Unit("7.25 furlong fortnight-1")
+    assert _counts() == {"udunits.parse": 1}
+
+
+def test_as_unit():
+    cf_units.as_unit("6.25 erg")
+    cf_units.as_unit("6.25 erg")
+    counts = _counts()
+    assert counts["as_unit.miss"] == 1
+    assert counts["as_unit.hit"] == 1
+
+
+def test_format():
+    Unit("m").format()
+    assert _counts() == {"udunits.format": 1}
+
+
+def test_convert():
+    km = Unit("km")
+    km.convert(np.arange(4, dtype=np.float32), "m")
+    km.convert(np.arange(3, dtype=np.float64), "m")
+    km.convert(1, "m")
+    counts = _counts()
+    assert counts["convert.udunits.float32"] == 4
+    assert counts["convert.udunits.float64"] == 4
+    stats = cf_units.stats()
+    assert stats["convert.udunits.float64"]["seconds"] > 0
+
+
+def test_convert_cftime():
+    unit = Unit("days since 2000-01-01", calendar="360_day")
+    unit.convert(np.arange(5.0), Unit("days since 2001-01-01", calendar="360_day"))
+    assert _counts()["convert.cftime"] == 5
+
+
+def test_time():
+    unit = Unit("hours since 1970-01-01", calendar="360_day")
+    dates = unit.num2date(np.arange(6))
+    unit.date2num(dates[:2])
+    counts = _counts()
+    assert counts["num2date"] == 6
+    assert counts["date2num"] == 2
+
+
+def test_reset():
+    Unit("m").format()
+    assert cf_units.stats(reset=True) != {}
+    assert cf_units.stats() == {}
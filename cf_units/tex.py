@@ -3,7 +3,8 @@
 # This file is part of cf-units and is released under the BSD license.
 # See LICENSE in the root of the repository for full licensing details.
 
-from ._udunits2_parser import graph
+from . import _stats
+from ._udunits2_parser import _map_unique, graph
 from ._udunits2_parser import parse as _parse
 
 
@@ -37,5 +38,43 @@ class TeXVisitor(graph.Visitor):
 
 
 def tex(unit_str):
+    if _stats.hooks.active:
+        with _stats.operation("tex"):
+            return _tex(unit_str)
+    return _tex(unit_str)
+
+
+def _tex(unit_str):
     tree = _parse(unit_str)
     return TeXVisitor().visit(tree)
+
+
+def tex_many(unit_strs, processes=None):
+    """Return the TeX representation of each of the given unit strings.
+
+    The batch equivalent of :func:`tex`: each distinct unit string is parsed
+    only once, and the results are returned as a list in the same order as
+    the input. If ``processes`` is greater than one, the distinct unit
+    strings are shared between a pool of that many worker processes.
+
+    """
+    if _stats.hooks.active:
+        unit_strs = list(unit_strs)
+        with _stats.operation("tex_many", unit_strs):
+            return _map_unique(_tex_unique, unit_strs, processes)
+    return _map_unique(_tex_unique, unit_strs, processes)
+
+
+def _tex_unique(unit_strs):
+    # Different spellings of the same unit commonly parse to the same
+    # graph, so cache the TeX by graph structure.
+    visitor = TeXVisitor()
+    by_graph = {}
+    result = []
+    for unit_str in unit_strs:
+        tree = _parse(unit_str)
+        tex_str = by_graph.get(tree)
+        if tex_str is None:
+            tex_str = by_graph[tree] = visitor.visit(tree)
+        result.append(tex_str)
+    return result
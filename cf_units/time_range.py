@@ -0,0 +1,247 @@
+# Copyright cf-units contributors
+#
+# This file is part of cf-units and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Lazy dates of evenly spaced time values."""
+
+import operator
+
+import numpy as np
+
+from . import Unit
+
+__all__ = ["TimeRange"]
+
+
+class TimeRange:
+    """The dates of evenly spaced time values, such as an hourly or daily
+    time coordinate, decoded on demand.
+
+    Only the first time value, the step between time values, the number of
+    time values and the time reference unit are held, whatever the length.
+    Dates are decoded by :meth:`cf_units.Unit.num2date` when indexed, and
+    slicing returns another TimeRange.
+
+    The time value at position ``i`` is ``start + step * (offset + stride *
+    i)``. Slicing keeps the start and step, and only changes the integer
+    offset and stride, so that the time values of a slice are exactly those
+    of the same slice of :meth:`values`.
+
+    Args:
+
+    * start (int/float):
+        The first time value.
+    * step (int/float):
+        The difference between consecutive time values.
+    * length (int):
+        The number of time values.
+    * unit (string/Unit):
+        The time reference unit of the time values.
+
+    Kwargs:
+
+    * calendar (string):
+        The calendar of the unit, if the unit is a string.
+    * only_use_cftime_datetimes (bool):
+        As for :meth:`cf_units.Unit.num2date`.
+    * only_use_python_datetimes (bool):
+        As for :meth:`cf_units.Unit.num2date`.
+    * offset (int):
+        The number of steps from the start to the first time value.
+        The default is 0.
+    * stride (int):
+        The number of steps between consecutive time values. The default
+        is 1.
+
+    For example:
+
+        >>> from cf_units.time_range import TimeRange
+        >>> hours = TimeRange(0, 1, 100 * 365 * 24, 'hours since 2000-01-01',
+        ...                   calendar='365_day')
+        >>> len(hours)
+        876000
+        >>> print(hours[-1])
+        2099-12-31 23:00:00
+        >>> days = hours[::24]
+        >>> len(days), days.offset, days.stride
+        (36500, 0, 24)
+        >>> [str(date) for date in days[1:3]]
+        ['2000-01-02 00:00:00', '2000-01-03 00:00:00']
+
+    """
+
+    def __init__(
+        self,
+        start,
+        step,
+        length,
+        unit,
+        calendar=None,
+        only_use_cftime_datetimes=True,
+        only_use_python_datetimes=False,
+        offset=0,
+        stride=1,
+    ):
+        if not isinstance(unit, Unit):
+            unit = Unit(unit, calendar=calendar)
+        if not unit.is_time_reference():
+            raise ValueError(f"Expected a time reference unit, got {unit!r}.")
+        length = operator.index(length)
+        if length < 0:
+            raise ValueError(f"The length must not be negative, got {length}.")
+        offset = operator.index(offset)
+        stride = operator.index(stride)
+        if stride == 0:
+            raise ValueError("The stride must not be zero.")
+        self.start = start
+        self.step = step
+        self.length = length
+        self.offset = offset
+        self.stride = stride
+        self.unit = unit
+        self.only_use_cftime_datetimes = only_use_cftime_datetimes
+        self.only_use_python_datetimes = only_use_python_datetimes
+
+    @classmethod
+    def from_values(cls, values, unit, calendar=None, **kwargs):
+        """Return a TimeRange of the time values, if they are evenly spaced.
+
+        The values are evenly spaced if they are reproduced exactly by
+        ``start + step * numpy.arange(length)``.
+
+        Args:
+
+        * values:
+            A one-dimensional array of time values.
+        * unit (string/Unit):
+            The time reference unit of the time values.
+
+        Kwargs:
+
+        * calendar (string):
+            The calendar of the unit, if the unit is a string.
+
+        Any other keyword arguments are passed to the TimeRange.
+
+        Returns
+        -------
+            TimeRange, or None if the values are not evenly spaced.
+
+        """
+        values = np.asarray(values)
+        if values.ndim != 1 or values.dtype.kind not in "iuf":
+            return None
+        length = len(values)
+        start = values[0].item() if length else 0
+        if length < 2:
+            step = 0
+        else:
+            step = values[1].item() - start
+            if not np.array_equal(_values(start, step, np.arange(length)), values):
+                # A step derived from the whole range may round better.
+                step = (values[-1].item() - start) / (length - 1)
+                if not np.array_equal(_values(start, step, np.arange(length)), values):
+                    return None
+        return cls(start, step, length, unit, calendar=calendar, **kwargs)
+
+    def __len__(self):
+        return self.length
+
+    def __repr__(self):
+        extra = ""
+        if self.offset:
+            extra += f", offset={self.offset!r}"
+        if self.stride != 1:
+            extra += f", stride={self.stride!r}"
+        return (
+            f"{type(self).__name__}({self.start!r}, {self.step!r}, "
+            f"{self.length!r}, {self.unit!r}{extra})"
+        )
+
+    def _num2date(self, values):
+        return self.unit.num2date(
+            values,
+            only_use_cftime_datetimes=self.only_use_cftime_datetimes,
+            only_use_python_datetimes=self.only_use_python_datetimes,
+        )
+
+    def _replace(self, length, offset, stride):
+        return type(self)(
+            self.start,
+            self.step,
+            length,
+            self.unit,
+            only_use_cftime_datetimes=self.only_use_cftime_datetimes,
+            only_use_python_datetimes=self.only_use_python_datetimes,
+            offset=offset,
+            stride=stride,
+        )
+
+    def _steps(self, positions):
+        # Return the numbers of steps from the start to the positions.
+        return self.offset + self.stride * positions
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            positions = range(self.length)[index]
+            return self._replace(
+                len(positions),
+                self._steps(positions.start),
+                self.stride * positions.step,
+            )
+        try:
+            position = operator.index(index)
+        except TypeError:
+            positions = np.asarray(index)
+            if positions.dtype.kind not in "iu":
+                raise TypeError(
+                    f"{type(self).__name__} indices must be integers, slices or "
+                    f"integer arrays, not {positions.dtype}."
+                ) from None
+            if positions.size and (
+                positions.min() < -self.length or positions.max() >= self.length
+            ):
+                raise IndexError(f"{type(self).__name__} index out of range")
+            positions = np.where(positions < 0, positions + self.length, positions)
+            return self._num2date(
+                _values(self.start, self.step, self._steps(positions))
+            )
+        position = range(self.length)[position]
+        return self._num2date(_values(self.start, self.step, self._steps(position)))
+
+    def __iter__(self):
+        # Decode the dates in chunks, so that iterating is neither one call
+        # of num2date per date, nor materialises all of the dates.
+        chunk = 1024
+        for position in range(0, self.length, chunk):
+            yield from self[position : position + chunk].dates()
+
+    def __array__(self, dtype=None, copy=None):
+        return np.asarray(self.dates(), dtype=dtype)
+
+    def values(self):
+        """Return the time values.
+
+        Returns
+        -------
+            numpy.ndarray of the time values.
+
+        """
+        return _values(self.start, self.step, self._steps(np.arange(self.length)))
+
+    def dates(self):
+        """Return all of the dates.
+
+        Returns
+        -------
+            numpy.ndarray of the dates.
+
+        """
+        return self._num2date(self.values())
+
+
+def _values(start, step, steps):
+    # Return the time values the numbers of steps from the start. Each is
+    # calculated from the start, rather than accumulated, so that rounding
+    # errors do not grow.
+    return start + step * steps
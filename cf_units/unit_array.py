@@ -0,0 +1,146 @@
+# Copyright cf-units contributors
+#
+# This file is part of cf-units and is released under the BSD license.
+# See LICENSE in the root of the repository for full licensing details.
+"""Per-element units of an array of values."""
+
+import numpy as np
+
+from . import FLOAT64, Unit
+
+__all__ = ["UnitArray"]
+
+
+class UnitArray:
+    """The unit of each element of an array of values, such as the rows of
+    tabular data which each carry their own unit.
+
+    The units are factorised into the distinct :attr:`units` and an integer
+    :attr:`codes` array, which indexes them. Each distinct unit is parsed
+    only once, and values are converted group by group, with one vectorised
+    conversion for each distinct unit.
+
+    Args:
+
+    * units:
+        An iterable of the unit, as a string or :class:`cf_units.Unit`,
+        of each element.
+
+    Kwargs:
+
+    * calendar (string):
+        The calendar of the time reference units.
+    * system (cf_units.UnitSystem):
+        The unit system of the units.
+
+    For example:
+
+        >>> import numpy as np
+        >>> from cf_units.unit_array import UnitArray
+        >>> units = UnitArray(['m', 'km', 'cm', 'km'])
+        >>> units.units
+        (Unit('m'), Unit('km'), Unit('cm'))
+        >>> units.codes
+        array([0, 1, 2, 1])
+        >>> units.convert(np.array([1.0, 2.0, 300.0, 4.0]), 'm')
+        array([1.e+00, 2.e+03, 3.e+00, 4.e+03])
+
+    """
+
+    def __init__(self, units, calendar=None, system=None):
+        index = {}
+        codes = [index.setdefault(unit, len(index)) for unit in units]
+        self.units = tuple(
+            unit
+            if isinstance(unit, Unit)
+            else Unit(unit, calendar=calendar, system=system)
+            for unit in index
+        )
+        self.codes = np.array(codes, dtype=np.intp)
+        self._groups = None
+
+    @classmethod
+    def from_codes(cls, units, codes):
+        """Create a UnitArray from distinct units and the codes indexing them.
+
+        Args:
+
+        * units:
+            A sequence of the distinct :class:`cf_units.Unit` instances.
+        * codes:
+            An integer array of the index into ``units`` of the unit of
+            each element.
+
+        """
+        result = cls.__new__(cls)
+        result.units = tuple(units)
+        result.codes = np.asarray(codes, dtype=np.intp)
+        if result.codes.size and (
+            result.codes.min() < 0 or result.codes.max() >= len(result.units)
+        ):
+            raise ValueError("The codes must index the units.")
+        result._groups = None
+        return result
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, index):
+        return self.units[self.codes[index]]
+
+    def __repr__(self):
+        return f"{type(self).__name__}({[str(unit) for unit in self]!r})"
+
+    def groups(self):
+        """Return the unit, and the indices of its elements, of each group.
+
+        Returns
+        -------
+            list of (:class:`cf_units.Unit`, numpy.ndarray) pairs, for
+            each of the distinct units that is used.
+
+        """
+        if self._groups is None:
+            # A stable sort of the codes gathers the elements of each unit.
+            order = np.argsort(self.codes, kind="stable")
+            counts = np.bincount(self.codes, minlength=len(self.units))
+            splits = np.split(order, np.cumsum(counts)[:-1])
+            self._groups = [
+                (unit, indices)
+                for unit, indices in zip(self.units, splits, strict=True)
+                if indices.size
+            ]
+        return self._groups
+
+    def convert(self, values, other, ctype=FLOAT64):
+        """Convert each of the values from its unit to the other unit.
+
+        Args:
+
+        * values (numpy.ndarray):
+            The values to convert, with one value for each element.
+        * other (string/Unit):
+            Target unit to convert to.
+        * ctype (cf_units.FLOAT32/cf_units.FLOAT64):
+            The floating point type of the conversion, if the values are
+            integers. The default is 64-bit double-precision conversion.
+
+        Returns
+        -------
+            numpy.ndarray of the converted values.
+
+        """
+        values = np.asanyarray(values)
+        if values.shape != self.codes.shape:
+            raise ValueError(
+                f"Expected {len(self)} values to convert, got an array of "
+                f"shape {values.shape}."
+            )
+        if not np.issubdtype(values.dtype, np.floating):
+            values = values.astype(ctype)
+        result = values.copy()
+        for unit, indices in self.groups():
+            result[indices] = unit.convert(
+                values[indices], other, ctype=ctype, inplace=True
+            )
+        return result
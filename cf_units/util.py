@@ -5,7 +5,9 @@
 """Miscellaneous utility functions."""
 
 import abc
+from collections import OrderedDict
 from collections.abc import Hashable
+import threading
 import warnings
 
 
@@ -33,6 +35,53 @@ def approx_equal(a, b, max_absolute_error=1e-10, max_relative_error=1e-10):
     return relative_error < max_relative_error
 
 
+class _LRUCache:
+    """A thread-safe mapping which holds at most a maximum number of items,
+    evicting the least recently used.
+
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.maxsize!r})"
+
+    def get(self, key, default=None):
+        """Return the value of the key, or the default if not present."""
+        with self._lock:
+            try:
+                self._items.move_to_end(key)
+            except KeyError:
+                return default
+            return self._items[key]
+
+    def __getitem__(self, key):
+        with self._lock:
+            self._items.move_to_end(key)
+            return self._items[key]
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        """Remove all of the items."""
+        with self._lock:
+            self._items.clear()
+
+
 class _MetaOrderedHashable(abc.ABCMeta):
     """A metaclass that ensures that non-abstract subclasses of _OrderedHashable
     without an explicit __init__ method are given a default __init__ method